@@ -0,0 +1,432 @@
+from __future__ import annotations
+
+from typing import Any, Callable
+
+import numpy as np
+import pandas as pd
+import polars as pl
+import pyarrow as pa  # type: ignore[import]
+
+import dataframe_api_compat.pandas_standard
+import dataframe_api_compat.polars_standard
+import dataframe_api_compat.pyarrow_standard
+
+# Run with `asv run`, which stores the results as JSON under `.asv/results`
+# (see asv.conf.json), and `asv continuous main HEAD` to compare two commits.
+# Every benchmark is parametrised over the library, the number of rows and the
+# number of columns, and over the method being timed.
+
+LIBRARIES = ["pandas-numpy", "pandas-nullable", "polars", "pyarrow"]
+ROWS = [1_000, 100_000, 10_000_000, 100_000_000]
+COLUMNS = [1, 10, 2_000]
+
+# Combinations with more cells than this are skipped, as they wouldn't fit in
+# memory (e.g. 1e8 rows and 2000 columns).
+MAX_CELLS = 100_000_000
+
+# Keys for the groupby benchmarks take this many distinct values.
+N_GROUPS = 100
+
+
+def make_dataframe(library: str, rows: int, columns: int) -> Any:
+    rng = np.random.default_rng(0)
+    data = {f"c{i}": rng.random(rows) for i in range(columns)}
+    data["key"] = rng.integers(0, N_GROUPS, rows)
+    return from_dict(library, data)
+
+
+def from_dict(library: str, data: dict[str, Any]) -> Any:
+    if library == "pandas-numpy":
+        return (
+            dataframe_api_compat.pandas_standard.convert_to_standard_compliant_dataframe(
+                pd.DataFrame(data)
+            )
+        )
+    if library == "pandas-nullable":
+        return (
+            dataframe_api_compat.pandas_standard.convert_to_standard_compliant_dataframe(
+                pd.DataFrame(data).convert_dtypes()
+            )
+        )
+    if library == "polars":
+        return (
+            dataframe_api_compat.polars_standard.convert_to_standard_compliant_dataframe(
+                pl.DataFrame(data)
+            )
+        )
+    if library == "pyarrow":
+        return (
+            dataframe_api_compat.pyarrow_standard.convert_to_standard_compliant_dataframe(
+                pa.table(data)
+            )
+        )
+    raise AssertionError(f"Got unexpected library: {library}")
+
+
+class _Benchmark:
+    params: tuple[list[Any], ...]
+    param_names = ["library", "rows", "columns", "method"]
+    methods: dict[str, Callable[[Any], Any]]
+
+    def setup(self, library: str, rows: int, columns: int, method: str) -> None:
+        if rows * columns > MAX_CELLS:
+            # asv skips benchmarks whose setup raises NotImplementedError.
+            raise NotImplementedError()
+        df = make_dataframe(library, rows, columns)
+        self.df = df.drop_column("key")
+        self.keyed = df
+        self.bools = self.df > 0.5
+        self.column = self.df.get_column_by_name("c0")
+        self.bool_column = self.column > 0.5
+        self.indices = self.column.sorted_indices()
+        if not hasattr(self._target(method), method):
+            raise NotImplementedError()
+
+    def _target(self, method: str) -> Any:
+        raise NotImplementedError()
+
+    def time_method(self, library: str, rows: int, columns: int, method: str) -> None:
+        self.methods[method](self)
+
+
+class TimeDataFrame(_Benchmark):
+    methods = {
+        "shape": lambda b: b.df.shape(),
+        "get_column_names": lambda b: b.df.get_column_names(),
+        "get_column_by_name": lambda b: b.df.get_column_by_name("c0"),
+        "get_columns_by_name": lambda b: b.df.get_columns_by_name(["c0"]),
+        "get_rows": lambda b: b.df.get_rows(b.indices),
+        "slice_rows": lambda b: b.df.slice_rows(1, None, 2),
+        "get_rows_by_mask": lambda b: b.df.get_rows_by_mask(b.bool_column),
+        "insert": lambda b: b.df.insert(0, "new", b.column),
+        "drop_column": lambda b: b.df.drop_column("c0"),
+        "rename_columns": lambda b: b.df.rename_columns({"c0": "new"}),
+        "groupby": lambda b: b.keyed.groupby(["key"]),
+        "sorted_indices": lambda b: b.df.sorted_indices(["c0"]),
+        "top_k_indices": lambda b: b.df.top_k_indices(["c0"], 100),
+        "bottom_k_indices": lambda b: b.df.bottom_k_indices(["c0"], 100),
+        "__eq__": lambda b: b.df == 0.5,
+        "__ne__": lambda b: b.df != 0.5,
+        "__ge__": lambda b: b.df >= 0.5,
+        "__gt__": lambda b: b.df > 0.5,
+        "__le__": lambda b: b.df <= 0.5,
+        "__lt__": lambda b: b.df < 0.5,
+        "__add__": lambda b: b.df + b.df,
+        "__sub__": lambda b: b.df - 1,
+        "__mul__": lambda b: b.df * 2,
+        "__truediv__": lambda b: b.df / 2,
+        "__floordiv__": lambda b: b.df // 2,
+        "__pow__": lambda b: b.df**2,
+        "__mod__": lambda b: b.df % 2,
+        "__divmod__": lambda b: divmod(b.df, 2),
+        "__invert__": lambda b: ~b.bools,
+        "is_null": lambda b: b.df.is_null(),
+        "is_nan": lambda b: b.df.is_nan(),
+        "fill_nan": lambda b: b.df.fill_nan(0.0),
+        "any": lambda b: b.bools.any(),
+        "all": lambda b: b.bools.all(),
+        "any_rowwise": lambda b: b.bools.any_rowwise(),
+        "all_rowwise": lambda b: b.bools.all_rowwise(),
+        "min": lambda b: b.df.min(),
+        "max": lambda b: b.df.max(),
+        "sum": lambda b: b.df.sum(),
+        "prod": lambda b: b.df.prod(),
+        "mean": lambda b: b.df.mean(),
+        "median": lambda b: b.df.median(),
+        "std": lambda b: b.df.std(),
+        "var": lambda b: b.df.var(),
+        "describe": lambda b: b.df.describe(),
+        "to_backend": lambda b: b.df.to_backend("polars"),
+    }
+    params = (LIBRARIES, ROWS, COLUMNS, list(methods))
+
+    def _target(self, method: str) -> Any:
+        return self.df
+
+
+class TimeColumn(_Benchmark):
+    methods = {
+        "__len__": lambda b: len(b.column),
+        "dtype": lambda b: b.column.dtype,
+        "get_rows": lambda b: b.column.get_rows(b.indices),
+        "get_value": lambda b: b.column.get_value(0),
+        "is_null": lambda b: b.column.is_null(),
+        "is_nan": lambda b: b.column.is_nan(),
+        "is_in": lambda b: b.column.is_in(b.column),
+        "unique_indices": lambda b: b.column.unique_indices(),
+        "sorted_indices": lambda b: b.column.sorted_indices(),
+        "top_k_indices": lambda b: b.column.top_k_indices(100),
+        "bottom_k_indices": lambda b: b.column.bottom_k_indices(100),
+        "fill_nan": lambda b: b.column.fill_nan(0.0),
+        "__eq__": lambda b: b.column == 0.5,
+        "__ne__": lambda b: b.column != 0.5,
+        "__ge__": lambda b: b.column >= 0.5,
+        "__gt__": lambda b: b.column > 0.5,
+        "__le__": lambda b: b.column <= 0.5,
+        "__lt__": lambda b: b.column < 0.5,
+        "__add__": lambda b: b.column + b.column,
+        "__sub__": lambda b: b.column - 1,
+        "__mul__": lambda b: b.column * 2,
+        "__truediv__": lambda b: b.column / 2,
+        "__floordiv__": lambda b: b.column // 2,
+        "__pow__": lambda b: b.column**2,
+        "__mod__": lambda b: b.column % 2,
+        "__divmod__": lambda b: divmod(b.column, 2),
+        "__and__": lambda b: b.bool_column & b.bool_column,
+        "__or__": lambda b: b.bool_column | b.bool_column,
+        "__invert__": lambda b: ~b.bool_column,
+        "any": lambda b: b.bool_column.any(),
+        "all": lambda b: b.bool_column.all(),
+        "min": lambda b: b.column.min(),
+        "max": lambda b: b.column.max(),
+        "sum": lambda b: b.column.sum(),
+        "prod": lambda b: b.column.prod(),
+        "mean": lambda b: b.column.mean(),
+        "median": lambda b: b.column.median(),
+        "std": lambda b: b.column.std(),
+        "var": lambda b: b.column.var(),
+    }
+    # The number of columns doesn't matter here.
+    params = (LIBRARIES, ROWS, [1], list(methods))
+
+    def _target(self, method: str) -> Any:
+        return self.column
+
+
+class TimeGroupBy(_Benchmark):
+    methods = {
+        "size": lambda b: b.groupby.size(),
+        "any": lambda b: b.bool_groupby.any(),
+        "all": lambda b: b.bool_groupby.all(),
+        "min": lambda b: b.groupby.min(),
+        "max": lambda b: b.groupby.max(),
+        "sum": lambda b: b.groupby.sum(),
+        "prod": lambda b: b.groupby.prod(),
+        "mean": lambda b: b.groupby.mean(),
+        "median": lambda b: b.groupby.median(),
+        "std": lambda b: b.groupby.std(),
+        "var": lambda b: b.groupby.var(),
+        "aggregate": lambda b: b.groupby.aggregate(
+            {"sum": ("c0", "sum"), "mean": ("c0", "mean"), "size": ("c0", "size")}
+        ),
+    }
+    params = (LIBRARIES, ROWS, COLUMNS, list(methods))
+
+    def setup(self, library: str, rows: int, columns: int, method: str) -> None:
+        super().setup(library, rows, columns, method)
+        self.groupby = self.keyed.groupby(["key"])
+        self.bool_groupby = self.bools.insert(
+            0, "key", self.keyed.get_column_by_name("key")
+        ).groupby(["key"])
+
+    def _target(self, method: str) -> Any:
+        return self.keyed.groupby(["key"])
+
+
+class TimeSliceRows:
+    # Paging through a large frame. A contiguous page should take the same time
+    # wherever it starts and however many rows there are, and a strided one
+    # should only touch the rows it keeps.
+    params = (LIBRARIES, ROWS, ["start", "middle", "end"])
+    param_names = ["library", "rows", "offset"]
+    PAGE = 100
+
+    def setup(self, library: str, rows: int, offset: str) -> None:
+        self.df = make_dataframe(library, rows, 1)
+        self.start = {"start": 0, "middle": rows // 2, "end": rows - self.PAGE}[offset]
+
+    def time_contiguous(self, library: str, rows: int, offset: str) -> None:
+        self.df.slice_rows(self.start, self.start + self.PAGE, None)
+
+    def time_strided(self, library: str, rows: int, offset: str) -> None:
+        self.df.slice_rows(self.start, self.start + self.PAGE, 7)
+
+    def time_reversed(self, library: str, rows: int, offset: str) -> None:
+        self.df.slice_rows(self.start + self.PAGE - 1, self.start or None, -1)
+
+
+class TimeWideMissing:
+    # Feature tables with many columns, where is_null / is_nan should be a single
+    # operation over all columns rather than one per column.
+    params = (LIBRARIES, [1_000, 10_000, 50_000])
+    param_names = ["library", "rows"]
+    COLUMNS = 1_500
+
+    def setup(self, library: str, rows: int) -> None:
+        self.df = make_dataframe(library, rows, self.COLUMNS).drop_column("key")
+
+    def time_is_null(self, library: str, rows: int) -> None:
+        self.df.is_null()
+
+    def time_is_nan(self, library: str, rows: int) -> None:
+        self.df.is_nan()
+
+
+class TimeIsInAllowList:
+    # Probing columns against the same allow-list of 1M values. The first call
+    # builds the allow-list's lookup table, later calls reuse it.
+    params = (LIBRARIES, [1_000, 10_000, 1_000_000])
+    param_names = ["library", "probes"]
+    VALUES = 1_000_000
+
+    def setup(self, library: str, probes: int) -> None:
+        rng = np.random.default_rng(0)
+        self.values = from_dict(
+            library, {"values": rng.integers(0, 2 * self.VALUES, self.VALUES)}
+        )
+        probe = from_dict(library, {"probe": rng.integers(0, 2 * self.VALUES, probes)})
+        self.probe = probe.get_column_by_name("probe")
+        self.allow_list = self.values.get_column_by_name("values")
+        self.probe.is_in(self.allow_list)
+
+    def time_first_call(self, library: str, probes: int) -> None:
+        # A new column each time, so nothing is cached yet.
+        self.probe.is_in(self.values.get_column_by_name("values"))
+
+    def time_repeated_call(self, library: str, probes: int) -> None:
+        self.probe.is_in(self.allow_list)
+
+
+class TimeTinyDataFrame:
+    # The fixed per-call overhead of the wrappers, which dominates for frames of a
+    # few rows. Compare `time_convert` with `time_native_get_column` and
+    # `time_get_column_by_name` to see how much the wrapper adds.
+    params = LIBRARIES
+    param_names = ["library"]
+
+    def setup(self, library: str) -> None:
+        self.df = make_dataframe(library, 3, 2)
+        self.native = self.df.dataframe
+        self.namespace = self.df.__dataframe_namespace__()
+
+    def time_convert(self, library: str) -> None:
+        self.namespace.convert_to_standard_compliant_dataframe(self.native)
+
+    def time_get_column_by_name(self, library: str) -> None:
+        self.df.get_column_by_name("c0")
+
+    def time_native_get_column(self, library: str) -> None:
+        self.native["c0"]
+
+
+class TimeSortedKey:
+    # Data which arrives sorted by its key (e.g. a time series), where sorting,
+    # deduplicating and grouping by the key can skip sorting and hashing.
+    params = (["pandas-numpy", "pandas-nullable", "polars"], ROWS)
+    param_names = ["library", "rows"]
+
+    def setup(self, library: str, rows: int) -> None:
+        df = make_dataframe(library, rows, 1)
+        key = df.get_column_by_name("key")
+        self.df = df.get_rows(key.sorted_indices())
+        self.key = self.df.get_column_by_name("key")
+
+    def time_sorted_indices(self, library: str, rows: int) -> None:
+        self.df.sorted_indices(["key"])
+
+    def time_unique_indices(self, library: str, rows: int) -> None:
+        self.key.unique_indices()
+
+    def time_groupby_sum(self, library: str, rows: int) -> None:
+        self.df.groupby(["key"]).sum()
+
+
+class TimeMultiKeySort:
+    # Sorting by several keys at once, in mixed directions, e.g. to order a report
+    # by region, then by date (latest first), etc.
+    params = (LIBRARIES, [1_000_000, 10_000_000, 50_000_000])
+    param_names = ["library", "rows"]
+
+    def setup(self, library: str, rows: int) -> None:
+        df = make_dataframe(library, rows, 3)
+        self.df = df.rename_columns({"c0": "k0", "c1": "k1", "c2": "k2"})
+        self.keys = ["key", "k0", "k1", "k2"]
+
+    def time_ascending(self, library: str, rows: int) -> None:
+        self.df.sorted_indices(self.keys)
+
+    def time_mixed(self, library: str, rows: int) -> None:
+        self.df.sorted_indices(self.keys, ascending=[True, False, True, False])
+
+    def time_mixed_nulls_first(self, library: str, rows: int) -> None:
+        self.df.sorted_indices(
+            self.keys, ascending=[True, False, True, False], nulls_position="first"
+        )
+
+
+class TimeJoin:
+    # Enriching a fact table with a dimension table of N_KEYS rows. With skewed
+    # keys, a few keys (Zipf-distributed) account for most rows of the fact table,
+    # which can unbalance hash partitions.
+    params = (
+        ["pandas-numpy", "pandas-nullable", "polars"],
+        ROWS[:3],
+        ["uniform", "skewed"],
+        ["inner", "left", "outer"],
+    )
+    param_names = ["library", "rows", "keys", "how"]
+    N_KEYS = 100_000
+
+    def setup(self, library: str, rows: int, keys: str, how: str) -> None:
+        rng = np.random.default_rng(0)
+        if keys == "uniform":
+            fact_keys = rng.integers(0, self.N_KEYS, rows)
+        else:
+            fact_keys = np.minimum(rng.zipf(1.2, rows), self.N_KEYS) - 1
+        self.facts = from_dict(library, {"key": fact_keys, "value": rng.random(rows)})
+        self.dimension = from_dict(
+            library,
+            {"id": np.arange(self.N_KEYS), "attribute": rng.random(self.N_KEYS)},
+        )
+
+    def time_join(self, library: str, rows: int, keys: str, how: str) -> None:
+        self.facts.join(self.dimension, ["key"], ["id"], how=how)
+
+
+class TimeJoinAsof:
+    # Enriching ticks with the latest reference record (one per 100 ticks), for
+    # each of N_GROUPS symbols. With "flagged", both sides come from `set_sorted`,
+    # so sortedness isn't checked; otherwise it's checked once per DataFrame. That
+    # result is cached on the DataFrame, so each call gets new DataFrames from
+    # `setup` (which asv runs before every sample) for the check to be timed.
+    params = (
+        ["pandas-numpy", "pandas-nullable", "polars"],
+        ROWS[:3],
+        ["flagged", "unflagged"],
+    )
+    param_names = ["library", "rows", "sortedness"]
+    number = 1
+
+    def setup(self, library: str, rows: int, sortedness: str) -> None:
+        rng = np.random.default_rng(0)
+        n_records = max(rows // 100, 1)
+        self.ticks = from_dict(
+            library,
+            {
+                "time": np.sort(rng.integers(0, rows * 10, rows)),
+                "symbol": rng.integers(0, N_GROUPS, rows),
+                "price": rng.random(rows),
+            },
+        )
+        self.records = from_dict(
+            library,
+            {
+                "time": np.sort(rng.integers(0, rows * 10, n_records)),
+                "symbol": rng.integers(0, N_GROUPS, n_records),
+                "rate": rng.random(n_records),
+            },
+        )
+        # For joining regardless of the symbol.
+        self.market_records = self.records.drop_column("symbol")
+        if sortedness == "flagged":
+            self.ticks = self.ticks.set_sorted(["time"])
+            self.records = self.records.set_sorted(["time"])
+            self.market_records = self.market_records.set_sorted(["time"])
+
+    def time_join_asof(self, library: str, rows: int, sortedness: str) -> None:
+        self.ticks.join_asof(self.market_records, "time", "time")
+
+    def time_join_asof_by(self, library: str, rows: int, sortedness: str) -> None:
+        self.ticks.join_asof(
+            self.records, "time", "time", left_by=["symbol"], right_by=["symbol"]
+        )
@@ -0,0 +1,75 @@
+from __future__ import annotations
+from dataframe_api_compat.duckdb_standard.duckdb_standard import (
+    DuckDBDataFrame,
+    DuckDBColumn,
+    _quote,
+)
+
+import functools
+import duckdb  # type: ignore[import]
+from typing import Any, Iterable
+
+
+class Int64:
+    ...
+
+
+class Int32:
+    ...
+
+
+class Float64:
+    ...
+
+
+class Float32:
+    ...
+
+
+class Bool:
+    ...
+
+
+DTYPE_MAP = {
+    "BIGINT": Int64(),
+    "INTEGER": Int32(),
+    "DOUBLE": Float64(),
+    "FLOAT": Float32(),
+    "BOOLEAN": Bool(),
+}
+
+
+def concat(dataframes: Iterable[DuckDBDataFrame]) -> DuckDBDataFrame:
+    relations = [_df.dataframe for _df in dataframes]
+    if not relations:
+        raise ValueError("Expected at least one DataFrame to concatenate")
+    schema = (relations[0].columns, [str(dtype) for dtype in relations[0].types])
+    for relation in relations[1:]:
+        if (relation.columns, [str(dtype) for dtype in relation.types]) != schema:
+            raise ValueError("Expected matching columns")
+    return DuckDBDataFrame(
+        functools.reduce(lambda left, right: left.union(right), relations)
+    )
+
+
+def dataframe_from_dict(data: dict[str, DuckDBColumn[Any]]) -> DuckDBDataFrame:
+    # Columns are expressions over a relation, so they can only be combined if
+    # they come from the same one.
+    relations = {id(column._relation): column._relation for column in data.values()}
+    if len(relations) != 1:
+        raise ValueError("Expected columns derived from the same DataFrame")
+    (relation,) = relations.values()
+    return DuckDBDataFrame(
+        relation.project(
+            ", ".join(
+                f"{column._expression} AS {_quote(label)}"
+                for label, column in data.items()
+            )
+        )
+    )
+
+
+def convert_to_standard_compliant_dataframe(
+    df: duckdb.DuckDBPyRelation,
+) -> DuckDBDataFrame:
+    return DuckDBDataFrame(df)
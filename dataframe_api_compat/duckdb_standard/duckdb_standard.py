@@ -0,0 +1,741 @@
+from __future__ import annotations
+import dataframe_api_compat.duckdb_standard
+import dataframe_api_compat.profiling
+import collections
+
+from typing import (
+    Any,
+    Sequence,
+    Mapping,
+    NoReturn,
+    TYPE_CHECKING,
+    Generic,
+    TypeVar,
+    Literal,
+)
+import duckdb  # type: ignore[import]
+
+DType = TypeVar("DType")
+
+if TYPE_CHECKING:
+    from dataframe_api import (
+        DataFrame,
+        Bool,
+        Column,
+        GroupBy,
+        null,
+    )
+else:
+
+    class DataFrame(Generic[DType]):
+        __slots__ = ()
+
+    class Column(Generic[DType]):
+        __slots__ = ()
+
+    class GroupBy:
+        __slots__ = ()
+
+
+# Every method here only builds up a DuckDB relation (i.e. a SQL query), which
+# DuckDB executes lazily, streaming through the data and spilling to disk if it
+# doesn't fit in memory. Only methods returning Python scalars (reductions on
+# columns, `shape`, `get_value`, ...) execute anything.
+# DuckDB preserves insertion order for queries without ORDER BY, which is what
+# gives rows their positions.
+
+
+def _quote(name: str) -> str:
+    return '"' + name.replace('"', '""') + '"'
+
+
+def _literal(value: Any) -> str:
+    if value is None:
+        return "NULL"
+    if isinstance(value, bool):
+        return "TRUE" if value else "FALSE"
+    if isinstance(value, int):
+        return repr(value)
+    if isinstance(value, float):
+        # Otherwise, DuckDB parses it as a DECIMAL.
+        return f"'{value!r}'::DOUBLE"
+    raise TypeError(f"Expected bool, int, float, or None, got: {type(value)}")
+
+
+_INTEGER_TYPES = ("BIGINT", "INTEGER")
+_FLOAT_TYPES = ("DOUBLE", "FLOAT")
+
+# The standard (like Python) rounds integer division towards negative
+# infinity, and the remainder takes the sign of the divisor, whereas SQL
+# truncates towards zero.
+_BINARY_OPS = {
+    "__eq__": "({left} = {right})",
+    "__ne__": "({left} <> {right})",
+    "__ge__": "({left} >= {right})",
+    "__gt__": "({left} > {right})",
+    "__le__": "({left} <= {right})",
+    "__lt__": "({left} < {right})",
+    "__and__": "({left} AND {right})",
+    "__or__": "({left} OR {right})",
+    "__add__": "({left} + {right})",
+    "__sub__": "({left} - {right})",
+    "__mul__": "({left} * {right})",
+    "__truediv__": "({left} / {right})",
+    "__pow__": "pow({left}, {right})",
+    "__mod__": "((({left} % {right}) + {right}) % {right})",
+}
+
+
+def _binary_op(left: str, right: str, op: str, integer: bool) -> str:
+    if op == "__floordiv__":
+        if integer:
+            remainder = _BINARY_OPS["__mod__"].format(left=left, right=right)
+            return f"(({left} - {remainder}) // {right})"
+        return f"floor({left} / {right})"
+    return _BINARY_OPS[op].format(left=left, right=right)
+
+
+# standard reduction -> DuckDB aggregate function
+_REDUCTIONS = {
+    "any": "bool_or",
+    "all": "bool_and",
+    "min": "min",
+    "max": "max",
+    "sum": "sum",
+    "prod": "product",
+    "median": "median",
+    "mean": "avg",
+    "std": "stddev_samp",
+    "var": "var_samp",
+}
+
+
+def _reduction(expression: str, reduction: str, dtype: str) -> str:
+    result = f"{_REDUCTIONS[reduction]}({expression})"
+    if reduction in ("sum", "prod") and dtype in _INTEGER_TYPES:
+        # DuckDB returns HUGEINT / DOUBLE for these, keep the input's type.
+        return f"CAST({result} AS {dtype})"
+    return result
+
+
+def _take(relation: duckdb.DuckDBPyRelation, indices: Column[Any]) -> Any:
+    # Rows are joined on their positions, then put in the order of `indices`.
+    columns = ", ".join(_quote(col) for col in relation.columns)
+    positions = indices._relation.project(f"{indices._expression} AS __index").project(
+        "__index, row_number() OVER () AS __position"
+    )
+    rows = relation.project(f"{columns}, row_number() OVER () - 1 AS __index")
+    return (
+        positions.set_alias("__positions")
+        .join(rows.set_alias("__rows"), "__positions.__index = __rows.__index")
+        .order("__positions.__position")
+        .project(", ".join(f"__rows.{_quote(col)}" for col in relation.columns))
+    )
+
+
+def _sorted_indices(
+    relation: duckdb.DuckDBPyRelation,
+    keys: Sequence[str],
+    ascending: Sequence[bool] | bool,
+    nulls_position: str,
+) -> Any:
+    if nulls_position not in ("first", "last"):
+        raise ValueError(f"Expected 'first' or 'last', got: {nulls_position}")
+    if isinstance(ascending, bool):
+        ascending = [ascending] * len(keys)
+    elif len(ascending) != len(keys):
+        raise ValueError(
+            f"Expected {len(keys)} values for `ascending`, got {len(ascending)}"
+        )
+    nulls = f"NULLS {nulls_position.upper()}"
+    order = [
+        f"{key} {'ASC' if key_ascending else 'DESC'} {nulls}"
+        for key, key_ascending in zip(keys, ascending)
+    ]
+    # Ordering by the row number last makes the sort stable.
+    return (
+        relation.project(
+            ", ".join([*keys, "row_number() OVER () - 1 AS __index"]),
+        )
+        .order(", ".join([*order, "__index"]))
+        .project("__index")
+    )
+
+
+class DuckDBColumn(Column[DType]):
+    __slots__ = ("_relation", "_expression")
+
+    def __init__(self, relation: duckdb.DuckDBPyRelation, expression: str) -> None:
+        # A column is an expression over `relation`.
+        self._relation = relation
+        self._expression = expression
+
+    def _dtype(self) -> str:
+        return str(self._relation.project(self._expression).types[0])
+
+    def _from_binary_op(self, other: Column[Any] | Any, op: str) -> DuckDBColumn[Any]:
+        if isinstance(other, DuckDBColumn):
+            if other._relation is not self._relation:
+                raise ValueError("Expected Column derived from the same DataFrame")
+            right = other._expression
+            integer = other._dtype() in _INTEGER_TYPES
+        else:
+            right = _literal(other)
+            integer = isinstance(other, int)
+        integer = integer and self._dtype() in _INTEGER_TYPES
+        return DuckDBColumn(
+            self._relation, _binary_op(self._expression, right, op, integer)
+        )
+
+    def _reduce(self, reduction: str) -> Any:
+        expression = _reduction(self._expression, reduction, self._dtype())
+        return self._relation.aggregate(expression).fetchone()[0]
+
+    # In the standard
+    def __column_namespace__(self, *, api_version: str | None = None) -> Any:
+        return dataframe_api_compat.duckdb_standard
+
+    @property
+    def column(self) -> duckdb.DuckDBPyRelation:
+        return self._relation.project(self._expression)
+
+    def __len__(self) -> int:
+        return int(self._relation.aggregate("count(*)").fetchone()[0])
+
+    @property
+    def dtype(self) -> Any:
+        return dataframe_api_compat.duckdb_standard.DTYPE_MAP[self._dtype()]
+
+    def get_rows(self, indices: Column[Any]) -> DuckDBColumn[DType]:
+        relation = self._relation.project(f"{self._expression} AS __value")
+        return DuckDBColumn(_take(relation, indices), "__value")
+
+    def get_value(self, row: int) -> Any:
+        return self.column.limit(1, row).fetchone()[0]
+
+    def __iter__(self) -> NoReturn:
+        raise NotImplementedError()
+
+    def is_null(self) -> DuckDBColumn[Bool]:
+        return DuckDBColumn(self._relation, f"({self._expression} IS NULL)")
+
+    def is_nan(self) -> DuckDBColumn[Bool]:
+        return DuckDBColumn(self._relation, f"isnan({self._expression})")
+
+    def any(self, *, skip_nulls: bool = True) -> bool:
+        return self._reduce("any")  # type: ignore[no-any-return]
+
+    def all(self, *, skip_nulls: bool = True) -> bool:
+        return self._reduce("all")  # type: ignore[no-any-return]
+
+    def min(self, *, skip_nulls: bool = True) -> Any:
+        return self._reduce("min")
+
+    def max(self, *, skip_nulls: bool = True) -> Any:
+        return self._reduce("max")
+
+    def sum(self, *, skip_nulls: bool = True) -> Any:
+        return self._reduce("sum")
+
+    def prod(self, *, skip_nulls: bool = True) -> Any:
+        return self._reduce("prod")
+
+    def mean(self, *, skip_nulls: bool = True) -> Any:
+        return self._reduce("mean")
+
+    def median(self, *, skip_nulls: bool = True) -> Any:
+        return self._reduce("median")
+
+    def std(self, *, skip_nulls: bool = True) -> Any:
+        return self._reduce("std")
+
+    def var(self, *, skip_nulls: bool = True) -> Any:
+        return self._reduce("var")
+
+    def __eq__(  # type: ignore[override]
+        self, other: Column[DType] | Any
+    ) -> DuckDBColumn[Bool]:
+        return self._from_binary_op(other, "__eq__")
+
+    def __ne__(  # type: ignore[override]
+        self, other: Column[DType] | Any
+    ) -> DuckDBColumn[Bool]:
+        return self._from_binary_op(other, "__ne__")
+
+    def __ge__(self, other: Column[DType] | Any) -> DuckDBColumn[Bool]:
+        return self._from_binary_op(other, "__ge__")
+
+    def __gt__(self, other: Column[DType] | Any) -> DuckDBColumn[Bool]:
+        return self._from_binary_op(other, "__gt__")
+
+    def __le__(self, other: Column[DType] | Any) -> DuckDBColumn[Bool]:
+        return self._from_binary_op(other, "__le__")
+
+    def __lt__(self, other: Column[DType] | Any) -> DuckDBColumn[Bool]:
+        return self._from_binary_op(other, "__lt__")
+
+    def __mul__(self, other: Column[DType] | Any) -> DuckDBColumn[Any]:
+        return self._from_binary_op(other, "__mul__")
+
+    def __floordiv__(self, other: Column[DType] | Any) -> DuckDBColumn[Any]:
+        return self._from_binary_op(other, "__floordiv__")
+
+    def __truediv__(self, other: Column[DType] | Any) -> DuckDBColumn[Any]:
+        return self._from_binary_op(other, "__truediv__")
+
+    def __pow__(self, other: Column[DType] | Any) -> DuckDBColumn[Any]:
+        return self._from_binary_op(other, "__pow__")
+
+    def __mod__(self, other: Column[DType] | Any) -> DuckDBColumn[Any]:
+        return self._from_binary_op(other, "__mod__")
+
+    def __divmod__(
+        self,
+        other: Column[DType] | Any,
+    ) -> tuple[DuckDBColumn[Any], DuckDBColumn[Any]]:
+        quotient = self // other
+        remainder = self - quotient * other
+        return quotient, remainder
+
+    def __and__(self, other: Column[Bool] | bool) -> DuckDBColumn[Bool]:
+        return self._from_binary_op(other, "__and__")
+
+    def __or__(self, other: Column[Bool] | bool) -> DuckDBColumn[Bool]:
+        return self._from_binary_op(other, "__or__")
+
+    def __invert__(self) -> DuckDBColumn[Bool]:
+        return DuckDBColumn(self._relation, f"(NOT {self._expression})")
+
+    def __add__(self, other: Column[Any] | Any) -> DuckDBColumn[Any]:
+        return self._from_binary_op(other, "__add__")
+
+    def __sub__(self, other: Column[Any] | Any) -> DuckDBColumn[Any]:
+        return self._from_binary_op(other, "__sub__")
+
+    def sorted_indices(
+        self, *, ascending: bool = True, nulls_position: Literal["first", "last"] = "last"
+    ) -> DuckDBColumn[Any]:
+        relation = self._relation.project(f"{self._expression} AS __value")
+        return DuckDBColumn(
+            _sorted_indices(relation, ["__value"], ascending, nulls_position), "__index"
+        )
+
+    def fill_nan(self, value: float | null) -> DuckDBColumn[DType]:
+        return DuckDBColumn(
+            self._relation,
+            f"CASE WHEN isnan({self._expression}) THEN {_literal(value)} "
+            f"ELSE {self._expression} END",
+        )
+
+
+# standard reduction -> DuckDB aggregate function, for `GroupBy.aggregate`
+_GROUPBY_AGGREGATIONS = (*_REDUCTIONS, "size")
+
+
+class DuckDBGroupBy(GroupBy):
+    __slots__ = ("df", "keys")
+
+    def __init__(self, df: duckdb.DuckDBPyRelation, keys: Sequence[str]) -> None:
+        self.df = df
+        self.keys = list(keys)
+
+    def _validate_booleanness(self) -> None:
+        for column, dtype in zip(self.df.columns, self.df.types):
+            if column not in self.keys and str(dtype) != "BOOLEAN":
+                raise NotImplementedError(
+                    "'function' can only be called on DataFrame "
+                    "where all dtypes are 'bool'"
+                )
+
+    def _aggregate(self, expressions: list[str]) -> DuckDBDataFrame:
+        keys = [_quote(key) for key in self.keys]
+        return DuckDBDataFrame(
+            self.df.aggregate(", ".join([*keys, *expressions]), ", ".join(keys))
+        )
+
+    def _reduce(self, reduction: str) -> DuckDBDataFrame:
+        return self._aggregate(
+            [
+                f"{_reduction(_quote(column), reduction, str(dtype))} AS {_quote(column)}"
+                for column, dtype in zip(self.df.columns, self.df.types)
+                if column not in self.keys
+            ]
+        )
+
+    def size(self) -> DuckDBDataFrame:
+        return self._aggregate(["count(*) AS size"])
+
+    def any(self, *, skip_nulls: bool = True) -> DuckDBDataFrame:
+        self._validate_booleanness()
+        return self._reduce("any")
+
+    def all(self, *, skip_nulls: bool = True) -> DuckDBDataFrame:
+        self._validate_booleanness()
+        return self._reduce("all")
+
+    def min(self, *, skip_nulls: bool = True) -> DuckDBDataFrame:
+        return self._reduce("min")
+
+    def max(self, *, skip_nulls: bool = True) -> DuckDBDataFrame:
+        return self._reduce("max")
+
+    def sum(self, *, skip_nulls: bool = True) -> DuckDBDataFrame:
+        return self._reduce("sum")
+
+    def prod(self, *, skip_nulls: bool = True) -> DuckDBDataFrame:
+        return self._reduce("prod")
+
+    def median(self, *, skip_nulls: bool = True) -> DuckDBDataFrame:
+        return self._reduce("median")
+
+    def mean(self, *, skip_nulls: bool = True) -> DuckDBDataFrame:
+        return self._reduce("mean")
+
+    def std(self, *, skip_nulls: bool = True) -> DuckDBDataFrame:
+        return self._reduce("std")
+
+    def var(self, *, skip_nulls: bool = True) -> DuckDBDataFrame:
+        return self._reduce("var")
+
+    def aggregate(self, aggregations: Mapping[str, tuple[str, str]]) -> DuckDBDataFrame:
+        # Not part of the standard (yet). Computes several reductions in a
+        # single groupby, e.g. `{"b_sum": ("b", "sum"), "b_size": ("b", "size")}`.
+        if not isinstance(aggregations, collections.abc.Mapping):
+            raise TypeError(f"Expected Mapping, got: {type(aggregations)}")
+        dtypes = {
+            column: str(dtype) for column, dtype in zip(self.df.columns, self.df.types)
+        }
+        expressions = []
+        for name, (column, reduction) in aggregations.items():
+            if column not in dtypes:
+                raise KeyError(f"column {column} not present in DataFrame's columns")
+            if reduction not in _GROUPBY_AGGREGATIONS:
+                raise ValueError(f"Unsupported reduction: {reduction}")
+            if reduction == "size":
+                expressions.append(f"count(*) AS {_quote(name)}")
+            else:
+                expression = _reduction(_quote(column), reduction, dtypes[column])
+                expressions.append(f"{expression} AS {_quote(name)}")
+        return self._aggregate(expressions)
+
+
+class DuckDBDataFrame(DataFrame):
+    __slots__ = ("df",)
+
+    def __init__(self, df: duckdb.DuckDBPyRelation) -> None:
+        # Rows have no explicit order column. Positional operations (`get_rows`,
+        # `slice_rows`, `sorted_indices`, binary operations between DataFrames,
+        # `concat`) number rows with `row_number() OVER ()` and rely on `union`
+        # keeping its inputs in order. SQL doesn't guarantee either, but DuckDB
+        # keeps rows in insertion order, also with several threads, as long as
+        # its `preserve_insertion_order` setting is on (the default).
+        self._validate_columns(df.columns)
+        self.df = df
+
+    def _validate_columns(self, columns: Sequence[str]) -> None:
+        counter = collections.Counter(columns)
+        for col, count in counter.items():
+            if count > 1:
+                raise ValueError(
+                    f"Expected unique column names, got {col} {count} time(s)"
+                )
+
+    def _select(self, expressions: Mapping[str, str]) -> DuckDBDataFrame:
+        return DuckDBDataFrame(
+            self.df.project(
+                ", ".join(f"{expr} AS {_quote(col)}" for col, expr in expressions.items())
+            )
+        )
+
+    def _binary_op(self, other: DataFrame | Any, op: str) -> DuckDBDataFrame:
+        columns = self.get_column_names()
+        dtypes = [str(dtype) for dtype in self.df.types]
+        if not isinstance(other, DuckDBDataFrame):
+            return self._select(
+                {
+                    col: _binary_op(
+                        _quote(col),
+                        _literal(other),
+                        op,
+                        dtype in _INTEGER_TYPES and isinstance(other, int),
+                    )
+                    for col, dtype in zip(columns, dtypes)
+                }
+            )
+        if other.get_column_names() != columns:
+            raise ValueError("Expected DataFrame with matching columns.")
+        # Line the rows up by position.
+        other_dtypes = [str(dtype) for dtype in other.dataframe.types]
+        left = self.df.project("*, row_number() OVER () AS __position")
+        right = other.dataframe.project("*, row_number() OVER () AS __position")
+        joined = (
+            left.set_alias("__left")
+            .join(right.set_alias("__right"), "__left.__position = __right.__position")
+            .order("__left.__position")
+        )
+        return DuckDBDataFrame(
+            joined.project(
+                ", ".join(
+                    _binary_op(
+                        f"__left.{_quote(col)}",
+                        f"__right.{_quote(col)}",
+                        op,
+                        dtype in _INTEGER_TYPES and other_dtype in _INTEGER_TYPES,
+                    )
+                    + f" AS {_quote(col)}"
+                    for col, dtype, other_dtype in zip(columns, dtypes, other_dtypes)
+                )
+            )
+        )
+
+    def _reduce(self, reduction: str) -> DuckDBDataFrame:
+        return DuckDBDataFrame(
+            self.df.aggregate(
+                ", ".join(
+                    f"{_reduction(_quote(col), reduction, str(dtype))} AS {_quote(col)}"
+                    for col, dtype in zip(self.df.columns, self.df.types)
+                )
+            )
+        )
+
+    def _validate_comparand(self, column: DuckDBColumn[Any]) -> None:
+        if column._relation is not self.df:
+            raise ValueError("Expected Column derived from the same DataFrame")
+
+    def __dataframe_namespace__(self, *, api_version: str | None = None) -> Any:
+        return dataframe_api_compat.duckdb_standard
+
+    @property
+    def dataframe(self) -> duckdb.DuckDBPyRelation:
+        return self.df
+
+    def shape(self) -> tuple[int, int]:
+        return self.df.aggregate("count(*)").fetchone()[0], len(self.df.columns)
+
+    def groupby(self, keys: Sequence[str]) -> DuckDBGroupBy:
+        if not isinstance(keys, collections.abc.Sequence):
+            raise TypeError(f"Expected sequence of strings, got: {type(keys)}")
+        if isinstance(keys, str):
+            raise TypeError("Expected sequence of strings, got: str")
+        for key in keys:
+            if key not in self.get_column_names():
+                raise KeyError(f"key {key} not present in DataFrame's columns")
+        return DuckDBGroupBy(self.df, keys)
+
+    def get_column_by_name(self, name: str) -> DuckDBColumn[DType]:
+        if not isinstance(name, str):
+            raise ValueError(f"Expected str, got: {type(name)}")
+        if name not in self.get_column_names():
+            raise KeyError(f"column {name} not present in DataFrame's columns")
+        return DuckDBColumn(self.df, _quote(name))
+
+    def get_columns_by_name(self, names: Sequence[str]) -> DuckDBDataFrame:
+        if isinstance(names, str):
+            raise TypeError(f"Expected sequence of str, got {type(names)}")
+        return self._select({name: _quote(name) for name in names})
+
+    def get_rows(self, indices: Column[Any]) -> DuckDBDataFrame:
+        return DuckDBDataFrame(_take(self.df, indices))
+
+    def slice_rows(
+        self, start: int | None, stop: int | None, step: int | None
+    ) -> DuckDBDataFrame:
+        if (
+            (start is not None and start < 0)
+            or (stop is not None and stop < 0)
+            or (step is not None and step < 0)
+        ):
+            # need the length to resolve these, like Python slices do
+            start, stop, step = slice(start, stop, step).indices(self.shape()[0])
+        if start is None:
+            start = 0
+        if step is None:
+            step = 1
+        if step == 1 and stop is not None:
+            return DuckDBDataFrame(self.df.limit(max(stop - start, 0), start))
+        columns = ", ".join(_quote(col) for col in self.get_column_names())
+        rows = self.df.project(f"{columns}, row_number() OVER () - 1 AS __index")
+        if step > 0:
+            condition = f"__index >= {start} AND (__index - {start}) % {step} = 0"
+            if stop is not None:
+                condition += f" AND __index < {stop}"
+            order = "__index"
+        else:
+            condition = (
+                f"__index <= {start} AND __index > {stop} "
+                f"AND ({start} - __index) % {-step} = 0"
+            )
+            order = "__index DESC"
+        return DuckDBDataFrame(rows.filter(condition).order(order).project(columns))
+
+    def get_rows_by_mask(self, mask: Column[Bool]) -> DuckDBDataFrame:
+        self._validate_comparand(mask)
+        return DuckDBDataFrame(self.df.filter(mask._expression))
+
+    def insert(self, loc: int, label: str, value: Column[Any]) -> DuckDBDataFrame:
+        self._validate_comparand(value)
+        columns = {col: _quote(col) for col in self.get_column_names()}
+        items = list(columns.items())
+        items.insert(loc, (label, value._expression))
+        return self._select(dict(items))
+
+    def drop_column(self, label: str) -> DuckDBDataFrame:
+        if not isinstance(label, str):
+            raise TypeError(f"Expected str, got: {type(label)}")
+        if label not in self.get_column_names():
+            raise KeyError(f"column {label} not present in DataFrame's columns")
+        return self._select(
+            {col: _quote(col) for col in self.get_column_names() if col != label}
+        )
+
+    def rename_columns(self, mapping: Mapping[str, str]) -> DuckDBDataFrame:
+        if not isinstance(mapping, collections.abc.Mapping):
+            raise TypeError(f"Expected Mapping, got: {type(mapping)}")
+        return self._select(
+            {mapping.get(col, col): _quote(col) for col in self.get_column_names()}
+        )
+
+    def get_column_names(self) -> Sequence[str]:
+        return list(self.df.columns)
+
+    def __eq__(  # type: ignore[override]
+        self,
+        other: DataFrame | Any,
+    ) -> DuckDBDataFrame:
+        return self._binary_op(other, "__eq__")
+
+    def __ne__(  # type: ignore[override]
+        self,
+        other: DataFrame | Any,
+    ) -> DuckDBDataFrame:
+        return self._binary_op(other, "__ne__")
+
+    def __ge__(self, other: DataFrame | Any) -> DuckDBDataFrame:
+        return self._binary_op(other, "__ge__")
+
+    def __gt__(self, other: DataFrame | Any) -> DuckDBDataFrame:
+        return self._binary_op(other, "__gt__")
+
+    def __le__(self, other: DataFrame | Any) -> DuckDBDataFrame:
+        return self._binary_op(other, "__le__")
+
+    def __lt__(self, other: DataFrame | Any) -> DuckDBDataFrame:
+        return self._binary_op(other, "__lt__")
+
+    def __add__(self, other: DataFrame | Any) -> DuckDBDataFrame:
+        return self._binary_op(other, "__add__")
+
+    def __sub__(self, other: DataFrame | Any) -> DuckDBDataFrame:
+        return self._binary_op(other, "__sub__")
+
+    def __mul__(self, other: DataFrame | Any) -> DuckDBDataFrame:
+        return self._binary_op(other, "__mul__")
+
+    def __truediv__(self, other: DataFrame | Any) -> DuckDBDataFrame:
+        return self._binary_op(other, "__truediv__")
+
+    def __floordiv__(self, other: DataFrame | Any) -> DuckDBDataFrame:
+        return self._binary_op(other, "__floordiv__")
+
+    def __pow__(self, other: DataFrame | Any) -> DuckDBDataFrame:
+        return self._binary_op(other, "__pow__")
+
+    def __mod__(self, other: DataFrame | Any) -> DuckDBDataFrame:
+        return self._binary_op(other, "__mod__")
+
+    def __divmod__(
+        self,
+        other: DataFrame | Any,
+    ) -> tuple[DuckDBDataFrame, DuckDBDataFrame]:
+        quotient = self // other
+        remainder = self - quotient * other
+        return quotient, remainder
+
+    def __invert__(self) -> DuckDBDataFrame:
+        return self._select(
+            {col: f"(NOT {_quote(col)})" for col in self.get_column_names()}
+        )
+
+    def __iter__(self) -> NoReturn:
+        raise NotImplementedError()
+
+    def is_null(self) -> DuckDBDataFrame:
+        return self._select(
+            {col: f"({_quote(col)} IS NULL)" for col in self.get_column_names()}
+        )
+
+    def is_nan(self) -> DuckDBDataFrame:
+        return self._select(
+            {col: f"isnan({_quote(col)})" for col in self.get_column_names()}
+        )
+
+    def any(self, *, skip_nulls: bool = True) -> DuckDBDataFrame:
+        return self._reduce("any")
+
+    def all(self, *, skip_nulls: bool = True) -> DuckDBDataFrame:
+        return self._reduce("all")
+
+    def any_rowwise(self, *, skip_nulls: bool = True) -> DuckDBColumn[Bool]:
+        return DuckDBColumn(
+            self.df, " OR ".join(_quote(col) for col in self.get_column_names())
+        )
+
+    def all_rowwise(self, *, skip_nulls: bool = True) -> DuckDBColumn[Bool]:
+        return DuckDBColumn(
+            self.df, " AND ".join(_quote(col) for col in self.get_column_names())
+        )
+
+    def min(self, *, skip_nulls: bool = True) -> DuckDBDataFrame:
+        return self._reduce("min")
+
+    def max(self, *, skip_nulls: bool = True) -> DuckDBDataFrame:
+        return self._reduce("max")
+
+    def sum(self, *, skip_nulls: bool = True) -> DuckDBDataFrame:
+        return self._reduce("sum")
+
+    def prod(self, *, skip_nulls: bool = True) -> DuckDBDataFrame:
+        return self._reduce("prod")
+
+    def mean(self, *, skip_nulls: bool = True) -> DuckDBDataFrame:
+        return self._reduce("mean")
+
+    def median(self, *, skip_nulls: bool = True) -> DuckDBDataFrame:
+        return self._reduce("median")
+
+    def std(self, *, skip_nulls: bool = True) -> DuckDBDataFrame:
+        return self._reduce("std")
+
+    def var(self, *, skip_nulls: bool = True) -> DuckDBDataFrame:
+        return self._reduce("var")
+
+    def sorted_indices(
+        self,
+        keys: Sequence[Any],
+        *,
+        ascending: Sequence[bool] | bool = True,
+        nulls_position: Literal["first", "last"] = "last",
+    ) -> DuckDBColumn[Any]:
+        return DuckDBColumn(
+            _sorted_indices(
+                self.df, [_quote(key) for key in keys], ascending, nulls_position
+            ),
+            "__index",
+        )
+
+    def fill_nan(
+        self,
+        value: float | null,
+    ) -> DuckDBDataFrame:
+        return self._select(
+            {
+                col: f"CASE WHEN isnan({_quote(col)}) THEN {_literal(value)} "
+                f"ELSE {_quote(col)} END"
+                if str(dtype) in _FLOAT_TYPES
+                else _quote(col)
+                for col, dtype in zip(self.df.columns, self.df.types)
+            }
+        )
+
+
+dataframe_api_compat.profiling.register(DuckDBColumn, DuckDBGroupBy, DuckDBDataFrame)
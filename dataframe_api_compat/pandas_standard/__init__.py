@@ -3,10 +3,12 @@ from dataframe_api_compat.pandas_standard.pandas_standard import (
     PandasDataFrame,
     PandasColumn,
 )
+import numpy as np
 import pandas as pd
 
 from typing import (
     Any,
+    Iterable,
     Sequence,
 )
 
@@ -59,26 +61,51 @@ def map_standard_dtype_to_pandas_dtype(dtype: Any) -> Any:
     raise AssertionError(f"Unknown dtype: {dtype}")
 
 
+def _map_standard_dtype_to_numpy_dtype(dtype: Any) -> Any:
+    return map_standard_dtype_to_pandas_dtype(dtype).numpy_dtype
+
+
 def convert_to_standard_compliant_dataframe(df: pd.DataFrame) -> PandasDataFrame:
     return PandasDataFrame(df)
 
 
-def concat(dataframes: Sequence[PandasDataFrame]) -> PandasDataFrame:
-    dtypes = dataframes[0].dataframe.dtypes
+def _schema(df: pd.DataFrame) -> tuple[tuple[str, ...], tuple[Any, ...]]:
+    return tuple(df.columns), tuple(df.dtypes)
+
+
+def concat(dataframes: Iterable[PandasDataFrame]) -> PandasDataFrame:
+    # `dataframes` can be any iterable (e.g. a generator of shards), it's only
+    # consumed once. pandas computes the total length and allocates each output
+    # block once, so there are no intermediate copies.
+    schema = None
     dfs = []
+    # Keys which all the DataFrames are sorted by, and the previous non-empty one's
+    # last row's values of them. If each DataFrame starts where the previous one
+    # left off (e.g. shards of a time series), the result is sorted too.
+    sorted_by: tuple[str, ...] | None = None
+    last: list[Any] | None = None
     for _df in dataframes:
-        try:
-            pd.testing.assert_series_equal(_df.dataframe.dtypes, dtypes)
-        except Exception as exc:
-            raise ValueError("Expected matching columns") from exc
-        else:
-            dfs.append(_df.dataframe)
+        if schema is None:
+            schema = _schema(_df.dataframe)
+        elif _schema(_df.dataframe) != schema:
+            raise ValueError("Expected matching columns")
+        dfs.append(_df.dataframe)
+        if sorted_by is None:
+            sorted_by = _df._sorted_by
+        while _df._sorted_by[: len(sorted_by)] != sorted_by:
+            sorted_by = sorted_by[:-1]
+        if sorted_by and len(_df.dataframe) > 0:
+            first = [_df.dataframe[key].iat[0] for key in sorted_by]
+            if last is not None and last[: len(sorted_by)] > first:
+                sorted_by = ()
+            last = [_df.dataframe[key].iat[-1] for key in sorted_by]
     return PandasDataFrame(
         pd.concat(
             dfs,
             axis=0,
             ignore_index=True,
-        )
+        ),
+        sorted_by=sorted_by or (),
     )
 
 
@@ -87,6 +114,27 @@ def column_from_sequence(sequence: Sequence[Any], dtype: Any) -> PandasColumn[An
     return PandasColumn(ser)
 
 
+def column_from_1d_array(
+    array: Any, dtype: Any, mask: Any | None = None
+) -> PandasColumn[Any]:
+    # Not part of the standard. `array` can be a NumPy array or anything supporting
+    # the buffer protocol, and is only copied if its dtype doesn't match `dtype`.
+    # Without `mask` the column is backed by `array` itself, otherwise it's a
+    # nullable column sharing `array` as its values (`mask` is True where valid).
+    values = np.asarray(array, dtype=_map_standard_dtype_to_numpy_dtype(dtype))
+    if values.ndim != 1:
+        raise ValueError(f"Expected 1D array, got {values.ndim}D")
+    if mask is None:
+        return PandasColumn(pd.Series(values, copy=False))
+    validity = np.asarray(mask, dtype=bool)
+    if validity.shape != values.shape:
+        raise ValueError(
+            f"Expected mask of length {len(values)}, got shape {validity.shape}"
+        )
+    array_type = map_standard_dtype_to_pandas_dtype(dtype).construct_array_type()
+    return PandasColumn(pd.Series(array_type(values, ~validity), copy=False))
+
+
 def dataframe_from_dict(data: dict[str, PandasColumn[Any]]) -> PandasDataFrame:
     return PandasDataFrame(
         pd.DataFrame({label: column.column for label, column in data.items()})
@@ -1,12 +1,16 @@
 from __future__ import annotations
 import dataframe_api_compat.pandas_standard
+import dataframe_api_compat.profiling
 import numpy as np
 
 import pandas as pd
-from pandas.api.types import is_extension_array_dtype
+from pandas.api.types import is_bool_dtype, is_extension_array_dtype, is_numeric_dtype
 import collections
+import concurrent.futures
+import os
 from typing import (
     Any,
+    Callable,
     Sequence,
     Mapping,
     NoReturn,
@@ -29,34 +33,353 @@ if TYPE_CHECKING:
 else:
 
     class DataFrame(Generic[DType]):
-        ...
+        __slots__ = ()
 
     class Column(Generic[DType]):
-        ...
+        __slots__ = ()
 
     class GroupBy:
-        ...
+        __slots__ = ()
+
+
+_DEFERRED_UFUNCS = {
+    "__eq__": np.equal,
+    "__ne__": np.not_equal,
+    "__ge__": np.greater_equal,
+    "__gt__": np.greater,
+    "__le__": np.less_equal,
+    "__lt__": np.less,
+    "__and__": np.bitwise_and,
+    "__or__": np.bitwise_or,
+    "__add__": np.add,
+    "__sub__": np.subtract,
+    "__mul__": np.multiply,
+    "__truediv__": np.true_divide,
+    "__floordiv__": np.floor_divide,
+    "__pow__": np.power,
+    "__mod__": np.remainder,
+    "__invert__": np.invert,
+}
+
+
+def _evaluate_deferred(column: PandasColumn[Any]) -> tuple[Any, bool]:
+    # Evaluate a deferred column's expression tree. Returns the values (a NumPy
+    # array, or a Series if masked arrays are involved), and whether they're a
+    # temporary which the caller is free to overwrite.
+    # Nodes can appear in the tree several times (e.g. `x = x + x`), so count
+    # how many times each one is used: each is evaluated once, and only results
+    # used once are overwritten.
+    uses: collections.Counter[int] = collections.Counter()
+    stack = [column]
+    while stack:
+        node = stack.pop()
+        uses[id(node)] += 1
+        if uses[id(node)] == 1 and node._expr is not None:
+            stack.extend(
+                child for child in node._expr[1:] if isinstance(child, PandasColumn)
+            )
+    return _evaluate_node(column, uses, {})
+
+
+def _evaluate_node(
+    column: PandasColumn[Any],
+    uses: collections.Counter[int],
+    results: dict[int, tuple[Any, bool]],
+) -> tuple[Any, bool]:
+    if id(column) not in results:
+        values, owned = _evaluate_expr(column, uses, results)
+        results[id(column)] = values, owned and uses[id(column)] == 1
+    return results[id(column)]
+
+
+def _evaluate_expr(
+    column: PandasColumn[Any],
+    uses: collections.Counter[int],
+    results: dict[int, tuple[Any, bool]],
+) -> tuple[Any, bool]:
+    if column._expr is None:
+        ser = column.column
+        if is_extension_array_dtype(ser.dtype):
+            return ser, False
+        return ser.to_numpy(), False
+    op, left, right = column._expr
+    lhs, owned = _evaluate_node(left, uses, results)
+    if isinstance(right, PandasColumn):
+        rhs, _ = _evaluate_node(right, uses, results)
+    else:
+        rhs = right
+    if (
+        isinstance(lhs, pd.Series)
+        or isinstance(rhs, pd.Series)
+        or not isinstance(rhs, (np.ndarray, np.generic, int, float, type(None)))
+    ):
+        # Let pandas handle missing values.
+        if op == "__invert__":
+            return ~pd.Series(lhs), True
+        return getattr(pd.Series(lhs), op)(rhs), True
+    ufunc = _DEFERRED_UFUNCS[op]
+    args = (lhs,) if op == "__invert__" else (lhs, rhs)
+    with np.errstate(all="ignore"):
+        # Operating on empty slices tells us the result dtype cheaply.
+        probe = ufunc(*(arg[:0] if isinstance(arg, np.ndarray) else arg for arg in args))
+        if op in ("__floordiv__", "__mod__") and probe.dtype.kind in "iu":
+            # pandas returns inf / nan for integer division by zero.
+            return getattr(pd.Series(lhs), op)(rhs).to_numpy(), True
+        if owned and probe.dtype == lhs.dtype:
+            return ufunc(*args, out=lhs), True
+        return ufunc(*args), True
+
+
+def _masked_is_nan(ser: pd.Series[Any]) -> np.ndarray[Any, Any]:
+    # Filling nulls with 0 means only actual NaN values are flagged.
+    return np.isnan(ser.to_numpy(dtype="float64", na_value=0.0))
+
+
+def _to_arrow(ser: pd.Series[Any]) -> tuple[Any, bool]:
+    # Also returns whether the data had to be copied. Arrow uses NumPy arrays, and
+    # the data of masked arrays, as they are - except for booleans, which it
+    # stores as bits rather than bytes.
+    import pyarrow as pa  # type: ignore[import]
+
+    if is_extension_array_dtype(ser.dtype):
+        values = getattr(ser.array, "_data", None)
+        array = pa.array(ser.array)
+    else:
+        values = ser.to_numpy()
+        array = pa.array(values, from_pandas=False)
+    data = array.buffers()[1]
+    copied = values is None or data is None or data.address != values.ctypes.data
+    return array, copied
+
+
+# id -> Index, for columns which passed validation, and for (row) indexes which
+# are a default RangeIndex. pandas Indexes are immutable, and most operations
+# reuse their input's columns and index, so checking identity is enough. The
+# Indexes are kept alive so that their ids can't be reused.
+_VALIDATED_COLUMNS: dict[int, pd.Index] = {}
+_DEFAULT_INDEXES: dict[int, pd.Index] = {}
+_CACHE_MAX_SIZE = 1024
+
+
+def _cache_index(cache: dict[int, pd.Index], index: pd.Index) -> None:
+    if len(cache) >= _CACHE_MAX_SIZE:
+        cache.clear()
+    cache[id(index)] = index
+
+
+def _is_default_index(index: pd.Index) -> bool:
+    if (
+        type(index) is pd.RangeIndex
+        and index.start == 0  # type: ignore[comparison-overlap]
+        and index.step == 1  # type: ignore[comparison-overlap]
+        and index.stop == len(index)  # type: ignore[comparison-overlap]
+    ):
+        _cache_index(_DEFAULT_INDEXES, index)
+        return True
+    return False
+
+
+def _to_numpy(ser: pd.Series[Any]) -> np.ndarray[Any, Any]:
+    # For masked arrays, these are the values underneath the mask, so they're only
+    # meaningful if there are no nulls. They're not copied.
+    if is_extension_array_dtype(ser.dtype):
+        return ser.to_numpy(ser.dtype.numpy_dtype)
+    return ser.to_numpy()
+
+
+def _is_sorted(df: pd.DataFrame, keys: Sequence[str]) -> bool:
+    # Whether `df` is sorted by `keys` in ascending order (by the first key, then
+    # ties by the second one, etc.), without missing values in them. Checking is
+    # O(n), and for unsorted data usually stops at the first rows out of order.
+    if not df[keys[0]].is_monotonic_increasing:
+        return False
+    # Whether each row is tied with the one before it on the keys checked so far.
+    tied = np.ones(max(len(df) - 1, 0), dtype=bool)
+    for i, key in enumerate(keys):
+        ser = df[key]
+        if ser.hasnans:
+            return False
+        values = _to_numpy(ser)
+        if i > 0 and (tied & (values[1:] < values[:-1])).any():
+            return False
+        tied &= values[1:] == values[:-1]
+        if not tied.any():
+            break
+    return True
+
+
+def _run_starts(*arrays: np.ndarray[Any, Any]) -> np.ndarray[Any, Any]:
+    # Positions at which a run of rows with equal values in all `arrays` starts.
+    changed = np.zeros(max(len(arrays[0]) - 1, 0), dtype=bool)
+    for values in arrays:
+        changed |= values[1:] != values[:-1]
+    starts = np.flatnonzero(changed) + 1
+    if len(arrays[0]) == 0:
+        return starts
+    return np.concatenate([[0], starts])
+
+
+def _validate_sort_order(
+    keys: Sequence[str], ascending: Sequence[bool] | bool, nulls_position: str
+) -> list[bool]:
+    # Returns whether to sort each key in ascending order.
+    if nulls_position not in ("first", "last"):
+        raise ValueError(f"Expected 'first' or 'last', got: {nulls_position}")
+    if isinstance(ascending, bool):
+        return [ascending] * len(keys)
+    if len(ascending) != len(keys):
+        raise ValueError(
+            f"Expected {len(keys)} values for `ascending`, got {len(ascending)}"
+        )
+    return list(ascending)
+
+
+def _sort_codes(
+    ser: pd.Series[Any], ascending: bool, nulls_position: str
+) -> tuple[np.ndarray[Any, Any], int]:
+    # The rank of each value among the distinct values of `ser`, in the requested
+    # order, with missing values ranked before or after all of them. Also returns
+    # the number of ranks.
+    codes, uniques = pd.factorize(ser, sort=True)
+    n_codes = len(uniques)
+    missing = codes == -1
+    if not ascending:
+        np.subtract(n_codes - 1, codes, out=codes)
+    if nulls_position == "first":
+        codes += 1
+        codes[missing] = 0
+    else:
+        codes[missing] = n_codes
+    return codes, n_codes + 1
+
+
+def _sorted_positions(
+    df: pd.DataFrame, keys: Sequence[str], ascending: list[bool], nulls_position: str
+) -> np.ndarray[Any, Any]:
+    # Stable, so ties keep their original order.
+    if len(keys) == 1:
+        return (
+            df[keys[0]]
+            .sort_values(
+                ascending=ascending[0], kind="stable", na_position=nulls_position
+            )
+            .index.to_numpy()
+        )
+    # Combine the ranks of all keys into a single integer per row, which sorts like
+    # the rows should, and sort that once. This is how pandas sorts by several
+    # columns too, but without copying the keys into a new DataFrame first.
+    combined, size = _sort_codes(df[keys[0]], ascending[0], nulls_position)
+    for key, key_ascending in zip(keys[1:], ascending[1:]):
+        codes, n_codes = _sort_codes(df[key], key_ascending, nulls_position)
+        if size * n_codes > np.iinfo(np.int64).max:
+            # Re-rank the combined keys so far (there are at most as many distinct
+            # ones as rows), so that the result fits in 64 bits.
+            combined, uniques = pd.factorize(combined, sort=True)
+            size = len(uniques)
+        combined *= n_codes
+        combined += codes
+        size *= n_codes
+    return np.argsort(combined, kind="stable")
+
+
+def _k_indices(
+    df: pd.DataFrame,
+    keys: Sequence[str],
+    k: int,
+    *,
+    largest: bool,
+    is_sorted: bool = False,
+) -> pd.Series[Any]:
+    # Positions of the `k` rows with the largest (or smallest) values of `keys`, in
+    # that order. Ties keep their original order, and missing values (nulls and
+    # NaN) come last. Rather than sorting all rows, `np.partition` finds the k-th
+    # value of the first key in O(n), and only rows at least as good get sorted.
+    if not isinstance(k, int) or k < 0:
+        raise ValueError(f"Expected non-negative integer, got: {k}")
+    if k == 0 or (is_sorted and not largest):
+        # Nothing to select, or `df` is known to be sorted by `keys`.
+        return pd.Series(np.arange(min(k, len(df))))
+    first = df[keys[0]]
+    if is_extension_array_dtype(first.dtype):
+        missing = first.isna().to_numpy(bool)
+        values = first.to_numpy(first.dtype.numpy_dtype, na_value=0)
+    else:
+        missing = np.zeros(len(first), dtype=bool)
+        values = first.to_numpy()
+    if values.dtype.kind == "f":
+        missing |= np.isnan(values)
+    if missing.any():
+        rows = np.flatnonzero(~missing)
+        present = values[rows]
+    else:
+        rows = None
+        present = values
+    if k < len(present):
+        kth = len(present) - k if largest else k - 1
+        threshold = np.partition(present, kth)[kth]
+        selected = np.flatnonzero(
+            present >= threshold if largest else present <= threshold
+        )
+        rows = selected if rows is None else rows[selected]
+    else:
+        # All present values are needed, and then some missing ones.
+        rows = np.arange(len(df))
+    candidates = df.iloc[rows, df.columns.get_indexer(keys)]
+    order = candidates.sort_values(
+        list(keys), ascending=not largest, kind="stable", na_position="last"
+    ).index[:k]
+    return pd.Series(order.to_numpy())
 
 
 class PandasColumn(Column[DType]):
+    __slots__ = ("_series", "_deferred", "_expr", "_membership_index", "_sorted")
+
     # private, not technically part of the standard
     def __init__(self, column: pd.Series) -> None:  # type: ignore[type-arg]
-        if (
-            isinstance(column.index, pd.RangeIndex)
-            and column.index.start == 0  # type: ignore[comparison-overlap]
-            and column.index.step == 1  # type: ignore[comparison-overlap]
-            and (column.index.stop == len(column))  # type: ignore[comparison-overlap]
-        ):
+        self._deferred = False
+        self._expr: tuple[str, PandasColumn[Any], Any] | None = None
+        self._membership_index: pd.Index | None = None
+        # Whether the column is sorted in ascending order, if known.
+        self._sorted: bool | None = None
+        index = column.index
+        if _DEFAULT_INDEXES.get(id(index)) is index or _is_default_index(index):
             self._series = column
         else:
-            self._series = column.reset_index(drop=True)
+            # Shallow copy, so the data isn't copied - only the index is replaced.
+            self._series = column.set_axis(pd.RangeIndex(len(column)), copy=False)
 
     # In the standard
     def __column_namespace__(self, *, api_version: str | None = None) -> Any:
         return dataframe_api_compat.pandas_standard
 
+    @classmethod
+    def _from_expr(
+        cls, op: str, left: PandasColumn[Any], right: Any
+    ) -> PandasColumn[Any]:
+        result: PandasColumn[Any] = cls.__new__(cls)
+        result._series = None
+        result._expr = (op, left, right)
+        result._deferred = True
+        result._membership_index = None
+        result._sorted = None
+        return result
+
+    def deferred(self) -> PandasColumn[DType]:
+        # Not part of the standard. Arithmetic, comparisons and logical
+        # operators on the returned column build up an expression tree,
+        # which is only evaluated once the values are needed. Evaluation
+        # happens in a single pass which reuses intermediate buffers,
+        # rather than allocating a new Series for each operation.
+        result: PandasColumn[DType] = PandasColumn(self.column)
+        result._deferred = True
+        return result
+
     @property
     def column(self) -> pd.Series[Any]:
+        if self._series is None:
+            result, _ = _evaluate_deferred(self)
+            self._series = result if isinstance(result, pd.Series) else pd.Series(result)
+            self._expr = None
         return self._series
 
     def __len__(self) -> int:
@@ -78,6 +401,8 @@ class PandasColumn(Column[DType]):
     def __eq__(  # type: ignore[override]
         self, other: PandasColumn[DType] | Any
     ) -> PandasColumn[Bool]:
+        if self._deferred:
+            return self._from_expr("__eq__", self, other)
         if isinstance(other, PandasColumn):
             return PandasColumn(self.column == other.column)
         return PandasColumn(self.column == other)
@@ -85,72 +410,100 @@ class PandasColumn(Column[DType]):
     def __ne__(  # type: ignore[override]
         self, other: Column[DType]
     ) -> PandasColumn[Bool]:
+        if self._deferred:
+            return self._from_expr("__ne__", self, other)
         if isinstance(other, PandasColumn):
             return PandasColumn(self.column != other.column)
         return PandasColumn(self.column != other)
 
     def __ge__(self, other: Column[DType] | Any) -> PandasColumn[Bool]:
+        if self._deferred:
+            return self._from_expr("__ge__", self, other)
         if isinstance(other, PandasColumn):
             return PandasColumn(self.column >= other.column)
         return PandasColumn(self.column >= other)
 
     def __gt__(self, other: Column[DType] | Any) -> PandasColumn[Bool]:
+        if self._deferred:
+            return self._from_expr("__gt__", self, other)
         if isinstance(other, PandasColumn):
             return PandasColumn(self.column > other.column)
         return PandasColumn(self.column > other)
 
     def __le__(self, other: Column[DType] | Any) -> PandasColumn[Bool]:
+        if self._deferred:
+            return self._from_expr("__le__", self, other)
         if isinstance(other, PandasColumn):
             return PandasColumn(self.column <= other.column)
         return PandasColumn(self.column <= other)
 
     def __lt__(self, other: Column[DType] | Any) -> PandasColumn[Bool]:
+        if self._deferred:
+            return self._from_expr("__lt__", self, other)
         if isinstance(other, PandasColumn):
             return PandasColumn(self.column < other.column)
         return PandasColumn(self.column < other)
 
     def __and__(self, other: Column[Bool] | bool) -> PandasColumn[Bool]:
+        if self._deferred:
+            return self._from_expr("__and__", self, other)
         if isinstance(other, PandasColumn):
             return PandasColumn(self.column & other.column)
         result = self.column & other  # type: ignore[operator]
         return PandasColumn(result)
 
     def __or__(self, other: Column[Bool] | bool) -> PandasColumn[Bool]:
+        if self._deferred:
+            return self._from_expr("__or__", self, other)
         if isinstance(other, PandasColumn):
             return PandasColumn(self.column | other.column)
         return PandasColumn(self.column | other)  # type: ignore[operator]
 
     def __add__(self, other: Column[DType] | Any) -> PandasColumn[DType]:
+        if self._deferred:
+            return self._from_expr("__add__", self, other)
         if isinstance(other, PandasColumn):
             return PandasColumn(self.column + other.column)
         return PandasColumn(self.column + other)  # type: ignore[operator]
 
     def __sub__(self, other: Column[DType] | Any) -> PandasColumn[DType]:
+        if self._deferred:
+            return self._from_expr("__sub__", self, other)
         if isinstance(other, PandasColumn):
             return PandasColumn(self.column - other.column)
         return PandasColumn(self.column - other)  # type: ignore[operator]
 
     def __mul__(self, other: Column[DType] | Any) -> PandasColumn[Any]:
+        if self._deferred:
+            return self._from_expr("__mul__", self, other)
         if isinstance(other, PandasColumn):
             return PandasColumn(self.column * other.column)
         return PandasColumn(self.column * other)  # type: ignore[operator]
 
     def __truediv__(self, other: Column[DType] | Any) -> PandasColumn[Any]:
+        if self._deferred:
+            return self._from_expr("__truediv__", self, other)
         if isinstance(other, PandasColumn):
             return PandasColumn(self.column / other.column)
         return PandasColumn(self.column / other)  # type: ignore[operator]
 
     def __floordiv__(self, other: Column[DType] | Any) -> PandasColumn[Any]:
+        if self._deferred:
+            return self._from_expr("__floordiv__", self, other)
         if isinstance(other, PandasColumn):
             return PandasColumn(self.column // other.column)
         return PandasColumn(self.column // other)  # type: ignore[operator]
 
     def __pow__(self, other: Column[DType] | Any) -> PandasColumn[Any]:
+        if self._deferred:
+            return self._from_expr("__pow__", self, other)
         if isinstance(other, PandasColumn):
             return PandasColumn(self.column**other.column)
         return PandasColumn(self.column**other)  # type: ignore[operator]
 
     def __mod__(self, other: Column[DType] | Any) -> PandasColumn[Any]:
+        if self._deferred:
+            return self._from_expr("__mod__", self, other)
         if isinstance(other, PandasColumn):
             return PandasColumn(self.column % other.column)
         return PandasColumn(self.column % other)  # type: ignore[operator]
@@ -158,6 +511,8 @@ class PandasColumn(Column[DType]):
     def __divmod__(
         self, other: Column[DType] | Any
     ) -> tuple[PandasColumn[Any], PandasColumn[Any]]:
+        if self._deferred:
+            return self // other, self % other
         if isinstance(other, PandasColumn):
             quotient, remainder = self.column.__divmod__(other.column)
         else:
@@ -165,6 +520,8 @@ class PandasColumn(Column[DType]):
         return PandasColumn(quotient), PandasColumn(remainder)
 
     def __invert__(self: PandasColumn[Bool]) -> PandasColumn[Bool]:
+        if self._deferred:
+            return self._from_expr("__invert__", self, None)
         return PandasColumn(~self.column)
 
     def any(self, *, skip_nulls: bool = True) -> bool:
@@ -201,24 +558,80 @@ class PandasColumn(Column[DType]):
         if is_extension_array_dtype(self.column.dtype):
             return PandasColumn(self.column.isnull())
         else:
-            return PandasColumn(pd.Series(np.array([False] * len(self))))
+            return PandasColumn(pd.Series(np.zeros(len(self), dtype=bool)))
 
     def is_nan(self) -> PandasColumn[Bool]:
         if is_extension_array_dtype(self.column.dtype):
-            return PandasColumn(np.isnan(self.column).replace(pd.NA, False).astype(bool))
+            return PandasColumn(pd.Series(_masked_is_nan(self.column)))
         return PandasColumn(self.column.isna())
 
+    def set_sorted(self) -> PandasColumn[DType]:
+        # Not part of the standard. Marks the column as sorted in ascending order
+        # (without nulls or NaN), without checking, so that e.g. `sorted_indices`
+        # doesn't need to sort it.
+        result: PandasColumn[DType] = PandasColumn(self.column)
+        result._sorted = True
+        return result
+
+    def _is_sorted(self) -> bool:
+        # Columns are immutable, so this is only checked once.
+        if self._sorted is None:
+            self._sorted = self.column.is_monotonic_increasing
+        return self._sorted
+
     def sorted_indices(
         self, *, ascending: bool = True, nulls_position: Literal["first", "last"] = "last"
     ) -> PandasColumn[Any]:
-        return PandasColumn(pd.Series(self.column.argsort()))
+        order = _validate_sort_order(["values"], ascending, nulls_position)
+        if ascending and self._is_sorted():
+            return PandasColumn(pd.Series(np.arange(len(self))))
+        df = self.column.to_frame("values")
+        return PandasColumn(
+            pd.Series(_sorted_positions(df, ["values"], order, nulls_position))
+        )
+
+    def top_k_indices(self, k: int) -> PandasColumn[Any]:
+        # Not part of the standard. Like the first `k` of `sorted_indices` in
+        # descending order, but without sorting the whole column.
+        return PandasColumn(
+            _k_indices(self.column.to_frame("values"), ["values"], k, largest=True)
+        )
+
+    def bottom_k_indices(self, k: int) -> PandasColumn[Any]:
+        # Not part of the standard. Like the first `k` of `sorted_indices`, but
+        # without sorting the whole column.
+        return PandasColumn(
+            _k_indices(
+                self.column.to_frame("values"),
+                ["values"],
+                k,
+                largest=False,
+                is_sorted=bool(self._sorted),
+            )
+        )
+
+    def _get_membership_index(self) -> pd.Index:
+        # Index caches its hash table, and columns are immutable, so when the
+        # same column is passed to `is_in` repeatedly (e.g. an allow-list) the
+        # hash table only gets built once.
+        if self._membership_index is None:
+            self._membership_index = pd.Index(self.column.unique())
+        return self._membership_index
 
     def is_in(self, values: Column[DType]) -> PandasColumn[Bool]:
         if values.dtype != self.dtype:
             raise ValueError(f"`value` has dtype {values.dtype}, expected {self.dtype}")
-        return PandasColumn(self.column.isin(values.column))
+        index = values._get_membership_index()
+        result = index.get_indexer(self.column) != -1
+        if is_extension_array_dtype(self.column.dtype):
+            # Like `Series.isin`, which returns nullable booleans for masked arrays.
+            return PandasColumn(pd.Series(result, dtype="boolean"))
+        return PandasColumn(pd.Series(result))
 
     def unique_indices(self, *, skip_nulls: bool = True) -> PandasColumn[Any]:
+        if self._is_sorted():
+            # Duplicates are next to each other, so there's no need to hash.
+            return PandasColumn(pd.Series(_run_starts(_to_numpy(self.column))))
         return PandasColumn(self.column.drop_duplicates().index.to_series())
 
     def fill_nan(
@@ -229,11 +642,52 @@ class PandasColumn(Column[DType]):
         return PandasColumn(ser)
 
 
+_GROUPBY_AGGREGATIONS = (
+    "any",
+    "all",
+    "min",
+    "max",
+    "sum",
+    "prod",
+    "median",
+    "mean",
+    "std",
+    "var",
+    "size",
+)
+
+
+# Reductions which `PandasGroupBy` can do on sorted keys -> ufunc reducing each group
+# (as well as `size`). Only ones which give exactly the same results as pandas:
+# `reduceat` adds floats up one by one, whereas pandas compensates for rounding
+# errors, so floats are only summed by pandas (and `mean` and `prod` never do
+# this).
+_SEGMENT_REDUCTIONS = {
+    "any": np.logical_or,
+    "all": np.logical_and,
+    "min": np.minimum,
+    "max": np.maximum,
+    "sum": np.add,
+}
+# Below this many rows, reducing a probe with pandas costs more than it saves.
+_SEGMENT_REDUCTION_MIN_ROWS = 100_000
+
+
 class PandasGroupBy(GroupBy):
-    def __init__(self, df: pd.DataFrame, keys: Sequence[str]) -> None:
+    __slots__ = ("df", "grouped", "keys", "_sorted", "_starts")
+
+    def __init__(
+        self, df: pd.DataFrame, keys: Sequence[str], *, is_sorted: bool = False
+    ) -> None:
         self.df = df
+        # pandas factorises the keys on the first reduction and caches the group
+        # codes on `grouped`, so every later reduction (and `size`) reuses them.
         self.grouped = df.groupby(list(keys), sort=False, as_index=False)
         self.keys = list(keys)
+        # If `df` is sorted by `keys`, each group is a run of consecutive rows,
+        # which can be reduced without factorising the keys at all.
+        self._sorted = is_sorted
+        self._starts: np.ndarray[Any, Any] | None = None
 
     def _validate_result(self, result: pd.DataFrame) -> None:
         failed_columns = self.df.columns.difference(result.columns)
@@ -244,15 +698,58 @@ class PandasGroupBy(GroupBy):
                 f"{failed_columns}. Please drop them before calling groupby."
             )
 
+    def _segment_reduce(self, reduction: str) -> pd.DataFrame | None:
+        # Reduce each run of rows with `np.ufunc.reduceat`. Returns None if pandas
+        # has to do it, because there are missing values which it would skip, or
+        # floats to sum.
+        df = self.df
+        columns = [column for column in df.columns if column not in self.keys]
+        if reduction != "size" and any(df[column].hasnans for column in columns):
+            return None
+        if reduction == "sum" and any(
+            _to_numpy(df[column]).dtype.kind not in "biu" for column in columns
+        ):
+            return None
+        if self._starts is None:
+            self._starts = _run_starts(*(_to_numpy(df[key]) for key in self.keys))
+        starts = self._starts
+        counts = np.diff(np.append(starts, len(df)))
+        # Reducing the first row with pandas tells us the result's columns and dtypes.
+        probe = getattr(
+            df.iloc[:1].groupby(self.keys, sort=False, as_index=False), reduction
+        )()
+        result = {}
+        for column, dtype in probe.dtypes.items():
+            if column in self.keys:
+                result[column] = df[column].iloc[starts].reset_index(drop=True)
+                continue
+            if reduction == "size":
+                result[column] = pd.Series(counts)
+                continue
+            values = _to_numpy(df[column])
+            if reduction == "sum" and values.dtype.kind in "bi":
+                values = values.astype("int64")
+            reduced = _SEGMENT_REDUCTIONS[reduction].reduceat(values, starts)
+            result[column] = pd.Series(reduced).astype(dtype)
+        return pd.DataFrame(result)
+
+    def _reduce(self, reduction: str) -> PandasDataFrame:
+        result = None
+        if self._sorted and (reduction == "size" or reduction in _SEGMENT_REDUCTIONS):
+            result = self._segment_reduce(reduction)
+        if result is None:
+            result = getattr(self.grouped, reduction)()
+            if reduction != "size":
+                self._validate_result(result)
+        return PandasDataFrame(result)
+
     def size(self) -> PandasDataFrame:
-        # pandas-stubs is wrong
-        return PandasDataFrame(self.grouped.size())  # type: ignore[arg-type]
+        return self._reduce("size")
 
     def _validate_booleanness(self) -> None:
-        if not (
-            (self.df.drop(columns=self.keys).dtypes == "bool")
-            | (self.df.drop(columns=self.keys).dtypes == "boolean")
-        ).all():
+        # Only look at the dtypes, dropping columns from `self.df` would copy it.
+        dtypes = self.df.dtypes.drop(self.keys)
+        if not ((dtypes == "bool") | (dtypes == "boolean")).all():
             raise NotImplementedError(
                 "'function' can only be called on DataFrame "
                 "where all dtypes are 'bool'"
@@ -260,73 +757,197 @@ class PandasGroupBy(GroupBy):
 
     def any(self, *, skip_nulls: bool = True) -> PandasDataFrame:
         self._validate_booleanness()
-        result = self.grouped.any()
-        self._validate_result(result)
-        return PandasDataFrame(result)
+        return self._reduce("any")
 
     def all(self, *, skip_nulls: bool = True) -> PandasDataFrame:
         self._validate_booleanness()
-        result = self.grouped.all()
-        self._validate_result(result)
-        return PandasDataFrame(result)
+        return self._reduce("all")
 
     def min(self, *, skip_nulls: bool = True) -> PandasDataFrame:
-        result = self.grouped.min()
-        self._validate_result(result)
-        return PandasDataFrame(result)
+        return self._reduce("min")
 
     def max(self, *, skip_nulls: bool = True) -> PandasDataFrame:
-        result = self.grouped.max()
-        self._validate_result(result)
-        return PandasDataFrame(result)
+        return self._reduce("max")
 
     def sum(self, *, skip_nulls: bool = True) -> PandasDataFrame:
-        result = self.grouped.sum()
-        self._validate_result(result)
-        return PandasDataFrame(result)
+        return self._reduce("sum")
 
     def prod(self, *, skip_nulls: bool = True) -> PandasDataFrame:
-        result = self.grouped.prod()
-        self._validate_result(result)
-        return PandasDataFrame(result)
+        return self._reduce("prod")
 
     def median(self, *, skip_nulls: bool = True) -> PandasDataFrame:
-        result = self.grouped.median()
-        self._validate_result(result)
-        return PandasDataFrame(result)
+        return self._reduce("median")
 
     def mean(self, *, skip_nulls: bool = True) -> PandasDataFrame:
-        result = self.grouped.mean()
-        self._validate_result(result)
-        return PandasDataFrame(result)
+        return self._reduce("mean")
 
     def std(self, *, skip_nulls: bool = True) -> PandasDataFrame:
-        result = self.grouped.std()
-        self._validate_result(result)
-        return PandasDataFrame(result)
+        return self._reduce("std")
 
     def var(self, *, skip_nulls: bool = True) -> PandasDataFrame:
-        result = self.grouped.var()
-        self._validate_result(result)
-        return PandasDataFrame(result)
+        return self._reduce("var")
+
+    def aggregate(self, aggregations: Mapping[str, tuple[str, str]]) -> PandasDataFrame:
+        # Not part of the standard (yet). Computes several reductions in a
+        # single groupby, e.g. `{"b_sum": ("b", "sum"), "b_size": ("b", "size")}`.
+        if not isinstance(aggregations, collections.abc.Mapping):
+            raise TypeError(f"Expected Mapping, got: {type(aggregations)}")
+        named_aggregations = {}
+        for name, (column, reduction) in aggregations.items():
+            if column not in self.df.columns:
+                raise KeyError(f"column {column} not present in DataFrame's columns")
+            if reduction not in _GROUPBY_AGGREGATIONS:
+                raise ValueError(f"Unsupported reduction: {reduction}")
+            if reduction in ("any", "all") and self.df[column].dtype not in (
+                "bool",
+                "boolean",
+            ):
+                raise NotImplementedError(
+                    f"'{reduction}' can only be called on columns of dtype 'bool'"
+                )
+            named_aggregations[name] = pd.NamedAgg(column, reduction)
+        return PandasDataFrame(self.grouped.agg(**named_aggregations))
+
+
+_DESCRIBE_STATISTICS = ("min", "max", "mean", "std", "var", "null_count", "sum")
+# Number of rows processed at a time by `describe`, small enough for a chunk
+# to stay in cache while all statistics are computed from it.
+_DESCRIBE_CHUNK_SIZE = 65_536
+
+
+def _validate_join(
+    left: pd.DataFrame,
+    right: pd.DataFrame,
+    left_on: Sequence[str],
+    right_on: Sequence[str],
+    how: str,
+) -> None:
+    if how not in ("inner", "left", "outer"):
+        raise ValueError(f"Unsupported join type: {how}")
+    if isinstance(left_on, str) or isinstance(right_on, str):
+        raise TypeError("Expected sequence of strings, got: str")
+    if len(left_on) != len(right_on):
+        raise ValueError(
+            f"Expected as many keys in `right_on` as in `left_on`, got {len(right_on)} "
+            f"and {len(left_on)}"
+        )
+    if not left_on:
+        raise ValueError("Expected at least one key to join on")
+    for key in left_on:
+        if key not in left.columns:
+            raise KeyError(f"key {key} not present in DataFrame's columns")
+    for key in right_on:
+        if key not in right.columns:
+            raise KeyError(f"key {key} not present in other DataFrame's columns")
+
+    def kind(dtype: Any) -> Any:
+        # Nullable and NumPy dtypes map to the same standard dtype, so match.
+        if dtype.name in dataframe_api_compat.pandas_standard.DTYPE_MAP:
+            return type(dataframe_api_compat.pandas_standard.DTYPE_MAP[dtype.name])
+        return dtype
+
+    for left_key, right_key in zip(left_on, right_on):
+        left_dtype = left[left_key].dtype
+        right_dtype = right[right_key].dtype
+        if kind(left_dtype) != kind(right_dtype):
+            raise ValueError(
+                f"Key {right_key} has dtype {right_dtype}, but {left_key} has dtype "
+                f"{left_dtype}"
+            )
+    for col in right.columns:
+        if col not in right_on and col in left.columns:
+            raise ValueError(
+                f"Expected unique column names, got {col} in both DataFrames"
+            )
+
+
+def _validate_asof_join(
+    left_on: str,
+    right_on: str,
+    left_by: Sequence[str],
+    right_by: Sequence[str],
+    direction: str,
+) -> None:
+    # The rest is checked by `_validate_join`, as for the equi-join on `left_by`.
+    if direction not in ("backward", "forward", "nearest"):
+        raise ValueError(f"Unsupported direction: {direction}")
+    if not isinstance(left_on, str) or not isinstance(right_on, str):
+        raise TypeError(f"Expected str, got: {type(left_on)} and {type(right_on)}")
+    if isinstance(left_by, str) or isinstance(right_by, str):
+        raise TypeError("Expected sequence of strings, got: str")
+    if len(left_by) != len(right_by):
+        raise ValueError(
+            f"Expected as many keys in `right_by` as in `left_by`, got {len(right_by)} "
+            f"and {len(left_by)}"
+        )
+
+
+def _describe_column(array: Any) -> dict[str, float]:
+    # Compute all statistics in a single pass over `array`. Mean and variance
+    # are accumulated per chunk, and combined using Chan et al.'s parallel
+    # version of Welford's algorithm, so they're numerically stable.
+    count = 0
+    mean = 0.0
+    m2 = 0.0
+    total = 0.0
+    minimum = np.inf
+    maximum = -np.inf
+    for start in range(0, len(array), _DESCRIBE_CHUNK_SIZE):
+        chunk = array[start : start + _DESCRIBE_CHUNK_SIZE].to_numpy(
+            dtype="float64", na_value=np.nan
+        )
+        chunk = chunk[~np.isnan(chunk)]
+        chunk_count = len(chunk)
+        if chunk_count == 0:
+            continue
+        chunk_total = chunk.sum()
+        chunk_mean = chunk_total / chunk_count
+        chunk_m2 = np.square(chunk - chunk_mean).sum()
+        new_count = count + chunk_count
+        delta = chunk_mean - mean
+        mean += delta * chunk_count / new_count
+        m2 += chunk_m2 + delta**2 * count * chunk_count / new_count
+        count = new_count
+        total += chunk_total
+        minimum = min(minimum, chunk.min())
+        maximum = max(maximum, chunk.max())
+    var = m2 / (count - 1) if count > 1 else np.nan
+    return {
+        "min": minimum if count else np.nan,
+        "max": maximum if count else np.nan,
+        "mean": mean if count else np.nan,
+        "std": np.sqrt(var),
+        "var": var,
+        "sum": total,
+    }
+
+
+# Below this many elements, spinning up threads costs more than it saves.
+_PARALLEL_REDUCTION_MIN_SIZE = 1_000_000
+# Above this many distinct dtypes, reducing each dtype separately costs more
+# than letting pandas reduce the whole frame at once.
+_MAX_REDUCTION_DTYPE_GROUPS = 8
 
 
 class PandasDataFrame(DataFrame):
+    __slots__ = ("_dataframe", "_sorted_by")
+
     # Not technically part of the standard
 
-    def __init__(self, dataframe: pd.DataFrame) -> None:
-        self._validate_columns(dataframe.columns)  # type: ignore[arg-type]
-        if (
-            isinstance(dataframe.index, pd.RangeIndex)
-            and dataframe.index.start == 0  # type: ignore[comparison-overlap]
-            and dataframe.index.step == 1  # type: ignore[comparison-overlap]
-            and (
-                dataframe.index.stop == len(dataframe)  # type: ignore[comparison-overlap]
-            )
-        ):
+    def __init__(self, dataframe: pd.DataFrame, *, sorted_by: Sequence[str] = ()) -> None:
+        # Keys which the rows are known to be sorted by (see `set_sorted`).
+        self._sorted_by = tuple(sorted_by)
+        columns = dataframe.columns
+        if _VALIDATED_COLUMNS.get(id(columns)) is not columns:
+            self._validate_columns(columns)  # type: ignore[arg-type]
+        index = dataframe.index
+        if _DEFAULT_INDEXES.get(id(index)) is index or _is_default_index(index):
             self._dataframe = dataframe
         else:
-            self._dataframe = dataframe.reset_index(drop=True)
+            # Shallow copy, so the data isn't copied - only the index is replaced.
+            self._dataframe = dataframe.set_axis(
+                pd.RangeIndex(len(dataframe)), axis=0, copy=False
+            )
 
     def _validate_columns(self, columns: Sequence[str]) -> None:
         counter = collections.Counter(columns)
@@ -341,6 +962,8 @@ class PandasDataFrame(DataFrame):
                     f"Expected column names to be of type str, got {col} "
                     f"of type {type(col)}"
                 )
+        if isinstance(columns, pd.Index):
+            _cache_index(_VALIDATED_COLUMNS, columns)
 
     def _validate_index(self, index: pd.Index) -> None:
         pd.testing.assert_index_equal(self.dataframe.index, index)
@@ -372,9 +995,57 @@ class PandasDataFrame(DataFrame):
     def dataframe(self) -> pd.DataFrame:
         return self._dataframe
 
+    def to_backend(self, backend: str) -> tuple[DataFrame, list[str]]:
+        # Not part of the standard. Converts to another backend's standard-compliant
+        # DataFrame via Arrow, sharing the memory of numeric columns. Also returns the
+        # names of the columns which had to be copied.
+        if backend == "pandas":
+            return self, []
+        if backend != "polars":
+            raise ValueError(f"Unsupported backend: {backend}")
+        import polars as pl
+        import pyarrow as pa
+        import dataframe_api_compat.polars_standard
+
+        arrays = {}
+        copied = []
+        for name, ser in self.dataframe.items():
+            arrays[name], is_copy = _to_arrow(ser)
+            if is_copy:
+                copied.append(name)
+        return (
+            dataframe_api_compat.polars_standard.convert_to_standard_compliant_dataframe(
+                pl.DataFrame(pa.table(arrays))
+            ),
+            copied,
+        )
+
     def shape(self) -> tuple[int, int]:
         return self.dataframe.shape
 
+    def set_sorted(self, keys: Sequence[str]) -> PandasDataFrame:
+        # Not part of the standard. Marks the rows as sorted by `keys` in ascending
+        # order (by the first key, then ties by the second one, etc.), without nulls
+        # or NaN in them. This isn't checked. `sorted_indices` then doesn't need to
+        # sort, and `groupby` on these keys reduces runs of rows instead of hashing.
+        # The mark is kept by `slice_rows`, `get_rows_by_mask` and `concat`.
+        if isinstance(keys, str):
+            raise TypeError("Expected sequence of strings, got: str")
+        for key in keys:
+            if key not in self.dataframe.columns:
+                raise KeyError(f"key {key} not present in DataFrame's columns")
+        return PandasDataFrame(self.dataframe, sorted_by=keys)
+
+    def _is_sorted_by(self, keys: Sequence[str]) -> bool:
+        keys = tuple(keys)
+        if self._sorted_by[: len(keys)] == keys:
+            return True
+        if _is_sorted(self.dataframe, keys):
+            # The DataFrame is immutable, so later calls don't need to check again.
+            self._sorted_by = keys
+            return True
+        return False
+
     def groupby(self, keys: Sequence[str]) -> PandasGroupBy:
         if not isinstance(keys, collections.abc.Sequence):
             raise TypeError(f"Expected sequence of strings, got: {type(keys)}")
@@ -383,12 +1054,22 @@ class PandasDataFrame(DataFrame):
         for key in keys:
             if key not in self.get_column_names():
                 raise KeyError(f"key {key} not present in DataFrame's columns")
-        return PandasGroupBy(self.dataframe, keys)
+        return PandasGroupBy(
+            self.dataframe,
+            keys,
+            is_sorted=len(self.dataframe) >= _SEGMENT_REDUCTION_MIN_ROWS
+            and self._is_sorted_by(keys),
+        )
 
     def get_column_by_name(self, name: str) -> PandasColumn[DType]:
         if not isinstance(name, str):
             raise ValueError(f"Expected str, got: {type(name)}")
-        return PandasColumn(self.dataframe.loc[:, name])
+        # `df[name]` is much cheaper than `df.loc[:, name]`, as pandas caches the
+        # column.
+        column: PandasColumn[DType] = PandasColumn(self.dataframe[name])
+        if self._sorted_by[:1] == (name,):
+            column._sorted = True
+        return column
 
     def get_columns_by_name(self, names: Sequence[str]) -> PandasDataFrame:
         if isinstance(names, str):
@@ -402,18 +1083,13 @@ class PandasDataFrame(DataFrame):
     def slice_rows(
         self, start: int | None, stop: int | None, step: int | None
     ) -> PandasDataFrame:
-        if start is None:
-            start = 0
-        if stop is None:
-            stop = len(self.dataframe)
-        if step is None:
-            step = 1
-        return PandasDataFrame(self.dataframe.iloc[start:stop:step])
+        sorted_by = self._sorted_by if step is None or step > 0 else ()
+        return PandasDataFrame(self.dataframe.iloc[start:stop:step], sorted_by=sorted_by)
 
     def get_rows_by_mask(self, mask: Column[Bool]) -> PandasDataFrame:
         series = mask.column
         self._validate_index(series.index)
-        return PandasDataFrame(self.dataframe.loc[series, :])
+        return PandasDataFrame(self.dataframe.loc[series, :], sorted_by=self._sorted_by)
 
     def insert(self, loc: int, label: str, value: Column[Any]) -> PandasDataFrame:
         series = value.column
@@ -443,8 +1119,113 @@ class PandasDataFrame(DataFrame):
         ascending: Sequence[bool] | bool = True,
         nulls_position: Literal["first", "last"] = "last",
     ) -> PandasColumn[Any]:
-        df = self.dataframe.loc[:, list(keys)]
-        return PandasColumn(df.sort_values(keys).index.to_series())
+        ascending = _validate_sort_order(keys, ascending, nulls_position)
+        if all(ascending) and self._is_sorted_by(keys):
+            return PandasColumn(pd.Series(np.arange(len(self.dataframe))))
+        return PandasColumn(
+            pd.Series(_sorted_positions(self.dataframe, keys, ascending, nulls_position))
+        )
+
+    def top_k_indices(self, keys: Sequence[str], k: int) -> PandasColumn[Any]:
+        # Not part of the standard. Indices of the `k` rows with the largest values
+        # of `keys` (compared like in `sorted_indices`), largest first. Much faster
+        # than sorting everything when `k` is small, e.g. for leaderboards.
+        if isinstance(keys, str):
+            raise TypeError("Expected sequence of strings, got: str")
+        return PandasColumn(_k_indices(self.dataframe, keys, k, largest=True))
+
+    def bottom_k_indices(self, keys: Sequence[str], k: int) -> PandasColumn[Any]:
+        # Not part of the standard. Indices of the `k` rows with the smallest values
+        # of `keys`, smallest first.
+        if isinstance(keys, str):
+            raise TypeError("Expected sequence of strings, got: str")
+        return PandasColumn(
+            _k_indices(
+                self.dataframe,
+                keys,
+                k,
+                largest=False,
+                is_sorted=self._sorted_by[: len(keys)] == tuple(keys),
+            )
+        )
+
+    def join(
+        self,
+        other: DataFrame,
+        left_on: Sequence[str],
+        right_on: Sequence[str],
+        how: Literal["inner", "left", "outer"] = "inner",
+    ) -> PandasDataFrame:
+        # Not part of the standard. Joins the rows of `other` whose `right_on` keys
+        # equal the `left_on` keys, like `pd.merge`. The result has the columns of
+        # this DataFrame, then those of `other` apart from its keys. Missing values
+        # match each other, and an outer join fills in the keys from `other`.
+        if not isinstance(other, PandasDataFrame):
+            raise TypeError(f"Expected PandasDataFrame, got: {type(other)}")
+        _validate_join(self.dataframe, other.dataframe, left_on, right_on, how)
+        right = other.dataframe
+        if list(right_on) != list(left_on):
+            # Joining on columns of the same names means pandas keeps one copy of
+            # the keys. Renaming doesn't copy any data.
+            right = right.rename(columns=dict(zip(right_on, left_on)), copy=False)
+        # The result comes with a fresh RangeIndex, so doesn't need resetting. Only
+        # a left join keeps the order of this DataFrame's rows - an inner join
+        # groups them by key.
+        return PandasDataFrame(
+            pd.merge(self.dataframe, right, how=how, on=list(left_on), copy=False),
+            sorted_by=self._sorted_by if how == "left" else (),
+        )
+
+    def join_asof(
+        self,
+        other: DataFrame,
+        left_on: str,
+        right_on: str,
+        *,
+        left_by: Sequence[str] = (),
+        right_by: Sequence[str] = (),
+        direction: Literal["backward", "forward", "nearest"] = "backward",
+    ) -> PandasDataFrame:
+        # Not part of the standard. Joins each row with the row of `other` whose
+        # `right_on` value is the closest one at or before its `left_on` value (at or
+        # after it for "forward", either for "nearest"), among rows with equal
+        # `left_by` / `right_by` keys, like `pd.merge_asof`. Both DataFrames need to
+        # be sorted by their `on` keys, without missing values. This is checked
+        # once per DataFrame (or not at all after `set_sorted`), and then the join
+        # is a single merge-like pass over both. The columns are like for `join`.
+        if not isinstance(other, PandasDataFrame):
+            raise TypeError(f"Expected PandasDataFrame, got: {type(other)}")
+        _validate_asof_join(left_on, right_on, left_by, right_by, direction)
+        left_keys = [left_on, *left_by]
+        right_keys = [right_on, *right_by]
+        _validate_join(self.dataframe, other.dataframe, left_keys, right_keys, "left")
+        if not self._is_sorted_by([left_on]):
+            raise ValueError(f"Expected DataFrame sorted by {left_on}, without nulls")
+        if not other._is_sorted_by([right_on]):
+            raise ValueError(
+                f"Expected other DataFrame sorted by {right_on}, without nulls"
+            )
+        left = self.dataframe
+        right = other.dataframe.rename(
+            columns=dict(zip(right_keys, left_keys)), copy=False
+        )
+        on = left[left_on]
+        masked = is_extension_array_dtype(on.dtype) or is_extension_array_dtype(
+            right[left_on].dtype
+        )
+        if masked:
+            # pandas can't join on masked arrays, but there are no nulls to mask.
+            # Shallow copies, so the keys can be replaced without copying the rest.
+            left = left.copy(deep=False)
+            right = right.copy(deep=False)
+            left[left_on] = _to_numpy(on)
+            right[left_on] = _to_numpy(right[left_on])
+        result = pd.merge_asof(
+            left, right, on=left_on, by=list(left_by) or None, direction=direction
+        )
+        if masked:
+            result[left_on] = on.array
+        return PandasDataFrame(result, sorted_by=self._sorted_by)
 
     def __eq__(self, other: DataFrame | Any) -> PandasDataFrame:  # type: ignore[override]
         if isinstance(other, PandasDataFrame):
@@ -542,6 +1323,68 @@ class PandasDataFrame(DataFrame):
     def __iter__(self) -> NoReturn:
         raise NotImplementedError()
 
+    def _reduce(self, reduction: str) -> PandasDataFrame:
+        df = self.dataframe
+        if df.shape[1] == 0:
+            return PandasDataFrame(getattr(df, reduction)().to_frame().T)
+        if df.size >= _PARALLEL_REDUCTION_MIN_SIZE:
+            n_workers = min(os.cpu_count() or 1, df.shape[1])
+        else:
+            n_workers = 1
+        # Reduce the columns of each dtype together, wherever they sit in the
+        # frame, so that the 1-row results keep their dtype (transposing a
+        # mixed-dtype result would upcast it or give object dtype).
+        groups: dict[Any, list[int]] = {}
+        for position, dtype in enumerate(df.dtypes):
+            groups.setdefault(dtype, []).append(position)
+        if len(groups) > _MAX_REDUCTION_DTYPE_GROUPS:
+            return PandasDataFrame(getattr(df, reduction)().to_frame().T.infer_objects())
+        chunk_size = -(-df.shape[1] // n_workers)
+        positions = []
+        chunks = []
+        for group in groups.values():
+            for start in range(0, len(group), chunk_size):
+                positions.extend(group[start : start + chunk_size])
+                chunks.append(df.iloc[:, group[start : start + chunk_size]])
+
+        def reduce_chunk(chunk: pd.DataFrame) -> pd.DataFrame:
+            return getattr(chunk, reduction)().to_frame().T
+
+        if n_workers > 1:
+            # NumPy releases the GIL while reducing, so threads run in parallel.
+            with concurrent.futures.ThreadPoolExecutor(n_workers) as executor:
+                results = list(executor.map(reduce_chunk, chunks))
+        else:
+            results = [reduce_chunk(chunk) for chunk in chunks]
+        if len(results) == 1:
+            return PandasDataFrame(results[0])
+        result = pd.concat(results, axis=1)
+        return PandasDataFrame(result.iloc[:, np.argsort(positions, kind="stable")])
+
+    def describe(
+        self,
+        statistics: Sequence[str] = ("min", "max", "mean", "std", "null_count", "sum"),
+    ) -> PandasDataFrame:
+        # Not part of the standard. Returns one row per statistic, labelled by
+        # the "statistic" column, computed in a single pass over each column.
+        # Like `pd.DataFrame.describe`, non-numeric columns are skipped.
+        for statistic in statistics:
+            if statistic not in _DESCRIBE_STATISTICS:
+                raise ValueError(f"Unsupported statistic: {statistic}")
+        result: dict[str, Any] = {"statistic": list(statistics)}
+        for column, ser in self.dataframe.items():
+            if not is_numeric_dtype(ser.dtype) or is_bool_dtype(ser.dtype):
+                continue
+            described = _describe_column(ser.array)
+            if "null_count" in statistics:
+                described["null_count"] = (
+                    ser.isnull().sum() if is_extension_array_dtype(ser.dtype) else 0
+                )
+            result[column] = np.array(
+                [described[statistic] for statistic in statistics], dtype="float64"
+            )
+        return PandasDataFrame(pd.DataFrame(result))
+
     def any(self, *, skip_nulls: bool = True) -> PandasDataFrame:
         self._validate_booleanness()
         return PandasDataFrame(self.dataframe.any().to_frame().T)
@@ -559,48 +1402,72 @@ class PandasDataFrame(DataFrame):
         return PandasColumn(self.dataframe.all(axis=1))
 
     def min(self, *, skip_nulls: bool = True) -> PandasDataFrame:
-        return PandasDataFrame(self.dataframe.min().to_frame().T)
+        return self._reduce("min")
 
     def max(self, *, skip_nulls: bool = True) -> PandasDataFrame:
-        return PandasDataFrame(self.dataframe.max().to_frame().T)
+        return self._reduce("max")
 
     def sum(self, *, skip_nulls: bool = True) -> PandasDataFrame:
-        return PandasDataFrame(self.dataframe.sum().to_frame().T)
+        return self._reduce("sum")
 
     def prod(self, *, skip_nulls: bool = True) -> PandasDataFrame:
-        return PandasDataFrame(self.dataframe.prod().to_frame().T)
+        return self._reduce("prod")
 
     def median(self, *, skip_nulls: bool = True) -> PandasDataFrame:
-        return PandasDataFrame(self.dataframe.median().to_frame().T)
+        return self._reduce("median")
 
     def mean(self, *, skip_nulls: bool = True) -> PandasDataFrame:
-        return PandasDataFrame(self.dataframe.mean().to_frame().T)
+        return self._reduce("mean")
 
     def std(self, *, skip_nulls: bool = True) -> PandasDataFrame:
-        return PandasDataFrame(self.dataframe.std().to_frame().T)
+        return self._reduce("std")
 
     def var(self, *, skip_nulls: bool = True) -> PandasDataFrame:
-        return PandasDataFrame(self.dataframe.var().to_frame().T)
+        return self._reduce("var")
+
+    def _is_masked(self) -> np.ndarray[Any, Any]:
+        # Which columns are backed by masked arrays. Only these can contain nulls,
+        # in NumPy-backed columns missing values are represented by NaN.
+        return self.dataframe.dtypes.map(is_extension_array_dtype).to_numpy(bool)
+
+    def _fill_masked(
+        self,
+        result: np.ndarray[Any, Any],
+        masked: np.ndarray[Any, Any],
+        function: Callable[[pd.Series[Any]], np.ndarray[Any, Any]],
+    ) -> None:
+        # pandas keeps each masked column as a separate 1-D array, so there's no
+        # 2-D block to operate on. `function` maps each one to its 1-D result, and
+        # these are written into the columns of `result` in one go.
+        columns = [
+            function(ser)
+            for (_, ser), is_masked in zip(self.dataframe.items(), masked)
+            if is_masked
+        ]
+        if masked.all():
+            np.stack(columns, axis=1, out=result)
+        else:
+            result[:, masked] = np.stack(columns, axis=1)
 
     def is_null(self, *, skip_nulls: bool = True) -> PandasDataFrame:
-        result = []
-        for column in self.dataframe.columns:
-            if is_extension_array_dtype(self.dataframe[column].dtype):
-                result.append(self.dataframe[column].isnull())
-            else:
-                result.append(pd.Series(np.array([False] * self.shape()[0]), name=column))
-        return PandasDataFrame(pd.concat(result, axis=1))
+        df = self.dataframe
+        masked = self._is_masked()
+        # Fortran order, so that each column is contiguous and pandas can use
+        # `result` as a single block without copying it.
+        result = np.zeros(df.shape, dtype=bool, order="F")
+        if masked.any():
+            self._fill_masked(result, masked, lambda ser: ser.array.isna())
+        return PandasDataFrame(pd.DataFrame(result, columns=df.columns))
 
     def is_nan(self) -> PandasDataFrame:
-        result = []
-        for column in self.dataframe.columns:
-            if is_extension_array_dtype(self.dataframe[column].dtype):
-                result.append(
-                    np.isnan(self.dataframe[column]).replace(pd.NA, False).astype(bool)
-                )
-            else:
-                result.append(self.dataframe[column].isna())
-        return PandasDataFrame(pd.concat(result, axis=1))
+        df = self.dataframe
+        masked = self._is_masked()
+        result = np.empty(df.shape, dtype=bool, order="F")
+        if not masked.all():
+            result[:, ~masked] = df.iloc[:, ~masked].isna().to_numpy()
+        if masked.any():
+            self._fill_masked(result, masked, _masked_is_nan)
+        return PandasDataFrame(pd.DataFrame(result, columns=df.columns))
 
     def fill_nan(
         self, value: float | pd.NAType  # type: ignore[name-defined]
@@ -610,5 +1477,8 @@ class PandasDataFrame(DataFrame):
         return PandasDataFrame(df)
 
 
+dataframe_api_compat.profiling.register(PandasColumn, PandasGroupBy, PandasDataFrame)
+
+
 # missing: min, max, prod, etc...
 # ok, break, then do that?
@@ -5,7 +5,7 @@ from dataframe_api_compat.polars_standard.polars_standard import (
 )
 
 import polars as pl
-from typing import Any, Sequence
+from typing import Any, Iterable, Sequence
 
 
 class Int64:
@@ -51,11 +51,45 @@ def _map_standard_to_polars_dtypes(dtype: Any) -> pl.DataType:
     raise AssertionError(f"Unknown dtype: {dtype}")
 
 
-def concat(dataframes: Sequence[PolarsDataFrame]) -> PolarsDataFrame:
+def _map_standard_to_numpy_dtypes(dtype: Any) -> str:
+    if isinstance(dtype, Int64):
+        return "int64"
+    if isinstance(dtype, Int32):
+        return "int32"
+    if isinstance(dtype, Float64):
+        return "float64"
+    if isinstance(dtype, Float32):
+        return "float32"
+    if isinstance(dtype, Bool):
+        return "bool"
+    raise AssertionError(f"Unknown dtype: {dtype}")
+
+
+def concat(dataframes: Iterable[PolarsDataFrame]) -> PolarsDataFrame:
     dfs = []
+    # The result is still sorted by the keys which all inputs are sorted by, as long
+    # as no input starts before the previous non-empty one ended (`last`).
+    sorted_by: tuple[str, ...] | None = None
+    last: list[Any] | None = None
     for _df in dataframes:
         dfs.append(_df.dataframe)
-    return PolarsDataFrame(pl.concat(dfs))
+        if sorted_by is None:
+            sorted_by = _df._sorted_by
+        while _df._sorted_by[: len(sorted_by)] != sorted_by:
+            sorted_by = sorted_by[:-1]
+        if isinstance(_df.dataframe, pl.LazyFrame):
+            # We'd need to compute its first and last rows.
+            sorted_by = ()
+        elif sorted_by and len(_df.dataframe) > 0:
+            first = [_df.dataframe[key][0] for key in sorted_by]
+            if last is not None and last[: len(sorted_by)] > first:
+                sorted_by = ()
+            last = [_df.dataframe[key][-1] for key in sorted_by]
+    if any(isinstance(df, pl.LazyFrame) for df in dfs):
+        dfs = [df.lazy() for df in dfs]
+    return PolarsDataFrame(
+        pl.concat(dfs), sorted_by=sorted_by or ()  # type: ignore[type-var]
+    )
 
 
 def dataframe_from_dict(data: dict[str, PolarsColumn[Any]]) -> PolarsDataFrame:
@@ -68,5 +102,40 @@ def column_from_sequence(sequence: Sequence[Any], dtype: Any) -> PolarsColumn[An
     return PolarsColumn(pl.Series(sequence, dtype=_map_standard_to_polars_dtypes(dtype)))
 
 
-def convert_to_standard_compliant_dataframe(df: pl.DataFrame) -> PolarsDataFrame:
+def column_from_1d_array(
+    array: Any, dtype: Any, mask: Any | None = None
+) -> PolarsColumn[Any]:
+    # Not part of the standard. `array` can be a NumPy array or anything supporting
+    # the buffer protocol, and is only copied if its dtype doesn't match `dtype`.
+    # The values are handed to polars as Arrow buffers, which polars adopts
+    # without copying. Booleans (and `mask`, True where valid) are bit-packed.
+    # polars doesn't need NumPy, so it's only imported here.
+    import numpy as np
+    import pyarrow as pa  # type: ignore[import]
+
+    values = np.asarray(array, dtype=_map_standard_to_numpy_dtypes(dtype))
+    if values.ndim != 1:
+        raise ValueError(f"Expected 1D array, got {values.ndim}D")
+    values = np.ascontiguousarray(values)
+    validity = None
+    if mask is not None:
+        mask = np.asarray(mask, dtype=bool)
+        if mask.shape != values.shape:
+            raise ValueError(
+                f"Expected mask of length {len(values)}, got shape {mask.shape}"
+            )
+        validity = pa.py_buffer(np.packbits(mask, bitorder="little"))
+    if values.dtype == bool:
+        data = pa.py_buffer(np.packbits(values, bitorder="little"))
+    else:
+        data = pa.py_buffer(values)
+    arrow_array = pa.Array.from_buffers(
+        pa.from_numpy_dtype(values.dtype), len(values), [validity, data]
+    )
+    return PolarsColumn(pl.Series(arrow_array))
+
+
+def convert_to_standard_compliant_dataframe(
+    df: pl.DataFrame | pl.LazyFrame,
+) -> PolarsDataFrame:
     return PolarsDataFrame(df)
@@ -1,5 +1,6 @@
 from __future__ import annotations
 import dataframe_api_compat.polars_standard
+import dataframe_api_compat.profiling
 import collections
 
 from typing import (
@@ -27,18 +28,206 @@ if TYPE_CHECKING:
 else:
 
     class DataFrame(Generic[DType]):
-        ...
+        __slots__ = ()
 
     class Column(Generic[DType]):
-        ...
+        __slots__ = ()
 
     class GroupBy:
-        ...
+        __slots__ = ()
+
+
+def _is_sorted(df: pl.DataFrame, keys: Sequence[str]) -> bool:
+    # Whether `df` is sorted by `keys` in ascending order (by the first key, then
+    # ties by the second one, etc.), without missing values (nulls and NaN) in
+    # them. Checked in a single O(n) pass, unless polars already flagged a single
+    # key as sorted - which it also does for floats with NaN, so they're checked
+    # for NaN first.
+    for key in keys:
+        ser = df[key]
+        if ser.null_count() > 0:
+            return False
+        if ser.dtype in (pl.Float32, pl.Float64) and ser.is_nan().any():
+            return False
+    if len(keys) == 1 and df[keys[0]].flags["SORTED_ASC"]:
+        return True
+    # Each row has to be >= the one before it on the first key it isn't tied on.
+    in_order = pl.lit(True)
+    tied = pl.lit(True)
+    for key in keys:
+        previous = pl.col(key).shift(1)
+        in_order = in_order & (~tied | (pl.col(key) >= previous))
+        tied = tied & (pl.col(key) == previous)
+    return df.select(in_order.slice(1).all()).item()  # type: ignore[no-any-return]
+
+
+def _validate_sort_order(
+    keys: Sequence[str], ascending: Sequence[bool] | bool, nulls_position: str
+) -> list[bool]:
+    # Returns whether to sort each key in descending order, as polars expects.
+    if nulls_position not in ("first", "last"):
+        raise ValueError(f"Expected 'first' or 'last', got: {nulls_position}")
+    if isinstance(ascending, bool):
+        return [not ascending] * len(keys)
+    if len(ascending) != len(keys):
+        raise ValueError(
+            f"Expected {len(keys)} values for `ascending`, got {len(ascending)}"
+        )
+    return [not key_ascending for key_ascending in ascending]
+
+
+def _sort_by(
+    df: pl.DataFrame | pl.LazyFrame,
+    keys: Sequence[str],
+    descending: list[bool],
+    nulls_last: bool,
+) -> tuple[list[pl.Expr], list[bool]]:
+    # Expressions to sort `df` (with a "row_nr" column added) by, and whether to
+    # sort each in descending order. NaN counts as missing, like in pandas. polars
+    # 0.18 doesn't reliably order rows with nulls by the later keys, nor honour
+    # `nulls_last` in descending order, so keys with missing values are preceded
+    # by whether they're missing. Checking a LazyFrame for them would mean
+    # computing it, so its keys are assumed to have some. Ties are broken by
+    # "row_nr", so the sort is stable - except for a single key, which polars
+    # sorts stably by itself.
+    schema = df.schema
+    by = []
+    flags = []
+    for key, key_descending in zip(keys, descending):
+        expr = pl.col(key)
+        is_float = schema[key] in (pl.Float32, pl.Float64)
+        if isinstance(df, pl.LazyFrame):
+            has_nulls, has_nan = True, is_float
+        else:
+            has_nulls = df[key].null_count() > 0
+            has_nan = is_float and bool(df[key].is_nan().any())
+        if (
+            len(keys) == 1
+            and not has_nan
+            and not (has_nulls and (key_descending or nulls_last))
+        ):
+            # Any nulls go first, which is where polars puts them by default.
+            return [expr], [key_descending]
+        if has_nan:
+            expr = expr.fill_nan(None)
+        if has_nulls or has_nan:
+            by.append(expr.is_null())
+            flags.append(not nulls_last)
+        by.append(expr)
+        flags.append(key_descending)
+    return [*by, pl.col("row_nr")], [*flags, False]
+
+
+def _k_indices(
+    df: pl.DataFrame | pl.LazyFrame,
+    keys: Sequence[str],
+    k: int,
+    *,
+    largest: bool,
+    is_sorted: bool = False,
+) -> pl.Series:
+    # Positions of the `k` rows with the largest (or smallest) values of `keys`, in
+    # that order, with ties in their original order and missing values (nulls and
+    # NaN) last. `DataFrame.top_k` sorts everything, but `Expr.top_k` on a single
+    # column doesn't, so that's used to find the k-th value of the first key, and
+    # only rows at least as good get sorted.
+    if not isinstance(k, int) or k < 0:
+        raise ValueError(f"Expected non-negative integer, got: {k}")
+    if is_sorted and not largest:
+        # `df` is known to be sorted by `keys`.
+        n_rows = _collect(df.select(pl.count())).item()
+        return pl.arange(0, min(k, n_rows), eager=True, dtype=pl.UInt32)
+    schema = df.schema
+    by = [
+        pl.col(key).fill_nan(None)
+        if schema[key] in (pl.Float32, pl.Float64)
+        else pl.col(key)
+        for key in keys
+    ]
+    present = by[0].drop_nulls()
+    if largest:
+        candidates = by[0] >= present.top_k(k).min()
+    else:
+        candidates = by[0] <= present.bottom_k(k).max()
+    # If there are fewer than `k` present values, some missing ones are needed too.
+    candidates = candidates.fill_null(False) | (present.count() < k)
+    sort_by, descending = _sort_by(df, keys, [largest] * len(keys), True)
+    result = (
+        df.with_row_count()
+        .filter(candidates)
+        .sort(sort_by, descending=descending)
+        .head(k)
+    )
+    return _collect(result.select("row_nr"))["row_nr"]
+
+
+def _validate_join(
+    left: dict[str, Any],
+    right: dict[str, Any],
+    left_on: Sequence[str],
+    right_on: Sequence[str],
+    how: str,
+) -> None:
+    # `left` and `right` are the schemas of the DataFrames to join.
+    if how not in ("inner", "left", "outer"):
+        raise ValueError(f"Unsupported join type: {how}")
+    if isinstance(left_on, str) or isinstance(right_on, str):
+        raise TypeError("Expected sequence of strings, got: str")
+    if len(left_on) != len(right_on):
+        raise ValueError(
+            f"Expected as many keys in `right_on` as in `left_on`, got {len(right_on)} "
+            f"and {len(left_on)}"
+        )
+    if not left_on:
+        raise ValueError("Expected at least one key to join on")
+    for key in left_on:
+        if key not in left:
+            raise KeyError(f"key {key} not present in DataFrame's columns")
+    for key in right_on:
+        if key not in right:
+            raise KeyError(f"key {key} not present in other DataFrame's columns")
+    for left_key, right_key in zip(left_on, right_on):
+        if left[left_key] != right[right_key]:
+            raise ValueError(
+                f"Key {right_key} has dtype {right[right_key]}, but {left_key} has "
+                f"dtype {left[left_key]}"
+            )
+    for col in right:
+        if col not in right_on and col in left:
+            raise ValueError(
+                f"Expected unique column names, got {col} in both DataFrames"
+            )
+
+
+def _validate_asof_join(
+    left_on: str,
+    right_on: str,
+    left_by: Sequence[str],
+    right_by: Sequence[str],
+    direction: str,
+) -> None:
+    # The rest is checked by `_validate_join`, as for the equi-join on `left_by`.
+    if direction not in ("backward", "forward", "nearest"):
+        raise ValueError(f"Unsupported direction: {direction}")
+    if not isinstance(left_on, str) or not isinstance(right_on, str):
+        raise TypeError(f"Expected str, got: {type(left_on)} and {type(right_on)}")
+    if isinstance(left_by, str) or isinstance(right_by, str):
+        raise TypeError("Expected sequence of strings, got: str")
+    if len(left_by) != len(right_by):
+        raise ValueError(
+            f"Expected as many keys in `right_by` as in `left_by`, got {len(right_by)} "
+            f"and {len(left_by)}"
+        )
 
 
 class PolarsColumn(Column[DType]):
+    __slots__ = ("_series", "_membership", "_sorted")
+
     def __init__(self, column: pl.Series) -> None:
         self._series = column
+        self._membership: tuple[pl.Series, bool, bool] | None = None
+        # Whether the column is sorted in ascending order, if known.
+        self._sorted: bool | None = None
 
     # In the standard
     def __column_namespace__(self, *, api_version: str | None = None) -> Any:
@@ -66,14 +255,82 @@ class PolarsColumn(Column[DType]):
     def __iter__(self) -> NoReturn:
         raise NotImplementedError()
 
+    def _get_membership(self) -> tuple[pl.Series, bool, bool]:
+        # Sorted unique values (without nulls and NaN), and whether there were
+        # any nulls / NaN. Columns are immutable, so this is computed once, and
+        # repeated `is_in` calls against the same column (e.g. an allow-list)
+        # are binary searches instead of rebuilding a hash table each time.
+        if self._membership is None:
+            values = self.column.drop_nulls()
+            has_nan = False
+            if values.is_float():
+                has_nan = values.is_nan().any()
+                values = values.filter(values.is_not_nan())
+            self._membership = (
+                values.unique().sort(),
+                self.column.null_count() > 0,
+                has_nan,
+            )
+        return self._membership
+
     def is_in(self, values: Column[DType]) -> PolarsColumn[Bool]:
         if values.dtype != self.dtype:
             raise ValueError(f"`value` has dtype {values.dtype}, expected {self.dtype}")
-        return PolarsColumn(self.column.is_in(values.column))
+        # Values are compared with `==`, so -0.0 and 0.0 match each other, like in
+        # the pandas backend (whereas `pl.Series.is_in` tells them apart).
+        sorted_values, has_null, has_nan = values._get_membership()
+        column = self.column
+        if column.dtype == pl.Boolean:
+            # polars can't binary-search booleans.
+            column, sorted_values = column.cast(pl.UInt8), sorted_values.cast(pl.UInt8)
+        if len(sorted_values) == 0:
+            result = column.is_null() & has_null
+        else:
+            indices = sorted_values.search_sorted(column)
+            candidates = sorted_values.take(indices.clip_max(len(sorted_values) - 1))
+            result = candidates == column
+        if has_nan:
+            result = result | column.is_nan()
+        return PolarsColumn(result.fill_null(has_null))
+
+    def set_sorted(self) -> PolarsColumn[DType]:
+        # Not part of the standard. Marks the column as sorted in ascending order
+        # (without nulls), without checking, so that e.g. `sorted_indices` doesn't
+        # need to sort it.
+        result: PolarsColumn[DType] = PolarsColumn(self.column.set_sorted())
+        result._sorted = True
+        return result
+
+    def _is_sorted(self) -> bool:
+        # Columns are immutable, so this is only checked once.
+        if self._sorted is None:
+            self._sorted = _is_sorted(self.column.to_frame(), [self.column.name])
+            if self._sorted:
+                # polars has fast paths of its own for columns flagged as sorted.
+                self._series = self.column.set_sorted()
+        return self._sorted
+
+    def top_k_indices(self, k: int) -> PolarsColumn[Any]:
+        # Not part of the standard. Like the first `k` of `sorted_indices` in
+        # descending order, but without sorting the whole column.
+        df = self.column.to_frame("values")
+        return PolarsColumn(_k_indices(df, ["values"], k, largest=True))
+
+    def bottom_k_indices(self, k: int) -> PolarsColumn[Any]:
+        # Not part of the standard. Like the first `k` of `sorted_indices`, but
+        # without sorting the whole column.
+        df = self.column.to_frame("values")
+        return PolarsColumn(
+            _k_indices(df, ["values"], k, largest=False, is_sorted=bool(self._sorted))
+        )
 
     def unique_indices(self, *, skip_nulls: bool = True) -> PolarsColumn[Any]:
         df = self.column.to_frame()
         keys = df.columns
+        if self._is_sorted():
+            # Duplicates are next to each other, so there's no need to hash.
+            changed = (pl.col(keys[0]) != pl.col(keys[0]).shift(1)).fill_null(True)
+            return PolarsColumn(df.select(changed.arg_true()).to_series())
         return PolarsColumn(df.with_row_count().unique(keys)["row_nr"])
 
     def is_null(self) -> PolarsColumn[Bool]:
@@ -205,16 +462,40 @@ class PolarsColumn(Column[DType]):
     def sorted_indices(
         self, *, ascending: bool = True, nulls_position: Literal["first", "last"] = "last"
     ) -> PolarsColumn[Any]:
-        df = self.column.to_frame()
-        keys = df.columns
-        return PolarsColumn(df.with_row_count().sort(keys, descending=False)["row_nr"])
+        (descending,) = _validate_sort_order(["values"], ascending, nulls_position)
+        if not descending and self._is_sorted():
+            return PolarsColumn(pl.arange(0, len(self), eager=True, dtype=pl.UInt32))
+        # NaN counts as missing, like in `PolarsDataFrame.sorted_indices`.
+        df = self.column.to_frame("values")
+        by, flags = _sort_by(df, ["values"], [descending], nulls_position == "last")
+        return PolarsColumn(df.with_row_count().sort(by, descending=flags)["row_nr"])
 
     def fill_nan(self, value: float | null) -> PolarsColumn[DType]:
         return PolarsColumn(self.column.fill_nan(value))  # type: ignore[arg-type]
 
 
+_DESCRIBE_STATISTICS = ("min", "max", "mean", "std", "var", "null_count", "sum")
+
+# standard reduction -> polars expression method
+_GROUPBY_AGGREGATIONS = {
+    "any": "any",
+    "all": "all",
+    "min": "min",
+    "max": "max",
+    "sum": "sum",
+    "prod": "product",
+    "median": "median",
+    "mean": "mean",
+    "std": "std",
+    "var": "var",
+    "size": "count",
+}
+
+
 class PolarsGroupBy(GroupBy):
-    def __init__(self, df: pl.DataFrame, keys: Sequence[str]) -> None:
+    __slots__ = ("df", "keys")
+
+    def __init__(self, df: pl.DataFrame | pl.LazyFrame, keys: Sequence[str]) -> None:
         for key in keys:
             if key not in df.columns:
                 raise KeyError(f"key {key} not present in DataFrame's columns")
@@ -265,28 +546,190 @@ class PolarsGroupBy(GroupBy):
         result = self.df.groupby(self.keys).agg(pl.col("*").var())
         return PolarsDataFrame(result)
 
+    def aggregate(self, aggregations: Mapping[str, tuple[str, str]]) -> PolarsDataFrame:
+        # Not part of the standard (yet). Computes several reductions in a
+        # single groupby, e.g. `{"b_sum": ("b", "sum"), "b_size": ("b", "size")}`.
+        if not isinstance(aggregations, collections.abc.Mapping):
+            raise TypeError(f"Expected Mapping, got: {type(aggregations)}")
+        columns = self.df.columns
+        exprs = []
+        for name, (column, reduction) in aggregations.items():
+            if column not in columns:
+                raise KeyError(f"column {column} not present in DataFrame's columns")
+            if reduction not in _GROUPBY_AGGREGATIONS:
+                raise ValueError(f"Unsupported reduction: {reduction}")
+            if reduction == "size":
+                exprs.append(pl.count().alias(name))
+            else:
+                expr = getattr(pl.col(column), _GROUPBY_AGGREGATIONS[reduction])()
+                exprs.append(expr.alias(name))
+        return PolarsDataFrame(self.df.groupby(self.keys).agg(exprs))
+
+
+def _collect(df: pl.DataFrame | pl.LazyFrame) -> pl.DataFrame:
+    if isinstance(df, pl.LazyFrame):
+        return df.collect()
+    return df
+
+
+def _from_arrow(column: Any) -> tuple[Any, bool]:
+    # Converts an Arrow ChunkedArray to a NumPy array, or to a masked array if it
+    # contains nulls, and also returns whether the data had to be copied. Numeric
+    # data is used as it is, but e.g. booleans need unpacking from bits to bytes.
+    import numpy as np
+    import pandas as pd
+    import pyarrow as pa  # type: ignore[import]
+
+    copied = column.num_chunks != 1
+    chunk = column.combine_chunks() if copied else column.chunk(0)
+    numeric = pa.types.is_integer(chunk.type) or pa.types.is_floating(chunk.type)
+    if chunk.null_count and pa.types.is_boolean(chunk.type):
+        mask = chunk.is_null().to_numpy(zero_copy_only=False)
+        values = chunk.fill_null(False).to_numpy(zero_copy_only=False)
+        return pd.arrays.BooleanArray(values, mask), True
+    if chunk.null_count and numeric:
+        mask = chunk.is_null().to_numpy(zero_copy_only=False)
+        dtype = np.dtype(chunk.type.to_pandas_dtype())
+        values = np.frombuffer(
+            chunk.buffers()[1],
+            dtype=dtype,
+            count=len(chunk),
+            offset=chunk.offset * dtype.itemsize,
+        )
+        if pa.types.is_integer(chunk.type):
+            result = pd.arrays.IntegerArray(values, mask)
+        else:
+            result = pd.arrays.FloatingArray(values, mask)
+    else:
+        values = result = chunk.to_numpy(zero_copy_only=False)
+    data = chunk.buffers()[1]
+    copied = (
+        copied
+        or not numeric
+        or values.ctypes.data != data.address + chunk.offset * values.itemsize
+    )
+    return result, copied
+
 
 class PolarsDataFrame(DataFrame):
-    def __init__(self, df: pl.DataFrame) -> None:
+    __slots__ = ("df", "_sorted_by")
+
+    def __init__(
+        self, df: pl.DataFrame | pl.LazyFrame, *, sorted_by: Sequence[str] = ()
+    ) -> None:
         # columns already have to be strings, and duplicates aren't
         # allowed, so no validation required
+        # If `df` is a LazyFrame, methods which return a DataFrame only extend
+        # the query plan; nothing is computed until `collect` is called, or
+        # until a method needs actual values (e.g. one returning a Column).
         self.df = df
+        # Keys which the rows are known to be sorted by (see `set_sorted`).
+        self._sorted_by = tuple(sorted_by)
+
+    def _is_lazy(self, other: Any = None) -> bool:
+        if isinstance(other, PolarsDataFrame) and isinstance(
+            other.dataframe, pl.LazyFrame
+        ):
+            return True
+        return isinstance(self.df, pl.LazyFrame)
+
+    def _binary_op_lazy(self, other: DataFrame | Any, op: str) -> PolarsDataFrame:
+        columns = self.get_column_names()
+        if isinstance(other, PolarsDataFrame):
+            if other.get_column_names() != columns:
+                raise ValueError("Expected DataFrame with matching columns.")
+            right = other.dataframe.lazy().select(pl.all().suffix("_right"))
+            return PolarsDataFrame(
+                self.df.lazy()
+                .with_context(right)
+                .select(
+                    getattr(pl.col(col), op)(pl.col(f"{col}_right")) for col in columns
+                )
+            )
+        return PolarsDataFrame(
+            self.df.lazy().select(getattr(pl.col(col), op)(other) for col in columns)
+        )
 
     def __dataframe_namespace__(self, *, api_version: str | None = None) -> Any:
         return dataframe_api_compat.polars_standard
 
     @property
-    def dataframe(self) -> pl.DataFrame:
+    def dataframe(self) -> pl.DataFrame | pl.LazyFrame:
         return self.df
 
+    def collect(self) -> PolarsDataFrame:
+        return PolarsDataFrame(_collect(self.df))
+
+    def to_backend(self, backend: str) -> tuple[DataFrame, list[str]]:
+        # Not part of the standard. Converts to another backend's standard-compliant
+        # DataFrame via Arrow, sharing the memory of numeric columns. Also returns the
+        # names of the columns which had to be copied. Columns without nulls become
+        # NumPy-backed, columns with nulls become nullable.
+        if backend == "polars":
+            return self, []
+        if backend != "pandas":
+            raise ValueError(f"Unsupported backend: {backend}")
+        import pandas as pd
+        import dataframe_api_compat.pandas_standard
+
+        table = _collect(self.df).to_arrow()
+        arrays = {}
+        copied = []
+        for name, column in zip(table.column_names, table.columns):
+            arrays[name], is_copy = _from_arrow(column)
+            if is_copy:
+                copied.append(name)
+        return (
+            dataframe_api_compat.pandas_standard.convert_to_standard_compliant_dataframe(
+                pd.DataFrame(arrays, copy=False)
+            ),
+            copied,
+        )
+
     def shape(self) -> tuple[int, int]:
+        if isinstance(self.df, pl.LazyFrame):
+            return self.df.select(pl.count()).collect().item(), len(self.df.columns)
         return self.df.shape
 
+    def set_sorted(self, keys: Sequence[str]) -> PolarsDataFrame:
+        # Not part of the standard. Trusts the caller that the rows are sorted by
+        # `keys` (ascending, without nulls), like `pl.Series.set_sorted`, so that
+        # `sorted_indices` can skip sorting and `groupby` on a single key takes
+        # polars' fast path. `slice_rows`, `get_rows_by_mask` and `concat` keep it.
+        if isinstance(keys, str):
+            raise TypeError("Expected sequence of strings, got: str")
+        for key in keys:
+            if key not in self.df.columns:
+                raise KeyError(f"key {key} not present in DataFrame's columns")
+        return PolarsDataFrame(self.df, sorted_by=keys)
+
+    def _is_sorted_by(self, keys: Sequence[str]) -> bool:
+        keys = tuple(keys)
+        if self._sorted_by[: len(keys)] == keys:
+            return True
+        # Checking a LazyFrame would mean computing it.
+        if isinstance(self.df, pl.DataFrame) and _is_sorted(self.df, keys):
+            # The DataFrame is immutable, so later calls don't need to check again.
+            self._sorted_by = keys
+            return True
+        return False
+
     def groupby(self, keys: Sequence[str]) -> PolarsGroupBy:
-        return PolarsGroupBy(self.df, keys)
+        groupby = PolarsGroupBy(self.df, keys)
+        if len(keys) == 1 and self._is_sorted_by(keys):
+            # polars groups by a single key without hashing it, if it's flagged as
+            # sorted.
+            groupby.df = self.df.with_columns(pl.col(keys[0]).set_sorted())
+        return groupby
 
     def get_column_by_name(self, name: str) -> PolarsColumn[DType]:
-        return PolarsColumn(self.df[name])
+        if isinstance(self.df, pl.LazyFrame):
+            column = PolarsColumn(self.df.select(name).collect()[name])
+        else:
+            column = PolarsColumn(self.df[name])
+        if self._sorted_by[:1] == (name,):
+            return column.set_sorted()
+        return column
 
     def get_columns_by_name(self, names: Sequence[str]) -> PolarsDataFrame:
         if isinstance(names, str):
@@ -294,30 +737,45 @@ class PolarsDataFrame(DataFrame):
         return PolarsDataFrame(self.df.select(names))
 
     def get_rows(self, indices: Column[Any]) -> PolarsDataFrame:
-        return PolarsDataFrame(self.dataframe[indices.column])
+        return PolarsDataFrame(self.df.select(pl.all().take(indices.column)))
 
     def slice_rows(
         self, start: int | None, stop: int | None, step: int | None
     ) -> PolarsDataFrame:
+        if (
+            (start is not None and start < 0)
+            or (stop is not None and stop < 0)
+            or (step is not None and step < 0)
+        ):
+            # need the length to resolve these, like Python slices do
+            start, stop, step = slice(start, stop, step).indices(self.shape()[0])
         if start is None:
             start = 0
-        if stop is None:
-            stop = len(self.dataframe)
         if step is None:
             step = 1
-        return PolarsDataFrame(
-            self.df.with_row_count("idx")
-            .filter(pl.col("idx").is_in(range(start, stop, step)))
-            .drop("idx")
-        )
+        if step < 0:
+            # `slice` is zero-copy, and `reverse` + `take_every` only touch
+            # the rows we keep.
+            df = self.df.slice(stop + 1, max(start - stop, 0)).reverse()
+            return PolarsDataFrame(df.take_every(-step))
+        if stop is None:
+            df = self.df.slice(start)
+        else:
+            df = self.df.slice(start, max(stop - start, 0))
+        if step == 1:
+            return PolarsDataFrame(df, sorted_by=self._sorted_by)
+        return PolarsDataFrame(df.take_every(step), sorted_by=self._sorted_by)
 
     def get_rows_by_mask(self, mask: Column[Bool]) -> PolarsDataFrame:
-        return PolarsDataFrame(self.df.filter(mask.column))
+        return PolarsDataFrame(self.df.filter(mask.column), sorted_by=self._sorted_by)
 
     def insert(self, loc: int, label: str, value: Column[Any]) -> PolarsDataFrame:
-        df = self.df.clone()
-        df.insert_at_idx(loc, pl.Series(label, value.column))
-        return PolarsDataFrame(df)
+        columns = self.get_column_names()
+        return PolarsDataFrame(
+            self.df.with_columns(pl.lit(value.column).alias(label)).select(
+                [*columns[:loc], label, *columns[loc:]]
+            )
+        )
 
     def drop_column(self, label: str) -> PolarsDataFrame:
         if not isinstance(label, str):
@@ -336,6 +794,8 @@ class PolarsDataFrame(DataFrame):
         self,
         other: DataFrame | Any,
     ) -> PolarsDataFrame:
+        if self._is_lazy(other):
+            return self._binary_op_lazy(other, "__eq__")
         if isinstance(other, PolarsDataFrame):
             return PolarsDataFrame(self.dataframe.__eq__(other.dataframe))
         return PolarsDataFrame(self.dataframe.__eq__(other))
@@ -344,46 +804,64 @@ class PolarsDataFrame(DataFrame):
         self,
         other: DataFrame,
     ) -> PolarsDataFrame:
+        if self._is_lazy(other):
+            return self._binary_op_lazy(other, "__ne__")
         if isinstance(other, PolarsDataFrame):
             return PolarsDataFrame(self.dataframe.__ne__(other.dataframe))
         return PolarsDataFrame(self.dataframe.__ne__(other))
 
     def __ge__(self, other: DataFrame | Any) -> PolarsDataFrame:
+        if self._is_lazy(other):
+            return self._binary_op_lazy(other, "__ge__")
         if isinstance(other, PolarsDataFrame):
             return PolarsDataFrame(self.dataframe.__ge__(other.dataframe))
         return PolarsDataFrame(self.dataframe.__ge__(other))
 
     def __gt__(self, other: DataFrame | Any) -> PolarsDataFrame:
+        if self._is_lazy(other):
+            return self._binary_op_lazy(other, "__gt__")
         if isinstance(other, PolarsDataFrame):
             return PolarsDataFrame(self.dataframe.__gt__(other.dataframe))
         return PolarsDataFrame(self.dataframe.__gt__(other))
 
     def __le__(self, other: DataFrame | Any) -> PolarsDataFrame:
+        if self._is_lazy(other):
+            return self._binary_op_lazy(other, "__le__")
         if isinstance(other, PolarsDataFrame):
             return PolarsDataFrame(self.dataframe.__le__(other.dataframe))
         return PolarsDataFrame(self.dataframe.__le__(other))
 
     def __lt__(self, other: DataFrame | Any) -> PolarsDataFrame:
+        if self._is_lazy(other):
+            return self._binary_op_lazy(other, "__lt__")
         if isinstance(other, PolarsDataFrame):
             return PolarsDataFrame(self.dataframe.__lt__(other.dataframe))
         return PolarsDataFrame(self.dataframe.__lt__(other))
 
     def __add__(self, other: DataFrame | Any) -> PolarsDataFrame:
+        if self._is_lazy(other):
+            return self._binary_op_lazy(other, "__add__")
         if isinstance(other, PolarsDataFrame):
             return PolarsDataFrame(self.dataframe.__add__(other.dataframe))
         return PolarsDataFrame(self.dataframe.__add__(other))  # type: ignore[operator]
 
     def __sub__(self, other: DataFrame | Any) -> PolarsDataFrame:
+        if self._is_lazy(other):
+            return self._binary_op_lazy(other, "__sub__")
         if isinstance(other, PolarsDataFrame):
             return PolarsDataFrame(self.dataframe.__sub__(other.dataframe))
         return PolarsDataFrame(self.dataframe.__sub__(other))  # type: ignore[operator]
 
     def __mul__(self, other: DataFrame | Any) -> PolarsDataFrame:
+        if self._is_lazy(other):
+            return self._binary_op_lazy(other, "__mul__")
         if isinstance(other, PolarsDataFrame):
             return PolarsDataFrame(self.dataframe.__mul__(other.dataframe))
         return PolarsDataFrame(self.dataframe.__mul__(other))  # type: ignore[operator]
 
     def __truediv__(self, other: DataFrame | Any) -> PolarsDataFrame:
+        if self._is_lazy(other):
+            return self._binary_op_lazy(other, "__truediv__")
         if isinstance(other, PolarsDataFrame):
             return PolarsDataFrame(self.dataframe.__truediv__(other.dataframe))
         return PolarsDataFrame(
@@ -391,6 +869,8 @@ class PolarsDataFrame(DataFrame):
         )
 
     def __floordiv__(self, other: DataFrame | Any) -> PolarsDataFrame:
+        if self._is_lazy(other):
+            return self._binary_op_lazy(other, "__floordiv__")
         if isinstance(other, PolarsDataFrame):
             return PolarsDataFrame(self.dataframe.__floordiv__(other.dataframe))
         return PolarsDataFrame(
@@ -398,6 +878,8 @@ class PolarsDataFrame(DataFrame):
         )
 
     def __pow__(self, other: DataFrame | Any) -> PolarsDataFrame:
+        if self._is_lazy(other):
+            return self._binary_op_lazy(other, "__pow__")
         if isinstance(other, PolarsDataFrame):
             return PolarsDataFrame(
                 self.dataframe.select(
@@ -415,6 +897,8 @@ class PolarsDataFrame(DataFrame):
         )
 
     def __mod__(self, other: DataFrame | Any) -> PolarsDataFrame:
+        if self._is_lazy(other):
+            return self._binary_op_lazy(other, "__mod__")
         if isinstance(other, PolarsDataFrame):
             return PolarsDataFrame(self.dataframe.__mod__(other.dataframe))
         return PolarsDataFrame(self.dataframe.__mod__(other))  # type: ignore[operator]
@@ -434,16 +918,10 @@ class PolarsDataFrame(DataFrame):
         raise NotImplementedError()
 
     def is_null(self) -> PolarsDataFrame:
-        result = {}
-        for column in self.dataframe.columns:
-            result[column] = self.dataframe[column].is_null()
-        return PolarsDataFrame(pl.DataFrame(result))
+        return PolarsDataFrame(self.df.select(pl.all().is_null()))
 
     def is_nan(self) -> PolarsDataFrame:
-        result = {}
-        for column in self.dataframe.columns:
-            result[column] = self.dataframe[column].is_nan()
-        return PolarsDataFrame(pl.DataFrame(result))
+        return PolarsDataFrame(self.df.select(pl.all().is_nan()))
 
     def any(self, *, skip_nulls: bool = True) -> PolarsDataFrame:
         return PolarsDataFrame(self.dataframe.select(pl.col("*").any()))
@@ -452,10 +930,10 @@ class PolarsDataFrame(DataFrame):
         return PolarsDataFrame(self.dataframe.select(pl.col("*").all()))
 
     def any_rowwise(self, *, skip_nulls: bool = True) -> PolarsColumn[Bool]:
-        return PolarsColumn(self.dataframe.select(pl.any(pl.col("*")))["any"])
+        return PolarsColumn(_collect(self.df.select(pl.any(pl.col("*"))))["any"])
 
     def all_rowwise(self, *, skip_nulls: bool = True) -> PolarsColumn[Bool]:
-        return PolarsColumn(self.dataframe.select(pl.all(pl.col("*")))["all"])
+        return PolarsColumn(_collect(self.df.select(pl.all(pl.col("*"))))["all"])
 
     def min(self, *, skip_nulls: bool = True) -> PolarsDataFrame:
         return PolarsDataFrame(self.dataframe.select(pl.col("*").min()))
@@ -481,6 +959,36 @@ class PolarsDataFrame(DataFrame):
     def var(self, *, skip_nulls: bool = True) -> PolarsDataFrame:
         return PolarsDataFrame(self.dataframe.select(pl.col("*").var()))
 
+    def describe(
+        self,
+        statistics: Sequence[str] = ("min", "max", "mean", "std", "null_count", "sum"),
+    ) -> PolarsDataFrame:
+        # Not part of the standard. Returns one row per statistic, labelled by
+        # the "statistic" column. All statistics are computed in a single
+        # `select`, so lazy frames are only scanned once. Like pandas, non-numeric
+        # columns are skipped.
+        for statistic in statistics:
+            if statistic not in _DESCRIBE_STATISTICS:
+                raise ValueError(f"Unsupported statistic: {statistic}")
+        columns = [
+            column
+            for column, dtype in self.df.schema.items()
+            if dtype in pl.NUMERIC_DTYPES
+        ]
+        exprs = [
+            getattr(pl.col(column), statistic)()
+            .cast(pl.Float64)
+            .alias(f"{column}_{statistic}")
+            for column in columns
+            for statistic in statistics
+        ]
+        row = _collect(self.df.select(exprs)).row(0)
+        result: dict[str, Any] = {"statistic": list(statistics)}
+        for i, column in enumerate(columns):
+            values = row[i * len(statistics) : (i + 1) * len(statistics)]
+            result[column] = pl.Series(values, dtype=pl.Float64)
+        return PolarsDataFrame(pl.DataFrame(result))
+
     def sorted_indices(
         self,
         keys: Sequence[Any],
@@ -488,11 +996,125 @@ class PolarsDataFrame(DataFrame):
         ascending: Sequence[bool] | bool = True,
         nulls_position: Literal["first", "last"] = "last",
     ) -> PolarsColumn[Any]:
-        df = self.dataframe.select(keys)
-        return PolarsColumn(df.with_row_count().sort(keys, descending=False)["row_nr"])
+        descending = _validate_sort_order(keys, ascending, nulls_position)
+        if not any(descending) and self._is_sorted_by(keys):
+            return PolarsColumn(
+                pl.arange(0, self.shape()[0], eager=True, dtype=pl.UInt32)
+            )
+        # polars sorts by several keys natively, each in its own direction.
+        by, descending = _sort_by(self.df, keys, descending, nulls_position == "last")
+        df = self.df.select(keys).with_row_count()
+        df = df.sort(by, descending=descending)
+        return PolarsColumn(_collect(df.select("row_nr"))["row_nr"])
+
+    def top_k_indices(self, keys: Sequence[str], k: int) -> PolarsColumn[Any]:
+        # Not part of the standard. Indices of the `k` rows with the largest values
+        # of `keys`, largest first, found without sorting all rows.
+        if isinstance(keys, str):
+            raise TypeError("Expected sequence of strings, got: str")
+        return PolarsColumn(_k_indices(self.df, keys, k, largest=True))
+
+    def bottom_k_indices(self, keys: Sequence[str], k: int) -> PolarsColumn[Any]:
+        # Not part of the standard. Indices of the `k` rows with the smallest values
+        # of `keys`, smallest first.
+        if isinstance(keys, str):
+            raise TypeError("Expected sequence of strings, got: str")
+        return PolarsColumn(
+            _k_indices(
+                self.df,
+                keys,
+                k,
+                largest=False,
+                is_sorted=self._sorted_by[: len(keys)] == tuple(keys),
+            )
+        )
+
+    def join(
+        self,
+        other: DataFrame,
+        left_on: Sequence[str],
+        right_on: Sequence[str],
+        how: Literal["inner", "left", "outer"] = "inner",
+    ) -> PolarsDataFrame:
+        # Not part of the standard. Joins the rows of `other` whose `right_on` keys
+        # equal the `left_on` keys, with polars' hash join. The result has the
+        # columns of this DataFrame, then those of `other` apart from its keys.
+        # Missing values match each other, and an outer join fills in the keys
+        # from `other`. Joining with a LazyFrame gives a LazyFrame.
+        if not isinstance(other, PolarsDataFrame):
+            raise TypeError(f"Expected PolarsDataFrame, got: {type(other)}")
+        _validate_join(self.df.schema, other.df.schema, left_on, right_on, how)
+        left, right = self.df, other.df
+        if self._is_lazy(other):
+            left, right = left.lazy(), right.lazy()
+        # Only a left join is guaranteed to keep the order of this DataFrame's rows.
+        return PolarsDataFrame(
+            left.join(
+                right,  # type: ignore[arg-type]
+                left_on=list(left_on),
+                right_on=list(right_on),
+                how=how,
+            ),
+            sorted_by=self._sorted_by if how == "left" else (),
+        )
+
+    def _is_sorted_by_key(self, key: str) -> bool:
+        # Unlike `_is_sorted_by`, this checks LazyFrames too, by computing `key`.
+        if isinstance(self.df, pl.LazyFrame) and self._sorted_by[:1] != (key,):
+            return _is_sorted(self.df.select(key).collect(), [key])
+        return self._is_sorted_by([key])
+
+    def join_asof(
+        self,
+        other: DataFrame,
+        left_on: str,
+        right_on: str,
+        *,
+        left_by: Sequence[str] = (),
+        right_by: Sequence[str] = (),
+        direction: Literal["backward", "forward", "nearest"] = "backward",
+    ) -> PolarsDataFrame:
+        # Not part of the standard. Joins each row with the row of `other` whose
+        # `right_on` value is the closest one at or before its `left_on` value (at or
+        # after it for "forward", either for "nearest"), among rows with equal
+        # `left_by` / `right_by` keys, like polars' `join_asof`. Both DataFrames
+        # need to be sorted by their `on` keys, without nulls. This is checked once
+        # per DataFrame (or not at all after `set_sorted`), and passed on to polars
+        # as the sorted flag, so that polars doesn't check again.
+        if not isinstance(other, PolarsDataFrame):
+            raise TypeError(f"Expected PolarsDataFrame, got: {type(other)}")
+        _validate_asof_join(left_on, right_on, left_by, right_by, direction)
+        left_keys = [left_on, *left_by]
+        right_keys = [right_on, *right_by]
+        _validate_join(self.df.schema, other.df.schema, left_keys, right_keys, "left")
+        if not self._is_sorted_by_key(left_on):
+            raise ValueError(f"Expected DataFrame sorted by {left_on}, without nulls")
+        if not other._is_sorted_by_key(right_on):
+            raise ValueError(
+                f"Expected other DataFrame sorted by {right_on}, without nulls"
+            )
+        left = self.df.with_columns(pl.col(left_on).set_sorted())
+        # With the same names for the keys, polars keeps one copy of them.
+        right = other.df.rename(dict(zip(right_keys, left_keys))).with_columns(
+            pl.col(left_on).set_sorted()
+        )
+        if self._is_lazy(other):
+            left, right = left.lazy(), right.lazy()
+        return PolarsDataFrame(
+            left.join_asof(
+                right,  # type: ignore[arg-type]
+                on=left_on,
+                by=list(left_by) or None,
+                strategy=direction,
+            ),
+            sorted_by=self._sorted_by,
+        )
 
     def fill_nan(
         self,
         value: float | null,
     ) -> PolarsDataFrame:
         return PolarsDataFrame(self.dataframe.fill_nan(value))  # type: ignore[arg-type]
+
+
+dataframe_api_compat.profiling.register(PolarsColumn, PolarsGroupBy, PolarsDataFrame)
@@ -0,0 +1,206 @@
+from __future__ import annotations
+
+import atexit
+import collections
+import functools
+import json
+import os
+import threading
+import time
+import tracemalloc
+import types
+from typing import Any, Callable
+
+# Not part of the standard. Opt-in instrumentation of the standard-compliant
+# classes, e.g.
+#
+#     with dataframe_api_compat.profiling.Profile() as profile:
+#         ...
+#     print(profile.to_json())
+#
+# records, for each method, how often it was called, how long it took, how
+# many rows went in and out, and (with `track_memory=True`) the most memory a
+# call used. Alternatively, setting the environment variable
+# DATAFRAME_API_COMPAT_PROFILE to a path profiles the whole process and writes
+# the results there on exit (as collapsed stacks if the path ends in ".folded",
+# and as JSON otherwise).
+# Methods are only wrapped while a profile is active, so there's no overhead
+# otherwise.
+
+ENVIRONMENT_VARIABLE = "DATAFRAME_API_COMPAT_PROFILE"
+
+# Classes to instrument. Each namespace registers its own on import.
+_CLASSES: list[type] = []
+
+_ACTIVE: Profile | None = None
+
+
+def register(*classes: type) -> None:
+    _CLASSES.extend(classes)
+    if _ACTIVE is not None:
+        for cls in classes:
+            _ACTIVE._instrument(cls)
+
+
+def _rows(obj: Any) -> int | None:
+    # Only counted where that's free, so not for lazy objects (polars LazyFrames,
+    # duckdb relations, deferred pandas columns), which would need computing.
+    for attribute in ("_series", "_dataframe", "df"):
+        native = getattr(obj, attribute, None)
+        if native is not None:
+            break
+    else:
+        return None
+    if type(native).__module__.partition(".")[0] not in ("pandas", "polars", "pyarrow"):
+        return None
+    if not hasattr(native, "__len__"):
+        return None
+    return len(native)
+
+
+class Profile:
+    def __init__(self, *, track_memory: bool = False) -> None:
+        # `track_memory` uses tracemalloc, which slows everything down, and only
+        # sees allocations made through Python's allocator (which includes NumPy's,
+        # but not e.g. Arrow's or polars').
+        if track_memory and not hasattr(tracemalloc, "reset_peak"):  # pragma: no cover
+            raise RuntimeError("Tracking memory requires Python 3.9 or later")
+        self.track_memory = track_memory
+        self.stats: dict[str, dict[str, float]] = {}
+        # call stack (method names, outermost first) -> seconds spent in the
+        # innermost method itself, excluding its callees
+        self.stacks: collections.Counter[tuple[str, ...]] = collections.Counter()
+        self._originals: list[tuple[type, str, Callable[..., Any]]] = []
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._started_tracemalloc = False
+
+    def __enter__(self) -> Profile:
+        global _ACTIVE
+        if _ACTIVE is not None:
+            raise RuntimeError("Another profile is already active")
+        _ACTIVE = self
+        if self.track_memory and not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self._started_tracemalloc = True
+        for cls in _CLASSES:
+            self._instrument(cls)
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        global _ACTIVE
+        for cls, name, original in reversed(self._originals):
+            setattr(cls, name, original)
+        self._originals.clear()
+        if self._started_tracemalloc:
+            tracemalloc.stop()
+            self._started_tracemalloc = False
+        _ACTIVE = None
+
+    def _instrument(self, cls: type) -> None:
+        for name, method in list(vars(cls).items()):
+            if not isinstance(method, types.FunctionType):
+                continue
+            if name == "__init__" or (name.startswith("_") and not name.endswith("__")):
+                continue
+            self._originals.append((cls, name, method))
+            setattr(cls, name, self._wrap(f"{cls.__name__}.{name}", method))
+
+    def _wrap(self, name: str, method: Callable[..., Any]) -> Callable[..., Any]:
+        @functools.wraps(method)
+        def wrapper(obj: Any, *args: Any, **kwargs: Any) -> Any:
+            return self._call(name, method, obj, args, kwargs)
+
+        return wrapper
+
+    def _call(
+        self,
+        name: str,
+        method: Callable[..., Any],
+        obj: Any,
+        args: tuple[Any, ...],
+        kwargs: dict[str, Any],
+    ) -> Any:
+        stack = self._local.__dict__.setdefault("stack", [])
+        memory = 0
+        if self.track_memory:
+            memory, peak = tracemalloc.get_traced_memory()
+            if stack:
+                # The peak so far belongs to the caller, as the counter is reset
+                # on entering and leaving each call.
+                stack[-1][3] = max(stack[-1][3], peak)
+            tracemalloc.reset_peak()
+        # [name, seconds spent in callees, traced memory on entry, peak memory]
+        frame: list[Any] = [name, 0.0, memory, memory]
+        stack.append(frame)
+        path = tuple(caller for caller, *_ in stack)
+        rows_in = _rows(obj)
+        rows_out = None
+        start = time.perf_counter()
+        try:
+            result = method(obj, *args, **kwargs)
+            rows_out = _rows(result)
+            return result
+        finally:
+            elapsed = time.perf_counter() - start
+            peak = 0
+            if self.track_memory:
+                peak = max(frame[3], tracemalloc.get_traced_memory()[1])
+            stack.pop()
+            if stack:
+                stack[-1][1] += elapsed
+                stack[-1][3] = max(stack[-1][3], peak)
+            if self.track_memory:
+                tracemalloc.reset_peak()
+            with self._lock:
+                stats = self.stats.setdefault(
+                    name,
+                    {
+                        "calls": 0,
+                        "time": 0.0,
+                        "rows_in": 0,
+                        "rows_out": 0,
+                        "peak_bytes": 0,
+                    },
+                )
+                stats["calls"] += 1
+                stats["time"] += elapsed
+                stats["rows_in"] += rows_in or 0
+                stats["rows_out"] += rows_out or 0
+                # The most traced memory any call needed on top of what was in
+                # use when it started, including temporaries it freed again.
+                stats["peak_bytes"] = max(stats["peak_bytes"], peak - frame[2])
+                self.stacks[path] += elapsed - frame[1]
+
+    def to_json(self) -> str:
+        return json.dumps(self.stats, indent=2, sort_keys=True)
+
+    def to_collapsed(self) -> str:
+        # One line per call stack, with the microseconds spent in its innermost
+        # method, as read by flamegraph.pl, speedscope, etc.
+        return "".join(
+            f"{';'.join(path)} {round(seconds * 1e6)}\n"
+            for path, seconds in sorted(self.stacks.items())
+        )
+
+    def write(self, path: str) -> None:
+        with open(path, "w") as fd:
+            if path.endswith(".folded"):
+                fd.write(self.to_collapsed())
+            else:
+                fd.write(self.to_json())
+
+
+def _profile_process(path: str) -> Callable[[], None]:
+    profile = Profile().__enter__()
+
+    def write() -> None:
+        profile.__exit__()
+        profile.write(path)
+
+    atexit.register(write)
+    return write
+
+
+if os.environ.get(ENVIRONMENT_VARIABLE):  # pragma: no cover
+    _profile_process(os.environ[ENVIRONMENT_VARIABLE])
@@ -0,0 +1,103 @@
+from __future__ import annotations
+from dataframe_api_compat.pyarrow_standard.pyarrow_standard import (
+    PyArrowDataFrame,
+    PyArrowColumn,
+)
+
+import numpy as np
+import pyarrow as pa  # type: ignore[import]
+from typing import Any, Iterable, Sequence
+
+
+class Int64:
+    ...
+
+
+class Int32:
+    ...
+
+
+class Float64:
+    ...
+
+
+class Float32:
+    ...
+
+
+class Bool:
+    ...
+
+
+DTYPE_MAP = {
+    pa.int64(): Int64(),
+    pa.int32(): Int32(),
+    pa.float64(): Float64(),
+    pa.float32(): Float32(),
+    pa.bool_(): Bool(),
+}
+
+
+def _map_standard_to_pyarrow_dtypes(dtype: Any) -> pa.DataType:
+    if isinstance(dtype, Int64):
+        return pa.int64()
+    if isinstance(dtype, Int32):
+        return pa.int32()
+    if isinstance(dtype, Float64):
+        return pa.float64()
+    if isinstance(dtype, Float32):
+        return pa.float32()
+    if isinstance(dtype, Bool):
+        return pa.bool_()
+    raise AssertionError(f"Unknown dtype: {dtype}")
+
+
+def concat(dataframes: Iterable[PyArrowDataFrame]) -> PyArrowDataFrame:
+    # The result just references the inputs' chunks, nothing is copied.
+    # pyarrow raises (ArrowInvalid, a ValueError) if the schemas don't match.
+    return PyArrowDataFrame(pa.concat_tables([_df.dataframe for _df in dataframes]))
+
+
+def dataframe_from_dict(data: dict[str, PyArrowColumn[Any]]) -> PyArrowDataFrame:
+    return PyArrowDataFrame(
+        pa.table({label: column.column for label, column in data.items()})
+    )
+
+
+def column_from_sequence(sequence: Sequence[Any], dtype: Any) -> PyArrowColumn[Any]:
+    return PyArrowColumn(
+        pa.chunked_array(
+            [pa.array(sequence, type=_map_standard_to_pyarrow_dtypes(dtype))]
+        )
+    )
+
+
+def column_from_1d_array(
+    array: Any, dtype: Any, mask: Any | None = None
+) -> PyArrowColumn[Any]:
+    # Not part of the standard. `array` can be a NumPy array or anything supporting
+    # the buffer protocol, and is only copied if its dtype doesn't match `dtype`.
+    # Booleans (and `mask`, True where valid) are bit-packed, as Arrow requires.
+    arrow_dtype = _map_standard_to_pyarrow_dtypes(dtype)
+    values = np.asarray(array, dtype=arrow_dtype.to_pandas_dtype())
+    if values.ndim != 1:
+        raise ValueError(f"Expected 1D array, got {values.ndim}D")
+    values = np.ascontiguousarray(values)
+    validity = None
+    if mask is not None:
+        mask = np.asarray(mask, dtype=bool)
+        if mask.shape != values.shape:
+            raise ValueError(
+                f"Expected mask of length {len(values)}, got shape {mask.shape}"
+            )
+        validity = pa.py_buffer(np.packbits(mask, bitorder="little"))
+    if values.dtype == bool:
+        data = pa.py_buffer(np.packbits(values, bitorder="little"))
+    else:
+        data = pa.py_buffer(values)
+    arrow_array = pa.Array.from_buffers(arrow_dtype, len(values), [validity, data])
+    return PyArrowColumn(pa.chunked_array([arrow_array]))
+
+
+def convert_to_standard_compliant_dataframe(df: pa.Table) -> PyArrowDataFrame:
+    return PyArrowDataFrame(df)
@@ -0,0 +1,702 @@
+from __future__ import annotations
+import dataframe_api_compat.pyarrow_standard
+import dataframe_api_compat.profiling
+import collections
+import functools
+
+from typing import (
+    Any,
+    Callable,
+    Sequence,
+    Mapping,
+    NoReturn,
+    TYPE_CHECKING,
+    Generic,
+    TypeVar,
+    Literal,
+)
+import numpy as np
+import pyarrow as pa  # type: ignore[import]
+import pyarrow.compute as pc  # type: ignore[import]
+
+DType = TypeVar("DType")
+
+if TYPE_CHECKING:
+    from dataframe_api import (
+        DataFrame,
+        Bool,
+        Column,
+        GroupBy,
+        null,
+    )
+else:
+
+    class DataFrame(Generic[DType]):
+        __slots__ = ()
+
+    class Column(Generic[DType]):
+        __slots__ = ()
+
+    class GroupBy:
+        __slots__ = ()
+
+
+# pyarrow.compute kernels read ChunkedArrays chunk by chunk, so the inputs are
+# never combined into one contiguous buffer (which would copy them).
+
+
+def _truediv(left: Any, right: Any) -> Any:
+    if pa.types.is_integer(left.type):
+        left = pc.cast(left, pa.float64())
+    return pc.divide(left, right)
+
+
+def _floordiv(left: Any, right: Any) -> Any:
+    if pa.types.is_floating(left.type):
+        return pc.floor(pc.divide(left, right))
+    # Arrow's integer division truncates towards zero, whereas the standard
+    # (like Python) rounds towards negative infinity.
+    quotient = pc.divide(left, right)
+    inexact = pc.and_(
+        pc.not_equal(pc.multiply(quotient, right), left),
+        pc.xor(pc.less(left, 0), pc.less(right, 0)),
+    )
+    return pc.subtract(quotient, pc.cast(inexact, quotient.type))
+
+
+def _mod(left: Any, right: Any) -> Any:
+    return pc.subtract(left, pc.multiply(_floordiv(left, right), right))
+
+
+_BINARY_OPS: dict[str, Callable[[Any, Any], Any]] = {
+    "__eq__": pc.equal,
+    "__ne__": pc.not_equal,
+    "__ge__": pc.greater_equal,
+    "__gt__": pc.greater,
+    "__le__": pc.less_equal,
+    "__lt__": pc.less,
+    "__and__": pc.and_kleene,
+    "__or__": pc.or_kleene,
+    "__add__": pc.add,
+    "__sub__": pc.subtract,
+    "__mul__": pc.multiply,
+    "__truediv__": _truediv,
+    "__floordiv__": _floordiv,
+    "__pow__": pc.power,
+    "__mod__": _mod,
+}
+
+
+def _reduce(column: Any, reduction: str) -> Any:
+    # Returns a pyarrow Scalar.
+    if reduction == "median":
+        return pc.quantile(column, q=0.5)[0]
+    if reduction in ("std", "var"):
+        return getattr(pc, _REDUCTIONS[reduction])(column, ddof=1)
+    return getattr(pc, _REDUCTIONS[reduction])(column)
+
+
+# standard reduction -> pyarrow.compute function
+_REDUCTIONS = {
+    "any": "any",
+    "all": "all",
+    "min": "min",
+    "max": "max",
+    "sum": "sum",
+    "prod": "product",
+    "mean": "mean",
+    "std": "stddev",
+    "var": "variance",
+}
+
+
+_NULL_PLACEMENTS = {"first": "at_start", "last": "at_end"}
+
+
+def _validate_sort_order(
+    keys: Sequence[str], ascending: Sequence[bool] | bool, nulls_position: str
+) -> list[str]:
+    # Returns the order to sort each key in, as Arrow's `sort_keys` expect.
+    if nulls_position not in _NULL_PLACEMENTS:
+        raise ValueError(f"Expected 'first' or 'last', got: {nulls_position}")
+    if isinstance(ascending, bool):
+        ascending = [ascending] * len(keys)
+    elif len(ascending) != len(keys):
+        raise ValueError(
+            f"Expected {len(keys)} values for `ascending`, got {len(ascending)}"
+        )
+    return ["ascending" if key_ascending else "descending" for key_ascending in ascending]
+
+
+class PyArrowColumn(Column[DType]):
+    __slots__ = ("_series",)
+
+    def __init__(self, column: pa.ChunkedArray) -> None:
+        self._series = column
+
+    def _from_binary_op(self, other: Column[Any] | Any, op: str) -> PyArrowColumn[Any]:
+        if isinstance(other, PyArrowColumn):
+            return PyArrowColumn(_BINARY_OPS[op](self.column, other.column))
+        return PyArrowColumn(_BINARY_OPS[op](self.column, other))
+
+    # In the standard
+    def __column_namespace__(self, *, api_version: str | None = None) -> Any:
+        return dataframe_api_compat.pyarrow_standard
+
+    @property
+    def column(self) -> pa.ChunkedArray:
+        return self._series
+
+    def __len__(self) -> int:
+        return len(self.column)
+
+    @property
+    def dtype(self) -> Any:
+        return dataframe_api_compat.pyarrow_standard.DTYPE_MAP[self.column.type]
+
+    def get_rows(self, indices: Column[Any]) -> PyArrowColumn[DType]:
+        return PyArrowColumn(self.column.take(indices.column))
+
+    def get_value(self, row: int) -> Any:
+        return self.column[row].as_py()
+
+    def __iter__(self) -> NoReturn:
+        raise NotImplementedError()
+
+    def is_in(self, values: Column[DType]) -> PyArrowColumn[Bool]:
+        if values.dtype != self.dtype:
+            raise ValueError(f"`value` has dtype {values.dtype}, expected {self.dtype}")
+        # Nulls match nulls, and NaN matches NaN, like the other backends.
+        return PyArrowColumn(
+            pc.is_in(self.column, value_set=values.column, skip_nulls=False)
+        )
+
+    def unique_indices(self, *, skip_nulls: bool = True) -> PyArrowColumn[Any]:
+        table = pa.table(
+            {"value": self.column, "index": pa.array(np.arange(len(self.column)))}
+        )
+        result = table.group_by("value").aggregate([("index", "min")])
+        return PyArrowColumn(result["index_min"])
+
+    def is_null(self) -> PyArrowColumn[Bool]:
+        return PyArrowColumn(pc.is_null(self.column))
+
+    def is_nan(self) -> PyArrowColumn[Bool]:
+        return PyArrowColumn(pc.is_nan(self.column))
+
+    def any(self, *, skip_nulls: bool = True) -> bool:
+        return _reduce(self.column, "any").as_py()  # type: ignore[no-any-return]
+
+    def all(self, *, skip_nulls: bool = True) -> bool:
+        return _reduce(self.column, "all").as_py()  # type: ignore[no-any-return]
+
+    def min(self, *, skip_nulls: bool = True) -> Any:
+        return _reduce(self.column, "min").as_py()
+
+    def max(self, *, skip_nulls: bool = True) -> Any:
+        return _reduce(self.column, "max").as_py()
+
+    def sum(self, *, skip_nulls: bool = True) -> Any:
+        return _reduce(self.column, "sum").as_py()
+
+    def prod(self, *, skip_nulls: bool = True) -> Any:
+        return _reduce(self.column, "prod").as_py()
+
+    def mean(self, *, skip_nulls: bool = True) -> Any:
+        return _reduce(self.column, "mean").as_py()
+
+    def median(self, *, skip_nulls: bool = True) -> Any:
+        return _reduce(self.column, "median").as_py()
+
+    def std(self, *, skip_nulls: bool = True) -> Any:
+        return _reduce(self.column, "std").as_py()
+
+    def var(self, *, skip_nulls: bool = True) -> Any:
+        return _reduce(self.column, "var").as_py()
+
+    def __eq__(  # type: ignore[override]
+        self, other: Column[DType] | Any
+    ) -> PyArrowColumn[Bool]:
+        return self._from_binary_op(other, "__eq__")
+
+    def __ne__(  # type: ignore[override]
+        self, other: Column[DType] | Any
+    ) -> PyArrowColumn[Bool]:
+        return self._from_binary_op(other, "__ne__")
+
+    def __ge__(self, other: Column[DType] | Any) -> PyArrowColumn[Bool]:
+        return self._from_binary_op(other, "__ge__")
+
+    def __gt__(self, other: Column[DType] | Any) -> PyArrowColumn[Bool]:
+        return self._from_binary_op(other, "__gt__")
+
+    def __le__(self, other: Column[DType] | Any) -> PyArrowColumn[Bool]:
+        return self._from_binary_op(other, "__le__")
+
+    def __lt__(self, other: Column[DType] | Any) -> PyArrowColumn[Bool]:
+        return self._from_binary_op(other, "__lt__")
+
+    def __mul__(self, other: Column[DType] | Any) -> PyArrowColumn[Any]:
+        return self._from_binary_op(other, "__mul__")
+
+    def __floordiv__(self, other: Column[DType] | Any) -> PyArrowColumn[Any]:
+        return self._from_binary_op(other, "__floordiv__")
+
+    def __truediv__(self, other: Column[DType] | Any) -> PyArrowColumn[Any]:
+        return self._from_binary_op(other, "__truediv__")
+
+    def __pow__(self, other: Column[DType] | Any) -> PyArrowColumn[Any]:
+        return self._from_binary_op(other, "__pow__")
+
+    def __mod__(self, other: Column[DType] | Any) -> PyArrowColumn[Any]:
+        return self._from_binary_op(other, "__mod__")
+
+    def __divmod__(
+        self,
+        other: Column[DType] | Any,
+    ) -> tuple[PyArrowColumn[Any], PyArrowColumn[Any]]:
+        quotient = self // other
+        remainder = self - quotient * other
+        return quotient, remainder
+
+    def __and__(self, other: Column[Bool] | bool) -> PyArrowColumn[Bool]:
+        return self._from_binary_op(other, "__and__")
+
+    def __or__(self, other: Column[Bool] | bool) -> PyArrowColumn[Bool]:
+        return self._from_binary_op(other, "__or__")
+
+    def __invert__(self) -> PyArrowColumn[Bool]:
+        return PyArrowColumn(pc.invert(self.column))
+
+    def __add__(self, other: Column[Any] | Any) -> PyArrowColumn[Any]:
+        return self._from_binary_op(other, "__add__")
+
+    def __sub__(self, other: Column[Any] | Any) -> PyArrowColumn[Any]:
+        return self._from_binary_op(other, "__sub__")
+
+    def sorted_indices(
+        self, *, ascending: bool = True, nulls_position: Literal["first", "last"] = "last"
+    ) -> PyArrowColumn[Any]:
+        (order,) = _validate_sort_order(["values"], ascending, nulls_position)
+        return PyArrowColumn(
+            pc.array_sort_indices(
+                self.column,
+                order=order,
+                null_placement=_NULL_PLACEMENTS[nulls_position],
+            )
+        )
+
+    def fill_nan(self, value: float | null) -> PyArrowColumn[DType]:
+        return PyArrowColumn(_fill_nan(self.column, value))
+
+
+def _fill_nan(column: pa.ChunkedArray, value: Any) -> pa.ChunkedArray:
+    return pc.if_else(pc.is_nan(column), pa.scalar(value, type=column.type), column)
+
+
+def _median_from_lists(lists: pa.ChunkedArray, counts: pa.ChunkedArray) -> pa.Array:
+    # Arrow only has approximate grouped medians. Given each group's values
+    # (as a list) and how many of them are non-null, sort the values within
+    # each group, and pick out the middle one(s).
+    lists = lists.combine_chunks()
+    counts = counts.to_numpy()
+    values = pc.list_flatten(lists)
+    order = pc.sort_indices(
+        pa.table({"group": pc.list_parent_indices(lists), "value": values}),
+        sort_keys=[("group", "ascending"), ("value", "ascending")],
+        null_placement="at_end",
+    )
+    values = pc.cast(values.take(order), pa.float64())
+    lengths = pc.list_value_length(lists).to_numpy()
+    starts = np.cumsum(lengths) - lengths
+    lower = values.take(pa.array(starts + np.maximum(counts - 1, 0) // 2))
+    upper = values.take(pa.array(starts + counts // 2))
+    median = pc.divide(pc.add(lower, upper), 2)
+    return pc.if_else(pa.array(counts == 0), pa.scalar(None, pa.float64()), median)
+
+
+# standard reduction -> pyarrow grouped aggregation
+_GROUPBY_AGGREGATIONS = {
+    "any": "any",
+    "all": "all",
+    "min": "min",
+    "max": "max",
+    "sum": "sum",
+    "prod": "product",
+    "median": "list",
+    "mean": "mean",
+    "std": "stddev",
+    "var": "variance",
+    "size": "count_all",
+}
+
+
+class PyArrowGroupBy(GroupBy):
+    __slots__ = ("df", "keys")
+
+    def __init__(self, df: pa.Table, keys: Sequence[str]) -> None:
+        self.df = df
+        self.keys = list(keys)
+
+    def _validate_booleanness(self) -> None:
+        for column in self.df.column_names:
+            if column not in self.keys and self.df[column].type != pa.bool_():
+                raise NotImplementedError(
+                    "'function' can only be called on DataFrame "
+                    "where all dtypes are 'bool'"
+                )
+
+    def _reduce(self, reduction: str) -> PyArrowDataFrame:
+        return self.aggregate(
+            {
+                column: (column, reduction)
+                for column in self.df.column_names
+                if column not in self.keys
+            }
+        )
+
+    def size(self) -> PyArrowDataFrame:
+        return self.aggregate({"size": (self.keys[0], "size")})
+
+    def any(self, *, skip_nulls: bool = True) -> PyArrowDataFrame:
+        self._validate_booleanness()
+        return self._reduce("any")
+
+    def all(self, *, skip_nulls: bool = True) -> PyArrowDataFrame:
+        self._validate_booleanness()
+        return self._reduce("all")
+
+    def min(self, *, skip_nulls: bool = True) -> PyArrowDataFrame:
+        return self._reduce("min")
+
+    def max(self, *, skip_nulls: bool = True) -> PyArrowDataFrame:
+        return self._reduce("max")
+
+    def sum(self, *, skip_nulls: bool = True) -> PyArrowDataFrame:
+        return self._reduce("sum")
+
+    def prod(self, *, skip_nulls: bool = True) -> PyArrowDataFrame:
+        return self._reduce("prod")
+
+    def median(self, *, skip_nulls: bool = True) -> PyArrowDataFrame:
+        return self._reduce("median")
+
+    def mean(self, *, skip_nulls: bool = True) -> PyArrowDataFrame:
+        return self._reduce("mean")
+
+    def std(self, *, skip_nulls: bool = True) -> PyArrowDataFrame:
+        return self._reduce("std")
+
+    def var(self, *, skip_nulls: bool = True) -> PyArrowDataFrame:
+        return self._reduce("var")
+
+    def aggregate(self, aggregations: Mapping[str, tuple[str, str]]) -> PyArrowDataFrame:
+        # Not part of the standard (yet). Computes several reductions in a
+        # single groupby, e.g. `{"b_sum": ("b", "sum"), "b_size": ("b", "size")}`.
+        if not isinstance(aggregations, collections.abc.Mapping):
+            raise TypeError(f"Expected Mapping, got: {type(aggregations)}")
+        arrow_aggregations: list[tuple[Any, ...]] = []
+        for column, reduction in aggregations.values():
+            if column not in self.df.column_names:
+                raise KeyError(f"column {column} not present in DataFrame's columns")
+            if reduction not in _GROUPBY_AGGREGATIONS:
+                raise ValueError(f"Unsupported reduction: {reduction}")
+            if reduction == "size":
+                arrow_aggregations.append(([], "count_all"))
+            elif reduction in ("std", "var"):
+                arrow_aggregations.append(
+                    (
+                        column,
+                        _GROUPBY_AGGREGATIONS[reduction],
+                        pc.VarianceOptions(ddof=1),
+                    )
+                )
+            elif reduction == "median":
+                arrow_aggregations.append((column, "list"))
+                arrow_aggregations.append((column, "count"))
+            else:
+                arrow_aggregations.append((column, _GROUPBY_AGGREGATIONS[reduction]))
+        result = self.df.group_by(self.keys).aggregate(arrow_aggregations)
+        # The keys come first, followed by the aggregations, in order.
+        columns = iter(result.columns[len(self.keys) :])
+        data = {key: result[key] for key in self.keys}
+        for name, (_, reduction) in aggregations.items():
+            if reduction == "median":
+                data[name] = _median_from_lists(next(columns), next(columns))
+            else:
+                data[name] = next(columns)
+        return PyArrowDataFrame(pa.table(data))
+
+
+_DESCRIBE_STATISTICS = ("min", "max", "mean", "std", "var", "null_count", "sum")
+
+
+def _describe_column(column: pa.ChunkedArray, statistic: str) -> Any:
+    if statistic == "null_count":
+        return column.null_count
+    if statistic == "sum":
+        # Like the other backends, the sum of no values is 0.
+        return pc.sum(column, min_count=0).as_py()
+    return _reduce(column, statistic).as_py()
+
+
+class PyArrowDataFrame(DataFrame):
+    __slots__ = ("df",)
+
+    def __init__(self, df: pa.Table) -> None:
+        self._validate_columns(df.column_names)
+        self.df = df
+
+    def _validate_columns(self, columns: Sequence[str]) -> None:
+        counter = collections.Counter(columns)
+        for col, count in counter.items():
+            if count > 1:
+                raise ValueError(
+                    f"Expected unique column names, got {col} {count} time(s)"
+                )
+
+    def _binary_op(self, other: DataFrame | Any, op: str) -> PyArrowDataFrame:
+        columns = self.get_column_names()
+        if isinstance(other, PyArrowDataFrame):
+            if other.get_column_names() != columns:
+                raise ValueError("Expected DataFrame with matching columns.")
+            return PyArrowDataFrame(
+                pa.table(
+                    {
+                        col: _BINARY_OPS[op](self.df[col], other.dataframe[col])
+                        for col in columns
+                    }
+                )
+            )
+        return PyArrowDataFrame(
+            pa.table({col: _BINARY_OPS[op](self.df[col], other) for col in columns})
+        )
+
+    def _reduce(self, reduction: str) -> PyArrowDataFrame:
+        result = {}
+        for col in self.get_column_names():
+            scalar = _reduce(self.df[col], reduction)
+            result[col] = pa.array([scalar.as_py()], type=scalar.type)
+        return PyArrowDataFrame(pa.table(result))
+
+    def __dataframe_namespace__(self, *, api_version: str | None = None) -> Any:
+        return dataframe_api_compat.pyarrow_standard
+
+    @property
+    def dataframe(self) -> pa.Table:
+        return self.df
+
+    def shape(self) -> tuple[int, int]:
+        return self.df.shape  # type: ignore[no-any-return]
+
+    def groupby(self, keys: Sequence[str]) -> PyArrowGroupBy:
+        if not isinstance(keys, collections.abc.Sequence):
+            raise TypeError(f"Expected sequence of strings, got: {type(keys)}")
+        if isinstance(keys, str):
+            raise TypeError("Expected sequence of strings, got: str")
+        for key in keys:
+            if key not in self.get_column_names():
+                raise KeyError(f"key {key} not present in DataFrame's columns")
+        return PyArrowGroupBy(self.df, keys)
+
+    def get_column_by_name(self, name: str) -> PyArrowColumn[DType]:
+        if not isinstance(name, str):
+            raise ValueError(f"Expected str, got: {type(name)}")
+        return PyArrowColumn(self.df[name])
+
+    def get_columns_by_name(self, names: Sequence[str]) -> PyArrowDataFrame:
+        if isinstance(names, str):
+            raise TypeError(f"Expected sequence of str, got {type(names)}")
+        return PyArrowDataFrame(self.df.select(list(names)))
+
+    def get_rows(self, indices: Column[Any]) -> PyArrowDataFrame:
+        return PyArrowDataFrame(self.df.take(indices.column))
+
+    def slice_rows(
+        self, start: int | None, stop: int | None, step: int | None
+    ) -> PyArrowDataFrame:
+        start, stop, step = slice(start, stop, step).indices(self.df.num_rows)
+        if step == 1:
+            # zero-copy
+            return PyArrowDataFrame(self.df.slice(start, max(stop - start, 0)))
+        return PyArrowDataFrame(self.df.take(pa.array(np.arange(start, stop, step))))
+
+    def get_rows_by_mask(self, mask: Column[Bool]) -> PyArrowDataFrame:
+        return PyArrowDataFrame(self.df.filter(mask.column))
+
+    def insert(self, loc: int, label: str, value: Column[Any]) -> PyArrowDataFrame:
+        return PyArrowDataFrame(self.df.add_column(loc, label, value.column))
+
+    def drop_column(self, label: str) -> PyArrowDataFrame:
+        if not isinstance(label, str):
+            raise TypeError(f"Expected str, got: {type(label)}")
+        return PyArrowDataFrame(self.df.drop([label]))
+
+    def rename_columns(self, mapping: Mapping[str, str]) -> PyArrowDataFrame:
+        if not isinstance(mapping, collections.abc.Mapping):
+            raise TypeError(f"Expected Mapping, got: {type(mapping)}")
+        return PyArrowDataFrame(
+            self.df.rename_columns(
+                [mapping.get(col, col) for col in self.df.column_names]
+            )
+        )
+
+    def get_column_names(self) -> Sequence[str]:
+        return self.df.column_names  # type: ignore[no-any-return]
+
+    def __eq__(  # type: ignore[override]
+        self,
+        other: DataFrame | Any,
+    ) -> PyArrowDataFrame:
+        return self._binary_op(other, "__eq__")
+
+    def __ne__(  # type: ignore[override]
+        self,
+        other: DataFrame | Any,
+    ) -> PyArrowDataFrame:
+        return self._binary_op(other, "__ne__")
+
+    def __ge__(self, other: DataFrame | Any) -> PyArrowDataFrame:
+        return self._binary_op(other, "__ge__")
+
+    def __gt__(self, other: DataFrame | Any) -> PyArrowDataFrame:
+        return self._binary_op(other, "__gt__")
+
+    def __le__(self, other: DataFrame | Any) -> PyArrowDataFrame:
+        return self._binary_op(other, "__le__")
+
+    def __lt__(self, other: DataFrame | Any) -> PyArrowDataFrame:
+        return self._binary_op(other, "__lt__")
+
+    def __add__(self, other: DataFrame | Any) -> PyArrowDataFrame:
+        return self._binary_op(other, "__add__")
+
+    def __sub__(self, other: DataFrame | Any) -> PyArrowDataFrame:
+        return self._binary_op(other, "__sub__")
+
+    def __mul__(self, other: DataFrame | Any) -> PyArrowDataFrame:
+        return self._binary_op(other, "__mul__")
+
+    def __truediv__(self, other: DataFrame | Any) -> PyArrowDataFrame:
+        return self._binary_op(other, "__truediv__")
+
+    def __floordiv__(self, other: DataFrame | Any) -> PyArrowDataFrame:
+        return self._binary_op(other, "__floordiv__")
+
+    def __pow__(self, other: DataFrame | Any) -> PyArrowDataFrame:
+        return self._binary_op(other, "__pow__")
+
+    def __mod__(self, other: DataFrame | Any) -> PyArrowDataFrame:
+        return self._binary_op(other, "__mod__")
+
+    def __divmod__(
+        self,
+        other: DataFrame | Any,
+    ) -> tuple[PyArrowDataFrame, PyArrowDataFrame]:
+        quotient = self // other
+        remainder = self - quotient * other
+        return quotient, remainder
+
+    def __invert__(self) -> PyArrowDataFrame:
+        return PyArrowDataFrame(
+            pa.table({col: pc.invert(self.df[col]) for col in self.get_column_names()})
+        )
+
+    def __iter__(self) -> NoReturn:
+        raise NotImplementedError()
+
+    def is_null(self) -> PyArrowDataFrame:
+        return PyArrowDataFrame(
+            pa.table({col: pc.is_null(self.df[col]) for col in self.get_column_names()})
+        )
+
+    def is_nan(self) -> PyArrowDataFrame:
+        return PyArrowDataFrame(
+            pa.table({col: pc.is_nan(self.df[col]) for col in self.get_column_names()})
+        )
+
+    def any(self, *, skip_nulls: bool = True) -> PyArrowDataFrame:
+        return self._reduce("any")
+
+    def all(self, *, skip_nulls: bool = True) -> PyArrowDataFrame:
+        return self._reduce("all")
+
+    def any_rowwise(self, *, skip_nulls: bool = True) -> PyArrowColumn[Bool]:
+        return PyArrowColumn(functools.reduce(pc.or_kleene, self.df.columns))
+
+    def all_rowwise(self, *, skip_nulls: bool = True) -> PyArrowColumn[Bool]:
+        return PyArrowColumn(functools.reduce(pc.and_kleene, self.df.columns))
+
+    def min(self, *, skip_nulls: bool = True) -> PyArrowDataFrame:
+        return self._reduce("min")
+
+    def max(self, *, skip_nulls: bool = True) -> PyArrowDataFrame:
+        return self._reduce("max")
+
+    def sum(self, *, skip_nulls: bool = True) -> PyArrowDataFrame:
+        return self._reduce("sum")
+
+    def prod(self, *, skip_nulls: bool = True) -> PyArrowDataFrame:
+        return self._reduce("prod")
+
+    def mean(self, *, skip_nulls: bool = True) -> PyArrowDataFrame:
+        return self._reduce("mean")
+
+    def median(self, *, skip_nulls: bool = True) -> PyArrowDataFrame:
+        return self._reduce("median")
+
+    def std(self, *, skip_nulls: bool = True) -> PyArrowDataFrame:
+        return self._reduce("std")
+
+    def var(self, *, skip_nulls: bool = True) -> PyArrowDataFrame:
+        return self._reduce("var")
+
+    def describe(
+        self,
+        statistics: Sequence[str] = ("min", "max", "mean", "std", "null_count", "sum"),
+    ) -> PyArrowDataFrame:
+        # Not part of the standard. Returns one row per statistic, labelled by
+        # the "statistic" column. Like pandas, non-numeric columns are skipped.
+        for statistic in statistics:
+            if statistic not in _DESCRIBE_STATISTICS:
+                raise ValueError(f"Unsupported statistic: {statistic}")
+        result: dict[str, Any] = {"statistic": list(statistics)}
+        for col in self.get_column_names():
+            column_type = self.df.schema.field(col).type
+            if not (
+                pa.types.is_integer(column_type) or pa.types.is_floating(column_type)
+            ):
+                continue
+            result[col] = pa.array(
+                [_describe_column(self.df[col], statistic) for statistic in statistics],
+                type=pa.float64(),
+            )
+        return PyArrowDataFrame(pa.table(result))
+
+    def sorted_indices(
+        self,
+        keys: Sequence[Any],
+        *,
+        ascending: Sequence[bool] | bool = True,
+        nulls_position: Literal["first", "last"] = "last",
+    ) -> PyArrowColumn[Any]:
+        order = _validate_sort_order(keys, ascending, nulls_position)
+        indices = pc.sort_indices(
+            self.df.select(list(keys)),
+            sort_keys=list(zip(keys, order)),
+            null_placement=_NULL_PLACEMENTS[nulls_position],
+        )
+        return PyArrowColumn(pa.chunked_array([indices]))
+
+    def fill_nan(
+        self,
+        value: float | null,
+    ) -> PyArrowDataFrame:
+        return PyArrowDataFrame(
+            pa.table(
+                {col: _fill_nan(self.df[col], value) for col in self.get_column_names()}
+            )
+        )
+
+
+dataframe_api_compat.profiling.register(PyArrowColumn, PyArrowGroupBy, PyArrowDataFrame)
@@ -1,18 +1,28 @@
 from __future__ import annotations
 
-from typing import Any
-import pandas as pd
-import polars as pl
-from pandas_standard import PandasDataFrame
-from polars_standard import PolarsDataFrame
+import importlib
+from typing import Any, TYPE_CHECKING
 
-from dataframe_api import DataFrame
+if TYPE_CHECKING:
+    from dataframe_api import DataFrame
 
+# Top-level module of the input's type -> namespace which can wrap it.
+# Namespaces (and so their backends) are only imported once they're needed, so
+# that e.g. converting a polars DataFrame doesn't import pandas.
+_NAMESPACES = {
+    "pandas": "dataframe_api_compat.pandas_standard",
+    "polars": "dataframe_api_compat.polars_standard",
+    "pyarrow": "dataframe_api_compat.pyarrow_standard",
+    "duckdb": "dataframe_api_compat.duckdb_standard",
+}
 
-def convert_to_standard_compliant_dataframe(
-    df: pd.DataFrame | pl.DataFrame,
-) -> DataFrame[Any]:
-    if isinstance(df, pd.DataFrame):
-        return PandasDataFrame(df)
-    elif isinstance(df, pl.DataFrame):
-        return PolarsDataFrame(df)
+
+def convert_to_standard_compliant_dataframe(df: Any) -> DataFrame[Any]:
+    # Checking the module names (of the type, and of its bases for subclasses)
+    # means we don't need to import a library to check whether `df` comes from it.
+    for cls in type(df).__mro__:
+        module = cls.__module__.partition(".")[0]
+        if module in _NAMESPACES:
+            namespace: Any = importlib.import_module(_NAMESPACES[module])
+            return namespace.convert_to_standard_compliant_dataframe(df)
+    raise TypeError(f"Got unexpected type: {type(df)}")
@@ -1,16 +1,31 @@
 # todo: test that errors are appropriately raised when calls violate standard
 from __future__ import annotations
 
+import atexit
+import json
+import os
+import subprocess
+import sys
 from typing import Any, Callable
 
+import numpy as np
 import pytest
 import pandas as pd
 import polars as pl
+import polars.testing
+import pyarrow as pa
+import duckdb
+import dataframe_api_compat.duckdb_standard
 import dataframe_api_compat.pandas_standard
 import dataframe_api_compat.polars_standard
+import dataframe_api_compat.pyarrow_standard
+import dataframe_api_compat.profiling
+import standard
 
 
-def convert_to_standard_compliant_dataframe(df: pd.DataFrame | pl.DataFrame) -> Any:
+def convert_to_standard_compliant_dataframe(
+    df: pd.DataFrame | pl.DataFrame | pa.Table,
+) -> Any:
     # todo: type return
     if isinstance(df, pd.DataFrame):
         return (
@@ -24,6 +39,12 @@ def convert_to_standard_compliant_dataframe(df: pd.DataFrame | pl.DataFrame) ->
                 df
             )
         )
+    elif isinstance(df, pa.Table):
+        return (
+            dataframe_api_compat.pyarrow_standard.convert_to_standard_compliant_dataframe(
+                df
+            )
+        )
     else:
         raise AssertionError(f"Got unexpected type: {type(df)}")
 
@@ -55,7 +76,9 @@ def convert_series_to_pandas_numpy(ser: pd.Series) -> pd.Series:  # type: ignore
 
 def pytest_generate_tests(metafunc: Any) -> None:
     if "library" in metafunc.fixturenames:
-        metafunc.parametrize("library", ["pandas-numpy", "pandas-nullable", "polars"])
+        metafunc.parametrize(
+            "library", ["pandas-numpy", "pandas-nullable", "polars", "pyarrow"]
+        )
 
 
 def integer_series_1(library: str) -> Any:
@@ -69,6 +92,9 @@ def integer_series_1(library: str) -> Any:
     if library == "polars":
         df = pl.DataFrame({"a": [1, 2, 3]})
         return convert_to_standard_compliant_dataframe(df).get_column_by_name("a")
+    if library == "pyarrow":
+        df = pa.table({"a": [1, 2, 3]})
+        return convert_to_standard_compliant_dataframe(df).get_column_by_name("a")
     raise AssertionError(f"Got unexpected library: {library}")
 
 
@@ -83,6 +109,9 @@ def integer_series_3(library: str) -> object:
     if library == "polars":
         df = pl.DataFrame({"a": [1, 2, 4]})
         return convert_to_standard_compliant_dataframe(df).get_column_by_name("a")
+    if library == "pyarrow":
+        df = pa.table({"a": [1, 2, 4]})
+        return convert_to_standard_compliant_dataframe(df).get_column_by_name("a")
     raise AssertionError(f"Got unexpected library: {library}")
 
 
@@ -97,6 +126,9 @@ def integer_series_5(library: str) -> Any:
     if library == "polars":
         df = pl.DataFrame({"a": [1, 1, 4]})
         return convert_to_standard_compliant_dataframe(df).get_column_by_name("a")
+    if library == "pyarrow":
+        df = pa.table({"a": [1, 1, 4]})
+        return convert_to_standard_compliant_dataframe(df).get_column_by_name("a")
     raise AssertionError(f"Got unexpected library: {library}")
 
 
@@ -111,6 +143,9 @@ def integer_series_6(library: str) -> Any:
     if library == "polars":
         df = pl.DataFrame({"a": [1, 3, 2]})
         return convert_to_standard_compliant_dataframe(df).get_column_by_name("a")
+    if library == "pyarrow":
+        df = pa.table({"a": [1, 3, 2]})
+        return convert_to_standard_compliant_dataframe(df).get_column_by_name("a")
     raise AssertionError(f"Got unexpected library: {library}")
 
 
@@ -125,6 +160,9 @@ def float_series_1(library: str) -> Any:
     if library == "polars":
         df = pl.DataFrame({"a": [2.0, 3.0]})
         return convert_to_standard_compliant_dataframe(df).get_column_by_name("a")
+    if library == "pyarrow":
+        df = pa.table({"a": [2.0, 3.0]})
+        return convert_to_standard_compliant_dataframe(df).get_column_by_name("a")
     raise AssertionError(f"Got unexpected library: {library}")
 
 
@@ -139,6 +177,9 @@ def float_series_2(library: str) -> Any:
     if library == "polars":
         df = pl.DataFrame({"a": [2.0, 1.0]})
         return convert_to_standard_compliant_dataframe(df).get_column_by_name("a")
+    if library == "pyarrow":
+        df = pa.table({"a": [2.0, 1.0]})
+        return convert_to_standard_compliant_dataframe(df).get_column_by_name("a")
     raise AssertionError(f"Got unexpected library: {library}")
 
 
@@ -154,6 +195,9 @@ def float_series_3(library: str) -> object:
     if library == "polars":
         df = pl.DataFrame({"a": [float("nan"), 2.0]})
         return convert_to_standard_compliant_dataframe(df).get_column_by_name("a")
+    if library == "pyarrow":
+        df = pa.table({"a": [float("nan"), 2.0]})
+        return convert_to_standard_compliant_dataframe(df).get_column_by_name("a")
     raise AssertionError(f"Got unexpected library: {library}")
 
 
@@ -169,6 +213,9 @@ def float_series_4(library: str) -> object:
     if library == "polars":
         df = pl.DataFrame({"a": [1.0, float("nan")]})
         return convert_to_standard_compliant_dataframe(df).get_column_by_name("a")
+    if library == "pyarrow":
+        df = pa.table({"a": [1.0, float("nan")]})
+        return convert_to_standard_compliant_dataframe(df).get_column_by_name("a")
     raise AssertionError(f"Got unexpected library: {library}")
 
 
@@ -183,6 +230,9 @@ def bool_series_1(library: str) -> Any:
     if library == "polars":
         df = pl.DataFrame({"a": [True, False, True]})
         return convert_to_standard_compliant_dataframe(df).get_column_by_name("a")
+    if library == "pyarrow":
+        df = pa.table({"a": [True, False, True]})
+        return convert_to_standard_compliant_dataframe(df).get_column_by_name("a")
     raise AssertionError(f"Got unexpected library: {library}")
 
 
@@ -197,6 +247,9 @@ def bool_series_2(library: str) -> Any:
     if library == "polars":
         df = pl.DataFrame({"a": [True, False, False]})
         return convert_to_standard_compliant_dataframe(df).get_column_by_name("a")
+    if library == "pyarrow":
+        df = pa.table({"a": [True, False, False]})
+        return convert_to_standard_compliant_dataframe(df).get_column_by_name("a")
     raise AssertionError(f"Got unexpected library: {library}")
 
 
@@ -211,6 +264,9 @@ def integer_dataframe_1(library: str) -> Any:
     if library == "polars":
         df = pl.DataFrame({"a": [1, 2, 3], "b": [4, 5, 6]})
         return convert_to_standard_compliant_dataframe(df)
+    if library == "pyarrow":
+        df = pa.table({"a": [1, 2, 3], "b": [4, 5, 6]})
+        return convert_to_standard_compliant_dataframe(df)
     raise AssertionError(f"Got unexpected library: {library}")
 
 
@@ -225,6 +281,9 @@ def integer_dataframe_2(library: str) -> Any:
     if library == "polars":
         df = pl.DataFrame({"a": [1, 2, 4], "b": [4, 2, 6]})
         return convert_to_standard_compliant_dataframe(df)
+    if library == "pyarrow":
+        df = pa.table({"a": [1, 2, 4], "b": [4, 2, 6]})
+        return convert_to_standard_compliant_dataframe(df)
     raise AssertionError(f"Got unexpected library: {library}")
 
 
@@ -243,6 +302,9 @@ def integer_dataframe_3(library: str) -> Any:
     if library == "polars":
         df = pl.DataFrame({"a": [1, 2, 3, 4, 5, 6, 7], "b": [7, 6, 5, 4, 3, 2, 1]})
         return convert_to_standard_compliant_dataframe(df)
+    if library == "pyarrow":
+        df = pa.table({"a": [1, 2, 3, 4, 5, 6, 7], "b": [7, 6, 5, 4, 3, 2, 1]})
+        return convert_to_standard_compliant_dataframe(df)
     raise AssertionError(f"Got unexpected library: {library}")
 
 
@@ -261,6 +323,9 @@ def integer_dataframe_4(library: str) -> Any:
     if library == "polars":
         df = pl.DataFrame({"key": [1, 1, 2, 2], "b": [1, 2, 3, 4], "c": [4, 5, 6, 7]})
         return convert_to_standard_compliant_dataframe(df)
+    if library == "pyarrow":
+        df = pa.table({"key": [1, 1, 2, 2], "b": [1, 2, 3, 4], "c": [4, 5, 6, 7]})
+        return convert_to_standard_compliant_dataframe(df)
     raise AssertionError(f"Got unexpected library: {library}")
 
 
@@ -275,6 +340,9 @@ def integer_dataframe_5(library: str) -> Any:
     if library == "polars":
         df = pl.DataFrame({"a": [1, 1], "b": [4, 3]})
         return convert_to_standard_compliant_dataframe(df)
+    if library == "pyarrow":
+        df = pa.table({"a": [1, 1], "b": [4, 3]})
+        return convert_to_standard_compliant_dataframe(df)
     raise AssertionError(f"Got unexpected library: {library}")
 
 
@@ -290,6 +358,9 @@ def nan_dataframe_1(library: str) -> Any:
     if library == "polars":
         df = pl.DataFrame({"a": [1.0, 2.0, float("nan")]})
         return convert_to_standard_compliant_dataframe(df)
+    if library == "pyarrow":
+        df = pa.table({"a": [1.0, 2.0, float("nan")]})
+        return convert_to_standard_compliant_dataframe(df)
     raise AssertionError(f"Got unexpected library: {library}")
 
 
@@ -305,6 +376,9 @@ def nan_dataframe_2(library: str) -> Any:
     if library == "polars":
         df = pl.DataFrame({"a": [0.0, 1.0, float("nan")]})
         return convert_to_standard_compliant_dataframe(df)
+    if library == "pyarrow":
+        df = pa.table({"a": [0.0, 1.0, float("nan")]})
+        return convert_to_standard_compliant_dataframe(df)
     raise AssertionError(f"Got unexpected library: {library}")
 
 
@@ -319,6 +393,9 @@ def null_dataframe_1(library: str, request: pytest.FixtureRequest) -> Any:
     if library == "polars":
         df = pl.DataFrame({"a": [1.0, 2.0, None]})
         return convert_to_standard_compliant_dataframe(df)
+    if library == "pyarrow":
+        df = pa.table({"a": [1.0, 2.0, None]})
+        return convert_to_standard_compliant_dataframe(df)
     raise AssertionError(f"Got unexpected library: {library}")
 
 
@@ -334,6 +411,9 @@ def nan_series_1(library: str) -> Any:
     if library == "polars":
         df = pl.DataFrame({"a": [0.0, 1.0, float("nan")]})
         return convert_to_standard_compliant_dataframe(df).get_column_by_name("a")
+    if library == "pyarrow":
+        df = pa.table({"a": [0.0, 1.0, float("nan")]})
+        return convert_to_standard_compliant_dataframe(df).get_column_by_name("a")
     raise AssertionError(f"Got unexpected library: {library}")
 
 
@@ -348,6 +428,9 @@ def null_series_1(library: str, request: pytest.FixtureRequest) -> Any:
     if library == "polars":
         df = pl.DataFrame({"a": [1.0, 2.0, None]})
         return convert_to_standard_compliant_dataframe(df).get_column_by_name("a")
+    if library == "pyarrow":
+        df = pa.table({"a": [1.0, 2.0, None]})
+        return convert_to_standard_compliant_dataframe(df).get_column_by_name("a")
     raise AssertionError(f"Got unexpected library: {library}")
 
 
@@ -366,6 +449,9 @@ def bool_dataframe_1(library: str) -> Any:
     if library == "polars":
         df = pl.DataFrame({"a": [True, True, False], "b": [True, True, True]})
         return convert_to_standard_compliant_dataframe(df)
+    if library == "pyarrow":
+        df = pa.table({"a": [True, True, False], "b": [True, True, True]})
+        return convert_to_standard_compliant_dataframe(df)
     raise AssertionError(f"Got unexpected library: {library}")
 
 
@@ -398,6 +484,15 @@ def bool_dataframe_2(library: str) -> Any:
             }
         )
         return convert_to_standard_compliant_dataframe(df)
+    if library == "pyarrow":
+        df = pa.table(
+            {
+                "key": [1, 1, 2, 2],
+                "b": [False, True, True, True],
+                "c": [True, False, False, False],
+            }
+        )
+        return convert_to_standard_compliant_dataframe(df)
     raise AssertionError(f"Got unexpected library: {library}")
 
 
@@ -416,6 +511,9 @@ def bool_dataframe_3(library: str) -> Any:
     if library == "polars":
         df = pl.DataFrame({"a": [False, False], "b": [False, True], "c": [True, True]})
         return convert_to_standard_compliant_dataframe(df)
+    if library == "pyarrow":
+        df = pa.table({"a": [False, False], "b": [False, True], "c": [True, True]})
+        return convert_to_standard_compliant_dataframe(df)
     raise AssertionError(f"Got unexpected library: {library}")
 
 
@@ -699,6 +797,10 @@ def test_column_get_rows(library: str) -> None:
         (None, 7, 2, pd.DataFrame({"a": [1, 3, 5, 7], "b": [7, 5, 3, 1]})),
         (2, None, 2, pd.DataFrame({"a": [3, 5, 7], "b": [5, 3, 1]})),
         (2, None, None, pd.DataFrame({"a": [3, 4, 5, 6, 7], "b": [5, 4, 3, 2, 1]})),
+        (-3, None, None, pd.DataFrame({"a": [5, 6, 7], "b": [3, 2, 1]})),
+        (None, -5, None, pd.DataFrame({"a": [1, 2], "b": [7, 6]})),
+        (None, None, -2, pd.DataFrame({"a": [7, 5, 3, 1], "b": [1, 3, 5, 7]})),
+        (5, 1, -2, pd.DataFrame({"a": [6, 4], "b": [2, 4]})),
     ],
 )
 def test_slice_rows(
@@ -950,6 +1052,27 @@ def test_concat(library: str) -> None:
     pd.testing.assert_frame_equal(result_pd, expected)
 
 
+def test_concat_iterable(library: str) -> None:
+    df1 = integer_dataframe_1(library)
+    df2 = integer_dataframe_2(library)
+    namespace = df1.__dataframe_namespace__()
+    result = namespace.concat(df for df in [df1, df2, df1])
+    result_pd = pd.api.interchange.from_dataframe(result.dataframe)
+    result_pd = convert_dataframe_to_pandas_numpy(result_pd)
+    expected = pd.DataFrame(
+        {"a": [1, 2, 3, 1, 2, 4, 1, 2, 3], "b": [4, 5, 6, 4, 2, 6, 4, 5, 6]}
+    )
+    pd.testing.assert_frame_equal(result_pd, expected)
+
+
+def test_concat_column_names_mismatch() -> None:
+    df1 = integer_dataframe_1("pandas-numpy")
+    df2 = df1.rename_columns({"a": "c"})
+    namespace = df1.__dataframe_namespace__()
+    with pytest.raises(ValueError, match="Expected matching columns"):
+        namespace.concat(iter([df1, df2]))
+
+
 def test_concat_mismatch(library: str) -> None:
     df1 = integer_dataframe_1(library)
     df2 = integer_dataframe_4(library)
@@ -1275,3 +1398,1730 @@ def test_column_from_sequence(
     result_pd = pd.api.interchange.from_dataframe(result.dataframe)["result"]
     result_pd = convert_series_to_pandas_numpy(result_pd)
     pd.testing.assert_series_equal(result_pd, expected)
+
+
+@pytest.mark.parametrize(
+    ("values", "dtype", "expected"),
+    [
+        (np.array([1, 2, 3]), "Int64", pd.Series([1, 2, 3], dtype="int64")),
+        (np.array([1, 2, 3]), "Int32", pd.Series([1, 2, 3], dtype="int32")),
+        (
+            memoryview(np.array([1.0, 2.0, 3.0])),
+            "Float64",
+            pd.Series([1, 2, 3], dtype="float64"),
+        ),
+        (np.arange(6.0)[::2], "Float32", pd.Series([0, 2, 4], dtype="float32")),
+        (
+            np.array([True, False, True]),
+            "Bool",
+            pd.Series([True, False, True], dtype=bool),
+        ),
+    ],
+)
+def test_column_from_1d_array(
+    library: str, values: Any, dtype: str, expected: pd.Series
+) -> None:
+    namespace = integer_series_1(library).__column_namespace__()
+    result = namespace.column_from_1d_array(values, getattr(namespace, dtype)())
+    result_pd = pd.api.interchange.from_dataframe(
+        namespace.dataframe_from_dict({"result": result}).dataframe
+    )["result"]
+    result_pd = convert_series_to_pandas_numpy(result_pd)
+    pd.testing.assert_series_equal(result_pd, expected, check_names=False)
+
+
+@pytest.mark.parametrize("dtype", ["Int64", "Float64", "Bool"])
+def test_column_from_1d_array_mask(library: str, dtype: str) -> None:
+    namespace = integer_series_1(library).__column_namespace__()
+    values = np.array([1, 0, 1])
+    result = namespace.column_from_1d_array(
+        values, getattr(namespace, dtype)(), mask=np.array([True, False, True])
+    )
+    is_null = result.is_null()
+    assert [is_null.get_value(i) for i in range(3)] == [False, True, False]
+    assert result.get_value(2) == 1
+
+
+def test_column_from_1d_array_no_copy(library: str) -> None:
+    namespace = integer_series_1(library).__column_namespace__()
+    values = np.array([1, 2, 3])
+    result = namespace.column_from_1d_array(values, namespace.Int64())
+    masked = namespace.column_from_1d_array(
+        values, namespace.Int64(), mask=[True, True, False]
+    )
+    values[0] = 10
+    assert result.get_value(0) == 10
+    assert masked.get_value(0) == 10
+
+
+def test_column_from_1d_array_invalid(library: str) -> None:
+    namespace = integer_series_1(library).__column_namespace__()
+    with pytest.raises(ValueError, match="Expected 1D array, got 2D"):
+        namespace.column_from_1d_array(np.ones((2, 2)), namespace.Float64())
+    with pytest.raises(ValueError, match="Expected mask of length 3"):
+        namespace.column_from_1d_array(
+            np.array([1, 2, 3]), namespace.Int64(), mask=[True, False]
+        )
+
+
+def lazy_integer_dataframe_1() -> Any:
+    df = pl.DataFrame({"a": [1, 2, 3], "b": [4, 5, 6]}).lazy()
+    return dataframe_api_compat.polars_standard.convert_to_standard_compliant_dataframe(
+        df
+    )
+
+
+@pytest.mark.parametrize(
+    "func",
+    [
+        lambda df, other: df.get_columns_by_name(["b"]),
+        lambda df, other: df.slice_rows(1, None, None),
+        lambda df, other: df.drop_column("a"),
+        lambda df, other: df.rename_columns({"a": "c"}),
+        lambda df, other: df + other,
+        lambda df, other: df**other,
+        lambda df, other: df > 2,
+        lambda df, other: df.__divmod__(other)[1],
+        lambda df, other: (df > 1).any(),
+        lambda df, other: df.sum(),
+        lambda df, other: df.groupby(["a"]).sum(),
+        lambda df, other: df.groupby(["a"]).size(),
+        lambda df, other: df.is_null(),
+        lambda df, other: (df / 1).is_nan(),
+        lambda df, other: df.__dataframe_namespace__().concat([df, other]),
+        lambda df, other: df.get_rows(df.sorted_indices(["b"])),
+        lambda df, other: df.get_rows_by_mask(df.get_column_by_name("a") > 1),
+        lambda df, other: df.insert(
+            1,
+            "c",
+            df.__dataframe_namespace__().column_from_sequence(
+                [7, 8, 9], dtype=df.__dataframe_namespace__().Int64()
+            ),
+        ),
+    ],
+)
+def test_lazy_matches_eager(func: Callable[[Any, Any], Any]) -> None:
+    df = lazy_integer_dataframe_1()
+    eager = df.collect()
+    result = func(df, eager)
+    assert isinstance(result.dataframe, pl.LazyFrame)
+    expected = func(eager, eager)
+    assert isinstance(expected.dataframe, pl.DataFrame)
+    # groupby doesn't guarantee order
+    result_pl = result.collect().dataframe
+    expected_pl = expected.collect().dataframe
+    assert result_pl.sort(result_pl.columns).frame_equal(
+        expected_pl.sort(expected_pl.columns)
+    )
+
+
+@pytest.mark.parametrize(
+    "comparison",
+    [
+        "__eq__",
+        "__ne__",
+        "__ge__",
+        "__gt__",
+        "__le__",
+        "__lt__",
+        "__add__",
+        "__sub__",
+        "__mul__",
+        "__truediv__",
+        "__floordiv__",
+        "__pow__",
+        "__mod__",
+    ],
+)
+def test_lazy_comparisons(comparison: str) -> None:
+    df = lazy_integer_dataframe_1()
+    other = integer_dataframe_2("polars")
+    result = getattr(df, comparison)(other).collect().dataframe
+    expected = getattr(df.collect(), comparison)(other).dataframe
+    assert result.frame_equal(expected)
+    result = getattr(df, comparison)(2).collect().dataframe
+    expected = getattr(df.collect(), comparison)(2).dataframe
+    assert result.frame_equal(expected)
+
+
+def test_lazy_eager_results() -> None:
+    df = lazy_integer_dataframe_1()
+    assert df.shape() == (3, 2)
+    assert df.get_column_by_name("a").get_value(2) == 3
+    assert df.sorted_indices(["b"]).get_value(0) == 0
+    assert (df > 1).any_rowwise().get_value(0)
+    assert not (df > 1).all_rowwise().get_value(0)
+
+
+def test_lazy_comparison_invalid() -> None:
+    df = lazy_integer_dataframe_1()
+    with pytest.raises(ValueError):
+        df.get_columns_by_name(["a"]) > df.get_columns_by_name(["b"])
+
+
+@pytest.mark.parametrize("pandas_library", ["pandas-numpy", "pandas-nullable"])
+@pytest.mark.parametrize(
+    "comparison",
+    [
+        "__eq__",
+        "__ne__",
+        "__ge__",
+        "__gt__",
+        "__le__",
+        "__lt__",
+        "__add__",
+        "__sub__",
+        "__mul__",
+        "__truediv__",
+        "__floordiv__",
+        "__pow__",
+        "__mod__",
+    ],
+)
+def test_deferred_column_comparisons(pandas_library: str, comparison: str) -> None:
+    ser = integer_series_1(pandas_library)
+    other = integer_series_3(pandas_library)
+    result = getattr(getattr(ser.deferred(), comparison)(other), comparison)(2)
+    expected = getattr(getattr(ser, comparison)(other), comparison)(2)
+    pd.testing.assert_series_equal(result.column, expected.column, check_names=False)
+
+
+@pytest.mark.parametrize("pandas_library", ["pandas-numpy", "pandas-nullable"])
+def test_deferred_column_chain(pandas_library: str) -> None:
+    a = integer_series_1(pandas_library).deferred()
+    b = integer_series_3(pandas_library)
+    c = integer_series_6(pandas_library)
+    result = ~(((a * 2 + b) > c) & (a > 1) | (a == 3))
+    expected = ~(
+        ((a.column * 2 + b.column) > c.column) & (a.column > 1) | (a.column == 3)
+    )
+    pd.testing.assert_series_equal(result.column, expected, check_names=False)
+    # leaves aren't overwritten
+    pd.testing.assert_series_equal(a.column, integer_series_1(pandas_library).column)
+    quotient, remainder = a.__divmod__(b)
+    pd.testing.assert_series_equal(
+        quotient.column, a.column // b.column, check_names=False
+    )
+    pd.testing.assert_series_equal(
+        remainder.column, a.column % b.column, check_names=False
+    )
+    result = (a + pd.NA).column
+    pd.testing.assert_series_equal(result, a.column + pd.NA, check_names=False)
+
+
+@pytest.mark.parametrize("pandas_library", ["pandas-numpy", "pandas-nullable"])
+def test_deferred_column_shared_subexpressions(
+    pandas_library: str, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    module = dataframe_api_compat.pandas_standard.pandas_standard
+    evaluate_expr = module._evaluate_expr
+    calls = []
+
+    def counting_evaluate_expr(column: Any, *args: Any) -> Any:
+        calls.append(column)
+        return evaluate_expr(column, *args)
+
+    monkeypatch.setattr(module, "_evaluate_expr", counting_evaluate_expr)
+    a = integer_series_1(pandas_library).deferred()
+    x = a
+    for _ in range(16):
+        x = x + x
+    result = x.column
+    assert len(calls) == 17
+    pd.testing.assert_series_equal(result, a.column * 2**16, check_names=False)
+    y = a * 2
+    result = (y * 3 + y).column
+    pd.testing.assert_series_equal(result, a.column * 8, check_names=False)
+
+
+def test_slice_rows_no_copy() -> None:
+    df = pd.DataFrame({"a": [1, 2, 3, 4], "b": [5.0, 6.0, 7.0, 8.0]})
+    result = convert_to_standard_compliant_dataframe(df).slice_rows(1, 3, None)
+    assert isinstance(result.dataframe.index, pd.RangeIndex)
+    for column in ["a", "b"]:
+        assert np.shares_memory(
+            result.dataframe[column].to_numpy(), df[column].to_numpy()
+        )
+        ser = dataframe_api_compat.pandas_standard.PandasColumn(
+            df[column].iloc[1:3]
+        ).column
+        assert isinstance(ser.index, pd.RangeIndex)
+        assert np.shares_memory(ser.to_numpy(), df[column].to_numpy())
+
+
+def test_groupby_aggregate(library: str) -> None:
+    df = integer_dataframe_4(library)
+    result = df.groupby(["key"]).aggregate(
+        {
+            "b_sum": ("b", "sum"),
+            "b_mean": ("b", "mean"),
+            "c_min": ("c", "min"),
+            "c_max": ("c", "max"),
+            "size": ("b", "size"),
+        }
+    )
+    result = result.get_rows(result.sorted_indices(["key"]))
+    result_pd = pd.api.interchange.from_dataframe(result.dataframe)
+    result_pd["size"] = result_pd["size"].astype("int64")
+    result_pd = convert_dataframe_to_pandas_numpy(result_pd)
+    expected = pd.DataFrame(
+        {
+            "key": [1, 2],
+            "b_sum": [3, 7],
+            "b_mean": [1.5, 3.5],
+            "c_min": [4, 6],
+            "c_max": [5, 7],
+            "size": [2, 2],
+        }
+    )
+    pd.testing.assert_frame_equal(result_pd, expected)
+
+
+def test_groupby_aggregate_boolean(library: str) -> None:
+    df = bool_dataframe_2(library)
+    result = df.groupby(["key"]).aggregate({"b": ("b", "any"), "c": ("c", "all")})
+    result = result.get_rows(result.sorted_indices(["key"]))
+    result_pd = pd.api.interchange.from_dataframe(result.dataframe)
+    result_pd = convert_dataframe_to_pandas_numpy(result_pd)
+    expected = pd.DataFrame({"key": [1, 2], "b": [True, True], "c": [False, False]})
+    pd.testing.assert_frame_equal(result_pd, expected)
+
+
+def test_groupby_aggregate_invalid(library: str) -> None:
+    df = integer_dataframe_4(library)
+    with pytest.raises(TypeError, match="Expected Mapping"):
+        df.groupby(["key"]).aggregate([("b", "sum")])
+    with pytest.raises(KeyError):
+        df.groupby(["key"]).aggregate({"d": ("d", "sum")})
+    with pytest.raises(ValueError, match="Unsupported reduction: foo"):
+        df.groupby(["key"]).aggregate({"b": ("b", "foo")})
+    with pytest.raises(Exception):
+        df.groupby(["key"]).aggregate({"b": ("b", "any")}).dataframe
+
+
+def test_groupby_reused(library: str) -> None:
+    df = bool_dataframe_2(library)
+    grouped = df.groupby(["key"])
+    for aggregation, expected_b, expected_c in [
+        ("any", [True, True], [True, False]),
+        ("all", [False, True], [False, False]),
+        ("any", [True, True], [True, False]),
+    ]:
+        result = getattr(grouped, aggregation)()
+        result = result.get_rows(result.sorted_indices(["key"]))
+        result_pd = pd.api.interchange.from_dataframe(result.dataframe)
+        result_pd = convert_dataframe_to_pandas_numpy(result_pd)
+        expected = pd.DataFrame({"key": [1, 2], "b": expected_b, "c": expected_c})
+        pd.testing.assert_frame_equal(result_pd, expected)
+
+
+def test_is_null_is_nan_mixed_dtypes() -> None:
+    df = pd.DataFrame(
+        {
+            "a": pd.Series([1.0, float("nan"), 3.0], dtype="float64"),
+            "b": pd.Series([1, 2, 3], dtype="int64"),
+            "c": pd.Series([0.0, 1.0, pd.NA], dtype="Float64")
+            / pd.Series([0.0, 1.0, 1.0], dtype="Float64"),
+            "d": pd.Series([1, pd.NA, 3], dtype="Int64"),
+        }
+    )
+    df_std = convert_to_standard_compliant_dataframe(df)
+    result = df_std.is_null().dataframe
+    expected = pd.DataFrame(
+        {
+            "a": [False, False, False],
+            "b": [False, False, False],
+            "c": [False, False, True],
+            "d": [False, True, False],
+        }
+    )
+    pd.testing.assert_frame_equal(result, expected)
+    result = df_std.is_nan().dataframe
+    expected = pd.DataFrame(
+        {
+            "a": [False, True, False],
+            "b": [False, False, False],
+            "c": [True, False, False],
+            "d": [False, False, False],
+        }
+    )
+    pd.testing.assert_frame_equal(result, expected)
+
+
+def test_is_null_is_nan_wide(library: str) -> None:
+    columns = [f"col_{i}" for i in range(100)]
+    df: Any
+    if library == "polars":
+        df = pl.DataFrame({column: [1.0, float("nan")] for column in columns})
+    elif library == "pyarrow":
+        df = pa.table({column: [1.0, float("nan")] for column in columns})
+    else:
+        dtype = "Float64" if library == "pandas-nullable" else "float64"
+        # 0/0 gives NaN (rather than null) for nullable dtypes too
+        df = pd.DataFrame({column: [1.0, 0.0] for column in columns}, dtype=dtype)
+        df = df / df
+    df_std = convert_to_standard_compliant_dataframe(df)
+    result = pd.api.interchange.from_dataframe(df_std.is_nan().dataframe)
+    expected = pd.DataFrame({column: [False, True] for column in columns})
+    pd.testing.assert_frame_equal(result, expected)
+    result = pd.api.interchange.from_dataframe(df_std.is_null().dataframe)
+    expected = pd.DataFrame({column: [False, False] for column in columns})
+    pd.testing.assert_frame_equal(result, expected)
+
+
+@pytest.mark.parametrize("parallel", [True, False])
+def test_dataframe_reductions_mixed_dtypes(
+    parallel: bool, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    if parallel:
+        monkeypatch.setattr(
+            dataframe_api_compat.pandas_standard.pandas_standard,
+            "_PARALLEL_REDUCTION_MIN_SIZE",
+            0,
+        )
+        monkeypatch.setattr(os, "cpu_count", lambda: 2)
+    df = pd.DataFrame(
+        {
+            "a": pd.Series([1, 2, 3], dtype="int64"),
+            "b": pd.Series([4, 5, 6], dtype="int64"),
+            "c": pd.Series([1.5, 2.5, 3.5], dtype="float64"),
+            "d": pd.Series([4, 5, 6], dtype="int32"),
+        }
+    )
+    result = convert_to_standard_compliant_dataframe(df).max().dataframe
+    expected = pd.DataFrame(
+        {
+            "a": pd.Series([3], dtype="int64"),
+            "b": pd.Series([6], dtype="int64"),
+            "c": pd.Series([3.5], dtype="float64"),
+            "d": pd.Series([6], dtype="int32"),
+        }
+    )
+    pd.testing.assert_frame_equal(result, expected)
+
+
+def test_dataframe_reductions_interleaved_dtypes() -> None:
+    df = pd.DataFrame(
+        {
+            f"c{i}": pd.Series([i, i + 1], dtype="int64" if i % 2 else "float64")
+            for i in range(6)
+        }
+    )
+    result = convert_to_standard_compliant_dataframe(df).sum().dataframe
+    expected = pd.DataFrame(
+        {
+            f"c{i}": pd.Series([2 * i + 1], dtype="int64" if i % 2 else "float64")
+            for i in range(6)
+        }
+    )
+    pd.testing.assert_frame_equal(result, expected)
+
+
+def test_dataframe_reductions_many_dtypes(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(
+        dataframe_api_compat.pandas_standard.pandas_standard,
+        "_MAX_REDUCTION_DTYPE_GROUPS",
+        1,
+    )
+    df = pd.DataFrame(
+        {
+            "a": pd.Series([1, 2], dtype="int64"),
+            "b": pd.Series([1.5, 2.5], dtype="float64"),
+        }
+    )
+    result = convert_to_standard_compliant_dataframe(df).sum().dataframe
+    expected = pd.DataFrame({"a": [3.0], "b": [4.0]})
+    pd.testing.assert_frame_equal(result, expected)
+
+
+def test_dataframe_reductions_no_columns(library: str) -> None:
+    df = integer_dataframe_1(library).get_columns_by_name([])
+    assert df.sum().get_column_names() == []
+
+
+def test_describe(library: str) -> None:
+    df = integer_dataframe_1(library)
+    result = df.describe()
+    result_pd = pd.api.interchange.from_dataframe(result.dataframe)
+    expected = pd.DataFrame(
+        {
+            "statistic": ["min", "max", "mean", "std", "null_count", "sum"],
+            "a": [1.0, 3.0, 2.0, 1.0, 0.0, 6.0],
+            "b": [4.0, 6.0, 5.0, 1.0, 0.0, 15.0],
+        }
+    )
+    pd.testing.assert_frame_equal(result_pd, expected)
+
+
+def test_describe_with_nulls(library: str, request: pytest.FixtureRequest) -> None:
+    df = null_dataframe_1(library, request)
+    result = df.describe(["null_count", "sum", "var"])
+    result_pd = pd.api.interchange.from_dataframe(result.dataframe)
+    expected = pd.DataFrame(
+        {"statistic": ["null_count", "sum", "var"], "a": [1.0, 3.0, 0.5]}
+    )
+    pd.testing.assert_frame_equal(result_pd, expected)
+
+
+def test_describe_invalid(library: str) -> None:
+    df = integer_dataframe_1(library)
+    with pytest.raises(ValueError, match="Unsupported statistic: foo"):
+        df.describe(["foo"])
+
+
+@pytest.mark.parametrize(
+    "backend", ["pandas-numpy", "pandas-nullable", "pyarrow", "polars", "polars-lazy"]
+)
+def test_describe_non_numeric(backend: str) -> None:
+    # Like pandas, only numeric columns are described.
+    data = {"a": [1, 2, 3], "b": ["x", "y", "z"], "c": [True, False, True]}
+    if backend == "polars-lazy":
+        df = dataframe_api_compat.polars_standard.convert_to_standard_compliant_dataframe(
+            pl.DataFrame(data).lazy()
+        )
+    else:
+        df = _backend_dataframe(backend, data)
+    result = df.describe(["min", "max", "sum"])
+    result_pd = pd.api.interchange.from_dataframe(result.dataframe)
+    expected = pd.DataFrame({"statistic": ["min", "max", "sum"], "a": [1.0, 3.0, 6.0]})
+    pd.testing.assert_frame_equal(result_pd, expected)
+
+
+def test_describe_chunked(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(
+        dataframe_api_compat.pandas_standard.pandas_standard, "_DESCRIBE_CHUNK_SIZE", 7
+    )
+    values = np.random.default_rng(0).normal(1e6, 1.0, size=100)
+    values[[3, 10, 11, 12, 13, 14, 15, 16]] = np.nan
+    df = pd.DataFrame({"a": values, "b": np.full(100, np.nan)})
+    result = convert_to_standard_compliant_dataframe(df).describe(
+        ["min", "max", "mean", "std", "var", "sum"]
+    )
+    ser = pd.Series(values)
+    expected = pd.DataFrame(
+        {
+            "statistic": ["min", "max", "mean", "std", "var", "sum"],
+            "a": [ser.min(), ser.max(), ser.mean(), ser.std(), ser.var(), ser.sum()],
+            "b": [np.nan, np.nan, np.nan, np.nan, np.nan, 0.0],
+        }
+    )
+    pd.testing.assert_frame_equal(result.dataframe, expected)
+
+
+@pytest.mark.parametrize(
+    ("values", "other_values", "expected_values"),
+    [
+        ([1.0, None, 3.0], [None, 3.0, 3.0], [False, True, True]),
+        ([1.0, None, 3.0], [3.0, 4.0], [False, False, True]),
+        ([1.0, None, 3.0], [], [False, False, False]),
+        ([1.0, None, 3.0], [None], [False, True, False]),
+    ],
+)
+def test_is_in_nulls(
+    library: str,
+    values: list[Any],
+    other_values: list[Any],
+    expected_values: list[bool],
+) -> None:
+    namespace = integer_series_1(library).__column_namespace__()
+    ser = namespace.column_from_sequence(values, dtype=namespace.Float64())
+    other = namespace.column_from_sequence(other_values, dtype=namespace.Float64())
+    # call twice, the second call reuses `other`'s lookup table
+    for _ in range(2):
+        if library in ("pandas-numpy", "pandas-nullable"):
+            assert ser.is_in(other).column.dtype == "boolean"
+        result = namespace.dataframe_from_dict({"result": ser.is_in(other)})
+        result_pd = pd.api.interchange.from_dataframe(result.dataframe)["result"]
+        result_pd = convert_series_to_pandas_numpy(result_pd)
+        expected = pd.Series(expected_values, name="result")
+        pd.testing.assert_series_equal(result_pd, expected)
+
+
+def test_is_in_integers(library: str) -> None:
+    ser = integer_series_1(library)
+    other = integer_series_3(library)
+    namespace = ser.__column_namespace__()
+    if library == "pandas-numpy":
+        assert ser.is_in(other).column.dtype == "bool"
+    if library == "pandas-nullable":
+        assert ser.is_in(other).column.dtype == "boolean"
+    result = namespace.dataframe_from_dict({"result": ser.is_in(other)})
+    result_pd = pd.api.interchange.from_dataframe(result.dataframe)["result"]
+    result_pd = convert_series_to_pandas_numpy(result_pd)
+    expected = pd.Series([True, True, False], name="result")
+    pd.testing.assert_series_equal(result_pd, expected)
+
+
+@pytest.mark.parametrize(
+    ("values", "other_values", "expected_values"),
+    [
+        ([True, False, None], [True], [True, False, False]),
+        ([True, False, None], [False, None], [False, True, True]),
+        ([True, False, None], [], [False, False, False]),
+    ],
+)
+def test_is_in_booleans(
+    library: str,
+    values: list[Any],
+    other_values: list[Any],
+    expected_values: list[bool],
+) -> None:
+    namespace = integer_series_1(library).__column_namespace__()
+    ser = namespace.column_from_sequence(values, dtype=namespace.Bool())
+    other = namespace.column_from_sequence(other_values, dtype=namespace.Bool())
+    result = namespace.dataframe_from_dict({"result": ser.is_in(other)})
+    result_pd = pd.api.interchange.from_dataframe(result.dataframe)["result"]
+    result_pd = convert_series_to_pandas_numpy(result_pd)
+    expected = pd.Series(expected_values, name="result")
+    pd.testing.assert_series_equal(result_pd, expected)
+
+
+@pytest.mark.parametrize("backend", ["pandas-numpy", "pandas-nullable", "polars"])
+def test_is_in_signed_zero(backend: str) -> None:
+    # -0.0 == 0.0, so they match each other.
+    df = _backend_dataframe(backend, {"a": [0.0, -0.0, 1.0], "b": [-0.0, 2.0, 2.0]})
+    result = df.get_column_by_name("a").is_in(df.get_column_by_name("b"))
+    assert [result.get_value(i) for i in range(3)] == [True, True, False]
+
+
+def test_pyarrow_chunked() -> None:
+    namespace = dataframe_api_compat.pyarrow_standard
+    df_std = namespace.concat(
+        [
+            convert_to_standard_compliant_dataframe(
+                pa.table({"key": [1, 2, 1], "a": [-7, 7, None], "b": [2.0, 4.0, 1.0]})
+            ),
+            convert_to_standard_compliant_dataframe(
+                pa.table({"key": [2, 1, 3], "a": [2, -3, None], "b": [3.0, 8.0, 5.0]})
+            ),
+        ]
+    )
+    # concatenating just references the existing chunks
+    assert df_std.dataframe["a"].num_chunks == 2
+    a = df_std.get_column_by_name("a")
+    assert (a // -2).column.to_pylist() == [3, -4, None, -1, 1, None]
+    assert (a % -2).column.to_pylist() == [-1, -1, None, 0, -1, None]
+    assert (df_std.get_column_by_name("b") / 2).get_value(1) == 2.0
+    assert (df_std.get_column_by_name("b") // 3).column.to_pylist() == [
+        0.0,
+        1.0,
+        0.0,
+        1.0,
+        2.0,
+        1.0,
+    ]
+    result = df_std.groupby(["key"]).aggregate(
+        {"a_median": ("a", "median"), "b_median": ("b", "median")}
+    )
+    result = result.get_rows(result.sorted_indices(["key"])).dataframe
+    assert result.to_pydict() == {
+        "key": [1, 2, 3],
+        "a_median": [-5.0, 4.5, None],
+        "b_median": [2.0, 3.5, 5.0],
+    }
+
+
+def test_pyarrow_invalid_columns() -> None:
+    df = pa.Table.from_arrays([pa.array([1]), pa.array([2])], names=["a", "a"])
+    with pytest.raises(ValueError, match="Expected unique column names"):
+        convert_to_standard_compliant_dataframe(df)
+
+
+def _duckdb_df(data: dict[str, Any]) -> Any:
+    return dataframe_api_compat.duckdb_standard.convert_to_standard_compliant_dataframe(
+        duckdb.from_arrow(pa.table(data))
+    )
+
+
+def test_duckdb_concat_empty() -> None:
+    with pytest.raises(ValueError, match="Expected at least one DataFrame"):
+        dataframe_api_compat.duckdb_standard.concat([])
+
+
+def test_duckdb_positions_multithreaded() -> None:
+    # Positional operations rely on DuckDB keeping rows in insertion order, which
+    # it does with several threads too.
+    namespace = dataframe_api_compat.duckdb_standard
+    connection = duckdb.connect()
+    connection.execute("SET threads TO 4")
+    # More rows than fit in one of DuckDB's row groups, so they're split up.
+    n_rows = 300_000
+    parts = [
+        namespace.convert_to_standard_compliant_dataframe(
+            connection.from_arrow(pa.table({"x": np.arange(start, start + n_rows)}))
+        )
+        for start in (0, n_rows)
+    ]
+    df = namespace.concat(parts)
+    result = df.dataframe.fetchnumpy()["x"]
+    np.testing.assert_array_equal(result, np.arange(2 * n_rows))
+    result = df.slice_rows(1, None, 3).dataframe.fetchnumpy()["x"]
+    np.testing.assert_array_equal(result, np.arange(1, 2 * n_rows, 3))
+    indices = (df.get_column_by_name("x") % 2).sorted_indices()
+    result = df.get_rows(indices).dataframe.fetchnumpy()["x"]
+    expected = np.concatenate([np.arange(0, 2 * n_rows, 2), np.arange(1, 2 * n_rows, 2)])
+    np.testing.assert_array_equal(result, expected)
+
+
+def test_duckdb_pipeline() -> None:
+    namespace = dataframe_api_compat.duckdb_standard
+    df_std = namespace.concat(
+        [
+            _duckdb_df({"key": [1, 2, 1], "a": [-7, 7, None], "b": [2.0, 4.0, 1.0]}),
+            _duckdb_df({"key": [2, 1, 3], "a": [2, -3, 4], "b": [3.0, 8.0, 5.0]}),
+        ]
+    )
+    assert df_std.shape() == (6, 3)
+    mask = df_std.get_column_by_name("b") > 1.5
+    result = df_std.get_rows_by_mask(mask).groupby(["key"]).sum()
+    result = result.get_rows(result.sorted_indices(["key"])).dataframe
+    assert result.arrow().to_pydict() == {
+        "key": [1, 2, 3],
+        "a": [-10, 9, 4],
+        "b": [10.0, 7.0, 5.0],
+    }
+    assert result.types[1] == "BIGINT"
+    b = df_std.get_column_by_name("b")
+    assert b.get_rows(b.sorted_indices()).column.fetchall() == [
+        (1.0,),
+        (2.0,),
+        (3.0,),
+        (4.0,),
+        (5.0,),
+        (8.0,),
+    ]
+
+
+def test_duckdb_binary_ops() -> None:
+    namespace = dataframe_api_compat.duckdb_standard
+    df_std = _duckdb_df({"a": [-7, 7, 3], "b": [2.0, -4.0, float("nan")]})
+    a = df_std.get_column_by_name("a")
+    b = df_std.get_column_by_name("b")
+    assert (a // -2).column.fetchall() == [(3,), (-4,), (-2,)]
+    assert (a % -2).column.fetchall() == [(-1,), (-1,), (-1,)]
+    assert (a // b).column.fetchall()[:2] == [(-4.0,), (-2.0,)]
+    assert (a / 2).column.fetchall() == [(-3.5,), (3.5,), (1.5,)]
+    quotient, remainder = divmod(a, 2)
+    assert quotient.column.fetchall() == [(-4,), (3,), (1,)]
+    assert remainder.column.fetchall() == [(1,), (1,), (1,)]
+    assert (a**2).column.fetchall() == [(49.0,), (49.0,), (9.0,)]
+    assert ((a > 0) & (a < 5)).column.fetchall() == [(False,), (False,), (True,)]
+    assert ((a <= 0) | (a >= 5) | ~(a != 3)).column.fetchall() == [
+        (True,),
+        (True,),
+        (True,),
+    ]
+    assert ((a - a) * 1).column.fetchall() == [(0,), (0,), (0,)]
+    assert ((a == 7) & True).column.fetchall() == [(False,), (True,), (False,)]
+    assert b.fill_nan(0.0).is_nan().column.fetchall() == [(False,)] * 3
+    assert b.is_null().column.fetchall() == [(False,)] * 3
+    assert (a + 1).get_value(1) == 8
+    assert len(a) == 3
+    assert isinstance(a.dtype, namespace.Int64)
+    assert isinstance(b.dtype, namespace.Float64)
+    assert isinstance((a > 0).dtype, namespace.Bool)
+    assert a.__column_namespace__() is namespace
+    assert (a + b).column.fetchall()[:2] == [(-5.0,), (3.0,)]
+    result = df_std // -2
+    assert result.dataframe.fetchall()[:2] == [(3, -1.0), (-4, 2.0)]
+    result = df_std % -2
+    assert result.dataframe.fetchall()[:2] == [(-1, 0.0), (-1, -0.0)]
+    other = df_std.rename_columns({"a": "a"}).slice_rows(None, None, -1)
+    result = df_std - other
+    assert result.dataframe.fetchall()[0][0] == -10
+    result = df_std // other
+    assert result.dataframe.fetchall()[0][0] == -3
+    quotient, remainder = divmod(df_std, 2)
+    assert quotient.dataframe.fetchall()[0] == (-4, 1.0)
+    assert remainder.dataframe.fetchall()[0] == (1, 0.0)
+    for op in (
+        "__eq__",
+        "__ne__",
+        "__ge__",
+        "__gt__",
+        "__le__",
+        "__lt__",
+        "__add__",
+        "__mul__",
+        "__truediv__",
+        "__pow__",
+    ):
+        assert getattr(df_std, op)(1).shape() == (3, 2)
+    bools = df_std > 0
+    assert (~bools).dataframe.fetchall()[0] == (True, False)
+    assert bools.any().dataframe.fetchall() == [(True, True)]
+    assert bools.all().dataframe.fetchall() == [(False, False)]
+    assert bools.any_rowwise().column.fetchall() == [(True,), (True,), (True,)]
+    assert bools.all_rowwise().column.fetchall() == [(False,), (False,), (True,)]
+    assert df_std.is_nan().dataframe.fetchall()[2] == (False, True)
+    assert df_std.is_null().dataframe.fetchall()[2] == (False, False)
+    assert df_std.fill_nan(None).is_null().dataframe.fetchall()[2] == (False, True)
+    assert df_std.__dataframe_namespace__() is namespace
+    with pytest.raises(ValueError, match="matching columns"):
+        df_std + df_std.drop_column("a")
+    with pytest.raises(TypeError, match="Expected bool, int, float, or None"):
+        a + "foo"
+
+
+def test_duckdb_reductions() -> None:
+    df_std = _duckdb_df({"a": [1, 2, 4], "b": [1.0, 3.0, 8.0]})
+    a = df_std.get_column_by_name("a")
+    assert a.min() == 1
+    assert a.max() == 4
+    assert a.sum() == 7
+    assert a.prod() == 8
+    assert a.mean() == 7 / 3
+    assert a.median() == 2
+    assert a.std() == pytest.approx(1.5275252)
+    assert a.var() == pytest.approx(2.3333333)
+    assert (a > 1).any()
+    assert not (a > 1).all()
+    assert df_std.min().dataframe.fetchall() == [(1, 1.0)]
+    assert df_std.max().dataframe.fetchall() == [(4, 8.0)]
+    assert df_std.sum().dataframe.fetchall() == [(7, 12.0)]
+    assert df_std.prod().dataframe.fetchall() == [(8, 24.0)]
+    assert df_std.mean().dataframe.fetchall() == [(7 / 3, 4.0)]
+    assert df_std.median().dataframe.fetchall() == [(2.0, 3.0)]
+    assert df_std.std().dataframe.fetchall()[0][1] == pytest.approx(3.6055513)
+    assert df_std.var().dataframe.fetchall()[0][1] == pytest.approx(13.0)
+
+
+def test_duckdb_groupby() -> None:
+    df_std = _duckdb_df({"key": [1, 1, 2], "a": [1, 2, 4], "b": [True, False, True]})
+    groupby = df_std.groupby(["key"])
+
+    def fetch(result: Any) -> list[Any]:
+        return result.get_rows(result.sorted_indices(["key"])).dataframe.fetchall()
+
+    assert fetch(groupby.size()) == [(1, 2), (2, 1)]
+    assert fetch(df_std.drop_column("a").groupby(["key"]).any()) == [
+        (1, True),
+        (2, True),
+    ]
+    assert fetch(df_std.drop_column("a").groupby(["key"]).all()) == [
+        (1, False),
+        (2, True),
+    ]
+    numeric = df_std.drop_column("b").groupby(["key"])
+    assert fetch(numeric.min()) == [(1, 1), (2, 4)]
+    assert fetch(numeric.max()) == [(1, 2), (2, 4)]
+    assert fetch(numeric.prod()) == [(1, 2), (2, 4)]
+    assert fetch(numeric.median()) == [(1, 1.5), (2, 4.0)]
+    assert fetch(numeric.mean()) == [(1, 1.5), (2, 4.0)]
+    assert fetch(numeric.std())[0][1] == pytest.approx(0.7071068)
+    assert fetch(numeric.var())[0][1] == pytest.approx(0.5)
+    result = groupby.aggregate({"a_sum": ("a", "sum"), "n": ("a", "size")})
+    assert fetch(result) == [(1, 3, 2), (2, 4, 1)]
+    with pytest.raises(NotImplementedError, match="all dtypes are 'bool'"):
+        groupby.any()
+    with pytest.raises(NotImplementedError, match="all dtypes are 'bool'"):
+        groupby.all()
+    with pytest.raises(TypeError, match="Expected Mapping"):
+        groupby.aggregate([("a", "sum")])  # type: ignore[arg-type]
+    with pytest.raises(KeyError, match="not present"):
+        groupby.aggregate({"c": ("c", "sum")})
+    with pytest.raises(ValueError, match="Unsupported reduction"):
+        groupby.aggregate({"a": ("a", "foo")})
+    with pytest.raises(TypeError, match="Expected sequence of strings"):
+        df_std.groupby("key")
+    with pytest.raises(TypeError, match="Expected sequence of strings"):
+        df_std.groupby(1)  # type: ignore[arg-type]
+    with pytest.raises(KeyError, match="not present"):
+        df_std.groupby(["c"])
+
+
+def test_duckdb_slice_rows() -> None:
+    df_std = _duckdb_df({"a": [0, 1, 2, 3, 4, 5]})
+
+    def fetch(result: Any) -> list[int]:
+        return [row[0] for row in result.dataframe.fetchall()]
+
+    assert fetch(df_std.slice_rows(1, 4, None)) == [1, 2, 3]
+    assert fetch(df_std.slice_rows(4, 1, None)) == []
+    assert fetch(df_std.slice_rows(None, None, None)) == [0, 1, 2, 3, 4, 5]
+    assert fetch(df_std.slice_rows(1, None, 2)) == [1, 3, 5]
+    assert fetch(df_std.slice_rows(None, 5, 2)) == [0, 2, 4]
+    assert fetch(df_std.slice_rows(-2, None, None)) == [4, 5]
+    assert fetch(df_std.slice_rows(None, -4, None)) == [0, 1]
+    assert fetch(df_std.slice_rows(None, None, -2)) == [5, 3, 1]
+    assert fetch(df_std.slice_rows(4, 0, -1)) == [4, 3, 2, 1]
+
+
+def test_duckdb_columns() -> None:
+    namespace = dataframe_api_compat.duckdb_standard
+    df_std = _duckdb_df({"a": [1, 2], "b": [3, 4]})
+    a = df_std.get_column_by_name("a")
+    result = df_std.insert(1, "c", a * 2)
+    assert result.get_column_names() == ["a", "c", "b"]
+    assert result.dataframe.fetchall() == [(1, 2, 3), (2, 4, 4)]
+    assert df_std.get_columns_by_name(["b"]).dataframe.fetchall() == [(3,), (4,)]
+    assert df_std.rename_columns({"a": "c"}).get_column_names() == ["c", "b"]
+    result = namespace.dataframe_from_dict({"x": a + 1, "y": a > 1})
+    assert result.dataframe.fetchall() == [(2, False), (3, True)]
+    other = _duckdb_df({"a": [1, 2]}).get_column_by_name("a")
+    with pytest.raises(ValueError, match="same DataFrame"):
+        a + other
+    with pytest.raises(ValueError, match="same DataFrame"):
+        df_std.get_rows_by_mask(other > 1)
+    with pytest.raises(ValueError, match="same DataFrame"):
+        namespace.dataframe_from_dict({"x": a, "y": other})
+    with pytest.raises(ValueError, match="Expected matching columns"):
+        namespace.concat([df_std, df_std.drop_column("a")])
+    with pytest.raises(ValueError, match="Expected str"):
+        df_std.get_column_by_name(0)  # type: ignore[arg-type]
+    with pytest.raises(KeyError, match="not present"):
+        df_std.get_column_by_name("c")
+    with pytest.raises(TypeError, match="Expected sequence of str"):
+        df_std.get_columns_by_name("a")
+    with pytest.raises(TypeError, match="Expected str"):
+        df_std.drop_column(["a"])  # type: ignore[arg-type]
+    with pytest.raises(KeyError, match="not present"):
+        df_std.drop_column("c")
+    with pytest.raises(TypeError, match="Expected Mapping"):
+        df_std.rename_columns([("a", "c")])  # type: ignore[arg-type]
+    with pytest.raises(ValueError, match="Expected unique column names"):
+        namespace.convert_to_standard_compliant_dataframe(
+            duckdb.sql("SELECT 1 AS a, 2 AS a")
+        )
+    with pytest.raises(NotImplementedError):
+        iter(df_std)
+    with pytest.raises(NotImplementedError):
+        iter(a)
+
+
+@pytest.mark.parametrize("dtype", ["int64", "Int64"])
+def test_to_backend_pandas_to_polars(dtype: str) -> None:
+    df = pd.DataFrame(
+        {
+            "a": pd.array([1, 2, 3], dtype=dtype),
+            "b": [1.0, float("nan"), 3.0],
+            "c": [True, False, True],
+        }
+    )
+    df_std = convert_to_standard_compliant_dataframe(df)
+    result, copied = df_std.to_backend("polars")
+    expected = pl.DataFrame(
+        {"a": [1, 2, 3], "b": [1.0, float("nan"), 3.0], "c": [True, False, True]}
+    )
+    pl.testing.assert_frame_equal(result.dataframe, expected)
+    assert copied == ["c"]
+    # numeric data is shared
+    df.loc[0, "a"] = 10
+    assert result.get_column_by_name("a").get_value(0) == 10
+    assert df_std.to_backend("pandas") == (df_std, [])
+
+
+def test_to_backend_polars_to_pandas() -> None:
+    df = pl.DataFrame(
+        {
+            "a": [0, 1, 2, 3],
+            "b": [0.0, 1.0, float("nan"), None],
+            "c": [True, True, None, False],
+            "d": [False, True, False, True],
+        }
+    ).lazy()
+    df_std = dataframe_api_compat.polars_standard.convert_to_standard_compliant_dataframe(
+        df
+    ).slice_rows(1, None, None)
+    result, copied = df_std.to_backend("pandas")
+    expected = pd.DataFrame(
+        {
+            "a": [1, 2, 3],
+            "b": pd.arrays.FloatingArray(
+                np.array([1.0, np.nan, 0.0]), np.array([False, False, True])
+            ),
+            "c": pd.array([True, None, False], dtype="boolean"),
+            "d": [True, False, True],
+        }
+    )
+    pd.testing.assert_frame_equal(result.dataframe, expected)
+    assert copied == ["c", "d"]
+    assert df_std.to_backend("polars") == (df_std, [])
+
+
+def test_to_backend_polars_to_pandas_chunked() -> None:
+    df = pl.concat(
+        [pl.DataFrame({"a": [1, None]}), pl.DataFrame({"a": [3, 4]})], rechunk=False
+    )
+    df_std = convert_to_standard_compliant_dataframe(df)
+    result, copied = df_std.to_backend("pandas")
+    expected = pd.DataFrame({"a": pd.array([1, None, 3, 4], dtype="Int64")})
+    pd.testing.assert_frame_equal(result.dataframe, expected)
+    assert copied == ["a"]
+
+
+@pytest.mark.parametrize("backend", ["pandas-numpy", "polars"])
+def test_to_backend_invalid(backend: str) -> None:
+    df = integer_dataframe_1(backend)
+    with pytest.raises(ValueError, match="Unsupported backend: pyarrow"):
+        df.to_backend("pyarrow")
+
+
+class _PandasSubclass(pd.DataFrame):
+    pass
+
+
+@pytest.mark.parametrize(
+    ("df", "namespace"),
+    [
+        (pd.DataFrame({"a": [1]}), dataframe_api_compat.pandas_standard),
+        (_PandasSubclass({"a": [1]}), dataframe_api_compat.pandas_standard),
+        (pl.DataFrame({"a": [1]}), dataframe_api_compat.polars_standard),
+        (pl.LazyFrame({"a": [1]}), dataframe_api_compat.polars_standard),
+        (pa.table({"a": [1]}), dataframe_api_compat.pyarrow_standard),
+        (duckdb.sql("SELECT 1 AS a"), dataframe_api_compat.duckdb_standard),
+    ],
+)
+def test_standard_dispatch(df: Any, namespace: Any) -> None:
+    result = standard.convert_to_standard_compliant_dataframe(df)
+    assert result.__dataframe_namespace__() is namespace
+    assert result.get_column_names() == ["a"]
+
+
+def test_standard_dispatch_invalid() -> None:
+    with pytest.raises(TypeError, match="Got unexpected type"):
+        standard.convert_to_standard_compliant_dataframe({"a": [1]})
+
+
+def _imported_modules(code: str) -> set[str]:
+    # `-X importtime` reports every module imported, and how long it took.
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        capture_output=True,
+        text=True,
+        check=True,
+        cwd=os.path.dirname(os.path.abspath(__file__)),
+    )
+    return {
+        line.rsplit("|", 1)[-1].strip()
+        for line in result.stderr.splitlines()
+        if line.startswith("import time:")
+    }
+
+
+def test_import_time() -> None:
+    modules = _imported_modules("import standard, dataframe_api_compat")
+    assert not modules & {"numpy", "pandas", "polars", "pyarrow", "duckdb"}
+    modules = _imported_modules(
+        "import polars as pl, standard; "
+        "standard.convert_to_standard_compliant_dataframe(pl.DataFrame({'a': [1]}))"
+    )
+    assert "dataframe_api_compat.polars_standard.polars_standard" in modules
+    assert not modules & {"numpy", "pandas", "pyarrow", "duckdb"}
+
+
+def test_profile(library: str) -> None:
+    df = integer_dataframe_1(library)
+    original = type(df).__add__
+    with dataframe_api_compat.profiling.Profile() as profile:
+        result = (df + 1).get_column_by_name("a")
+        result.sum()
+        result.sum()
+        with pytest.raises(KeyError):
+            df.groupby(["c"])
+    assert type(df).__add__ is original
+    prefix = type(df).__name__[: -len("DataFrame")]
+    stats = json.loads(profile.to_json())
+    assert stats[f"{prefix}DataFrame.__add__"]["calls"] == 1
+    assert stats[f"{prefix}DataFrame.__add__"]["rows_in"] == 3
+    assert stats[f"{prefix}DataFrame.__add__"]["rows_out"] == 3
+    assert stats[f"{prefix}Column.sum"]["calls"] == 2
+    assert stats[f"{prefix}Column.sum"]["rows_out"] == 0
+    assert stats[f"{prefix}DataFrame.groupby"]["calls"] == 1
+    assert stats[f"{prefix}Column.sum"]["time"] > 0
+
+
+def test_profile_collapsed() -> None:
+    df = integer_dataframe_1("polars")
+    with dataframe_api_compat.profiling.Profile() as profile:
+        divmod(df.get_column_by_name("a"), 2)
+    stacks = [line.rsplit(" ", 1)[0] for line in profile.to_collapsed().splitlines()]
+    assert stacks == [
+        "PolarsColumn.__divmod__",
+        "PolarsColumn.__divmod__;PolarsColumn.__floordiv__",
+        "PolarsColumn.__divmod__;PolarsColumn.__mul__",
+        "PolarsColumn.__divmod__;PolarsColumn.__sub__",
+        "PolarsDataFrame.get_column_by_name",
+    ]
+
+
+def test_profile_lazy(tmp_path: Any) -> None:
+    # Counting rows would mean computing these, so they're skipped.
+    df = lazy_integer_dataframe_1()
+    relation = _duckdb_df({"a": [1, 2, 3]})
+    with dataframe_api_compat.profiling.Profile() as profile:
+        df.sum()
+        relation.sum()
+    assert profile.stats["PolarsDataFrame.sum"]["rows_in"] == 0
+    assert profile.stats["DuckDBDataFrame.sum"]["rows_in"] == 0
+    path = str(tmp_path / "profile.json")
+    profile.write(path)
+    with open(path) as fd:
+        assert json.load(fd)["DuckDBDataFrame.sum"]["calls"] == 1
+
+
+def test_profile_memory() -> None:
+    df = convert_to_standard_compliant_dataframe(pd.DataFrame({"a": np.arange(10_000)}))
+    with dataframe_api_compat.profiling.Profile(track_memory=True) as profile:
+        result = df + 1
+    assert profile.stats["PandasDataFrame.__add__"]["peak_bytes"] >= 80_000
+    del result
+
+
+class _Allocates:
+    def temporary(self) -> float:
+        # 8MB which are freed again before returning.
+        return float(np.ones(1_000_000).sum())
+
+    def twice(self) -> float:
+        return self.temporary() + self.temporary()
+
+
+def test_profile_memory_temporaries(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(dataframe_api_compat.profiling, "_CLASSES", [_Allocates])
+    with dataframe_api_compat.profiling.Profile(track_memory=True) as profile:
+        _Allocates().twice()
+    assert profile.stats["_Allocates.temporary"]["peak_bytes"] >= 8_000_000
+    # The caller's peak includes its callees', though they freed their memory.
+    assert profile.stats["_Allocates.twice"]["peak_bytes"] >= 8_000_000
+    assert profile.stats["_Allocates.twice"]["peak_bytes"] < 16_000_000
+
+
+def test_profile_nested() -> None:
+    with dataframe_api_compat.profiling.Profile():
+        with pytest.raises(RuntimeError, match="already active"):
+            with dataframe_api_compat.profiling.Profile():
+                pass
+
+
+def test_profile_register() -> None:
+    class Foo:
+        def bar(self) -> int:
+            return 1
+
+    with dataframe_api_compat.profiling.Profile() as profile:
+        dataframe_api_compat.profiling.register(Foo)
+        Foo().bar()
+    dataframe_api_compat.profiling._CLASSES.remove(Foo)
+    assert profile.stats["Foo.bar"]["calls"] == 1
+    assert profile.stats["Foo.bar"]["rows_out"] == 0
+
+
+def test_profile_process(tmp_path: Any) -> None:
+    path = str(tmp_path / "profile.folded")
+    write = dataframe_api_compat.profiling._profile_process(path)
+    atexit.unregister(write)
+    integer_dataframe_1("pandas-numpy").shape()
+    write()
+    with open(path) as fd:
+        assert fd.read().startswith("PandasDataFrame.shape ")
+    path = str(tmp_path / "profile.json")
+    subprocess.run(
+        [
+            sys.executable,
+            "-c",
+            "import pandas as pd, standard; "
+            "standard.convert_to_standard_compliant_dataframe("
+            "pd.DataFrame({'a': [1]})).shape()",
+        ],
+        check=True,
+        cwd=os.path.dirname(os.path.abspath(__file__)),
+        env={**os.environ, dataframe_api_compat.profiling.ENVIRONMENT_VARIABLE: path},
+    )
+    with open(path) as fd:
+        assert json.load(fd)["PandasDataFrame.shape"]["calls"] == 1
+
+
+def test_slots(library: str) -> None:
+    df = integer_dataframe_1(library)
+    for obj in (df, df.get_column_by_name("a"), df.groupby(["a"])):
+        with pytest.raises(AttributeError):
+            obj.foo = 1
+    df = _duckdb_df({"a": [1]})
+    for obj in (df, df.get_column_by_name("a"), df.groupby(["a"])):
+        with pytest.raises(AttributeError):
+            obj.foo = 1
+
+
+def test_pandas_validation_cache(monkeypatch: pytest.MonkeyPatch) -> None:
+    module = dataframe_api_compat.pandas_standard.pandas_standard
+    monkeypatch.setattr(module, "_VALIDATED_COLUMNS", {})
+    monkeypatch.setattr(module, "_DEFAULT_INDEXES", {})
+    monkeypatch.setattr(module, "_CACHE_MAX_SIZE", 2)
+    df = pd.DataFrame({"a": [1, 2]})
+    convert_to_standard_compliant_dataframe(df)
+    assert module._VALIDATED_COLUMNS == {id(df.columns): df.columns}
+    assert module._DEFAULT_INDEXES == {id(df.index): df.index}
+    # reuses the cached results
+    result = convert_to_standard_compliant_dataframe(df) + 1
+    assert result.dataframe.columns is df.columns
+    assert len(module._VALIDATED_COLUMNS) == 1
+    for columns in (["b"], ["c"]):
+        convert_to_standard_compliant_dataframe(
+            pd.DataFrame({col: [1] for col in columns})
+        )
+    assert len(module._VALIDATED_COLUMNS) == 1
+    # non-default indexes aren't cached
+    df = pd.DataFrame({"a": [1, 2]}, index=[1, 0])
+    result = convert_to_standard_compliant_dataframe(df)
+    assert id(df.index) not in module._DEFAULT_INDEXES
+    assert result.dataframe.index.equals(pd.RangeIndex(2))
+    with pytest.raises(ValueError, match="Expected unique column names"):
+        convert_to_standard_compliant_dataframe(
+            pd.DataFrame([[1, 2]], columns=["a", "a"])
+        )
+
+
+def _backend_dataframe(backend: str, data: dict[str, list[Any]] | None = None) -> Any:
+    if data is None:
+        # Sorted by "a", then "b".
+        data = {
+            "a": [1, 1, 2, 3, 3],
+            "b": [2, 3, 1, 1, 1],
+            "c": [4.5, 1.0, 2.0, 8.0, 3.0],
+        }
+    if backend == "pandas-numpy":
+        return convert_to_standard_compliant_dataframe(pd.DataFrame(data))
+    if backend == "pandas-nullable":
+        return convert_to_standard_compliant_dataframe(
+            pd.DataFrame(data).convert_dtypes()
+        )
+    if backend == "pyarrow":
+        return convert_to_standard_compliant_dataframe(pa.table(data))
+    return convert_to_standard_compliant_dataframe(pl.DataFrame(data))
+
+
+@pytest.mark.parametrize("backend", ["pandas-numpy", "pandas-nullable", "polars"])
+def test_sorted_indices_presorted(backend: str) -> None:
+    df = _backend_dataframe(backend)
+    assert df.sorted_indices(["a", "b"]).column.to_list() == [0, 1, 2, 3, 4]
+    assert df._sorted_by == ("a", "b")
+    assert df.sorted_indices(["a"]).column.to_list() == [0, 1, 2, 3, 4]
+    assert df.sorted_indices(["a", "c"]).column.to_list() == [1, 0, 2, 4, 3]
+    assert df.sorted_indices(["c"]).column.to_list() == [1, 2, 4, 0, 3]
+    assert df._sorted_by == ("a", "b")
+    column = df.get_column_by_name("a")
+    assert column.sorted_indices().column.to_list() == [0, 1, 2, 3, 4]
+    assert column.unique_indices().column.to_list() == [0, 2, 3]
+    column = df.get_column_by_name("c")
+    assert column.sorted_indices().column.to_list() == [1, 2, 4, 0, 3]
+    assert sorted(column.unique_indices().column.to_list()) == [0, 1, 2, 3, 4]
+    empty = df.slice_rows(0, 0, None).get_column_by_name("a")
+    assert empty.unique_indices().column.to_list() == []
+    # Keys with missing values are never considered sorted.
+    df = _backend_dataframe(backend, {"a": [1, 1, 2], "d": [None, 1.0, 2.0]})
+    assert len(df.sorted_indices(["a", "d"])) == 3
+    assert len(df.sorted_indices(["d"])) == 3
+    assert df._sorted_by == ()
+
+
+@pytest.mark.parametrize("backend", ["pandas-numpy", "pandas-nullable", "polars"])
+def test_set_sorted(backend: str) -> None:
+    df = _backend_dataframe(backend)
+    # It's not checked, so the indices are wrong if the data isn't actually sorted.
+    df = df.set_sorted(["c"])
+    assert df.sorted_indices(["c"]).column.to_list() == [0, 1, 2, 3, 4]
+    column = df.get_column_by_name("c")
+    assert column.sorted_indices().column.to_list() == [0, 1, 2, 3, 4]
+    column = df.get_column_by_name("b").set_sorted()
+    assert column.unique_indices().column.to_list() == [0, 1, 2]
+    with pytest.raises(TypeError, match="Expected sequence of strings"):
+        df.set_sorted("a")
+    with pytest.raises(KeyError, match="key d not present"):
+        df.set_sorted(["d"])
+
+
+@pytest.mark.parametrize("backend", ["pandas-numpy", "pandas-nullable", "polars"])
+def test_sorted_propagation(backend: str) -> None:
+    df = _backend_dataframe(backend).set_sorted(["a", "b"])
+    namespace = df.__dataframe_namespace__()
+    assert df.slice_rows(1, None, None)._sorted_by == ("a", "b")
+    assert df.slice_rows(1, 4, 2)._sorted_by == ("a", "b")
+    assert df.slice_rows(None, None, -1)._sorted_by == ()
+    mask = df.get_column_by_name("c") > 2
+    assert df.get_rows_by_mask(mask)._sorted_by == ("a", "b")
+    assert df.get_rows(df.sorted_indices(["c"]))._sorted_by == ()
+    shards = [
+        df.slice_rows(0, 2, None),
+        df.slice_rows(2, 2, None),
+        df.slice_rows(2, None, None),
+    ]
+    assert namespace.concat(shards)._sorted_by == ("a", "b")
+    shards = [df.slice_rows(0, 4, None), df.slice_rows(3, None, None).set_sorted(["a"])]
+    assert namespace.concat(shards)._sorted_by == ("a",)
+    shards = [df.slice_rows(2, None, None), df.slice_rows(0, 2, None)]
+    assert namespace.concat(shards)._sorted_by == ()
+
+
+@pytest.mark.parametrize("backend", ["pandas-numpy", "pandas-nullable"])
+@pytest.mark.parametrize(
+    "reduction",
+    ["size", "any", "all", "min", "max", "sum", "prod", "mean", "median"],
+)
+def test_pandas_groupby_sorted(
+    backend: str, reduction: str, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    module = dataframe_api_compat.pandas_standard.pandas_standard
+    monkeypatch.setattr(module, "_SEGMENT_REDUCTION_MIN_ROWS", 1)
+    if reduction in ("any", "all"):
+        data: dict[str, list[Any]] = {
+            "a": [1, 1, 2, 3, 3],
+            "b": [2, 3, 1, 1, 1],
+            "c": [True, False, False, True, True],
+            "e": [True, True, False, False, True],
+        }
+    else:
+        data = {
+            "a": [1, 1, 2, 3, 3],
+            "b": [2, 3, 1, 1, 1],
+            "c": [4.5, 1.0, 2.0, 8.0, 3.0],
+            "e": [1, 2, 3, 4, 5],
+        }
+    df = _backend_dataframe(backend, data)
+    for keys in (["a"], ["a", "b"]):
+        groupby = df.get_columns_by_name([*keys, "c", "e"]).groupby(keys)
+        assert groupby._sorted
+        expected = module.PandasGroupBy(groupby.df, keys)
+        for name in (reduction, "size"):
+            pd.testing.assert_frame_equal(
+                getattr(groupby, name)().dataframe, getattr(expected, name)().dataframe
+            )
+    assert not df.groupby(["c"])._sorted
+    # pandas skips missing values, so it does the reduction.
+    df = _backend_dataframe(backend, {"a": [1, 1, 2], "d": [None, 1.0, 2.0]})
+    result = df.groupby(["a"]).sum()
+    assert result.dataframe["d"].to_list() == [1.0, 2.0]
+    monkeypatch.setattr(module, "_SEGMENT_REDUCTION_MIN_ROWS", 10)
+    assert not _backend_dataframe(backend).groupby(["a"])._sorted
+
+
+@pytest.mark.parametrize("backend", ["pandas-numpy", "pandas-nullable"])
+def test_pandas_groupby_sorted_sum_exact(
+    backend: str, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    # pandas compensates for rounding errors when summing floats, so it does that.
+    module = dataframe_api_compat.pandas_standard.pandas_standard
+    monkeypatch.setattr(module, "_SEGMENT_REDUCTION_MIN_ROWS", 1)
+    data = {"a": [1] * 10 + [2] * 3, "b": [0.1] * 10 + [1e16, 1.0, 1.0]}
+    df = _backend_dataframe(backend, data)
+    for reduction in ("sum", "mean"):
+        groupby = df.groupby(["a"])
+        expected = getattr(module.PandasGroupBy(groupby.df, ["a"]), reduction)()
+        result = getattr(groupby, reduction)().dataframe
+        pd.testing.assert_frame_equal(result, expected.dataframe, check_exact=True)
+        assert groupby._starts is None
+    # Integers and booleans are summed exactly.
+    data = {"a": [1, 1, 2], "b": [2**62, 2**62 - 1, 3], "c": [True, True, False]}
+    groupby = _backend_dataframe(backend, data).groupby(["a"])
+    expected = module.PandasGroupBy(groupby.df, ["a"]).sum().dataframe
+    pd.testing.assert_frame_equal(groupby.sum().dataframe, expected, check_exact=True)
+    assert groupby._starts is not None
+
+
+def test_polars_sorted_lazy_and_groupby() -> None:
+    df = _backend_dataframe("polars")
+    groupby = df.groupby(["a"])
+    assert groupby.df["a"].flags["SORTED_ASC"]
+    result = groupby.sum()
+    assert result.dataframe.sort("a")["c"].to_list() == [5.5, 2.0, 11.0]
+    assert not df.groupby(["c"]).df["c"].flags["SORTED_ASC"]
+    # Checking a LazyFrame would mean computing it, so that needs `set_sorted`.
+    df = lazy_integer_dataframe_1()
+    assert df.sorted_indices(["a"]).column.to_list() == [0, 1, 2]
+    assert df._sorted_by == ()
+    df = df.set_sorted(["a"])
+    assert df.sorted_indices(["a"]).column.to_list() == [0, 1, 2]
+    assert df.groupby(["a"]).sum().collect().dataframe["b"].to_list() == [4, 5, 6]
+    namespace = df.__dataframe_namespace__()
+    assert namespace.concat([df, df])._sorted_by == ()
+
+
+def test_polars_sorted_flag_with_nan() -> None:
+    # polars flags floats as sorted with NaN at the end, but NaN counts as missing.
+    df = pl.DataFrame({"a": [3.0, float("nan"), 1.0]}).sort("a")
+    assert df["a"].flags["SORTED_ASC"]
+    df = dataframe_api_compat.polars_standard.convert_to_standard_compliant_dataframe(df)
+    result = df.sorted_indices(["a"], nulls_position="first")
+    assert result.column.to_list() == [2, 0, 1]
+    assert df._sorted_by == ()
+    assert df.bottom_k_indices(["a"], 2).column.to_list() == [0, 1]
+    column = df.get_column_by_name("a")
+    assert not column._is_sorted()
+    assert column.bottom_k_indices(2).column.to_list() == [0, 1]
+    assert sorted(column.unique_indices().column.to_list()) == [0, 1, 2]
+
+
+@pytest.mark.parametrize("backend", ["pandas-numpy", "pandas-nullable", "polars"])
+def test_top_k_indices(backend: str) -> None:
+    data = {
+        "a": [3, None, 5, 1, 5, 2],
+        "b": [1, 2, 3, 4, 0, 1],
+        "c": [0.5, float("nan"), 1.5, 1.0, 2.5, 0.0],
+    }
+    df = _backend_dataframe(backend, data)
+    assert df.top_k_indices(["a"], 3).column.to_list() == [2, 4, 0]
+    assert df.top_k_indices(["a", "b"], 2).column.to_list() == [2, 4]
+    assert df.bottom_k_indices(["a"], 3).column.to_list() == [3, 5, 0]
+    assert df.bottom_k_indices(["a", "b"], 4).column.to_list() == [3, 5, 0, 4]
+    # Missing values come last.
+    assert df.top_k_indices(["a"], 6).column.to_list() == [2, 4, 0, 5, 3, 1]
+    assert df.bottom_k_indices(["a"], 7).column.to_list() == [3, 5, 0, 2, 4, 1]
+    assert df.top_k_indices(["c"], 2).column.to_list() == [4, 2]
+    assert df.bottom_k_indices(["c"], 6).column.to_list() == [5, 0, 3, 2, 4, 1]
+    assert df.top_k_indices(["a"], 0).column.to_list() == []
+    column = df.get_column_by_name("b")
+    assert column.top_k_indices(4).column.to_list() == [3, 2, 1, 0]
+    assert column.bottom_k_indices(3).column.to_list() == [4, 0, 5]
+    column = df.get_column_by_name("c")
+    assert column.top_k_indices(2).column.to_list() == [4, 2]
+    # Sorted data doesn't need looking at.
+    df = df.set_sorted(["b"])
+    assert df.bottom_k_indices(["b"], 2).column.to_list() == [0, 1]
+    column = df.get_column_by_name("a").set_sorted()
+    assert column.bottom_k_indices(10).column.to_list() == [0, 1, 2, 3, 4, 5]
+    with pytest.raises(TypeError, match="Expected sequence of strings"):
+        df.top_k_indices("a", 1)
+    with pytest.raises(TypeError, match="Expected sequence of strings"):
+        df.bottom_k_indices("a", 1)
+    with pytest.raises(ValueError, match="Expected non-negative integer"):
+        df.top_k_indices(["a"], -1)
+
+
+def test_polars_top_k_indices_lazy() -> None:
+    df = lazy_integer_dataframe_1()
+    assert df.top_k_indices(["b"], 2).column.to_list() == [2, 1]
+    assert df.set_sorted(["a"]).bottom_k_indices(["a"], 2).column.to_list() == [0, 1]
+
+
+@pytest.mark.parametrize(
+    "backend", ["pandas-numpy", "pandas-nullable", "polars", "pyarrow"]
+)
+def test_sorted_indices_order(backend: str) -> None:
+    data = {
+        "a": [2, None, 1, 2, 1],
+        "b": [1.0, 3.0, 2.5, 0.5, 2.0],
+        "c": [3, None, 1, 2, 5],
+    }
+    df = _backend_dataframe(backend, data)
+
+    def indices(column: Any) -> list[int]:
+        return (
+            column.column.to_pylist() if backend == "pyarrow" else column.column.to_list()
+        )
+
+    result = df.sorted_indices(["a", "b"], ascending=[True, False])
+    assert indices(result) == [2, 4, 0, 3, 1]
+    result = df.sorted_indices(
+        ["a", "b"], ascending=[True, False], nulls_position="first"
+    )
+    assert indices(result) == [1, 2, 4, 0, 3]
+    result = df.sorted_indices(["a", "b"], ascending=False)
+    assert indices(result) == [0, 3, 2, 4, 1]
+    result = df.sorted_indices(["a", "b"], ascending=False, nulls_position="first")
+    assert indices(result) == [1, 0, 3, 2, 4]
+    column = df.get_column_by_name("c")
+    assert indices(column.sorted_indices()) == [2, 3, 0, 4, 1]
+    result = column.sorted_indices(ascending=False, nulls_position="first")
+    assert indices(result) == [1, 4, 0, 3, 2]
+    assert indices(column.sorted_indices(ascending=False)) == [4, 0, 3, 2, 1]
+    with pytest.raises(ValueError, match="Expected 2 values for `ascending`, got 1"):
+        df.sorted_indices(["a", "b"], ascending=[True])
+    with pytest.raises(ValueError, match="Expected 'first' or 'last', got: middle"):
+        df.sorted_indices(["a"], nulls_position="middle")
+    with pytest.raises(ValueError, match="Expected 'first' or 'last', got: middle"):
+        column.sorted_indices(nulls_position="middle")
+
+
+def test_duckdb_sorted_indices_order() -> None:
+    df = _duckdb_df({"a": [2, None, 1, 2, 1], "b": [1.0, 3.0, 2.5, 0.5, 2.0]})
+    result = df.sorted_indices(
+        ["a", "b"], ascending=[True, False], nulls_position="first"
+    )
+    assert result.column.fetchall() == [(1,), (2,), (4,), (0,), (3,)]
+    with pytest.raises(ValueError, match="Expected 2 values for `ascending`, got 1"):
+        df.sorted_indices(["a", "b"], ascending=[True])
+    with pytest.raises(ValueError, match="Expected 'first' or 'last', got: middle"):
+        df.sorted_indices(["a"], nulls_position="middle")
+
+
+def test_pandas_sorted_indices_many_keys() -> None:
+    # Ten keys with about 100 distinct values each have more combinations than fit
+    # in 64 bits, so their ranks get re-ranked along the way.
+    rng = np.random.default_rng(0)
+    keys = [f"k{i}" for i in range(10)]
+    data = {key: rng.integers(0, 2**20, 100) for key in keys}
+    df = convert_to_standard_compliant_dataframe(pd.DataFrame(data))
+    ascending = [i % 2 == 0 for i in range(10)]
+    result = df.sorted_indices(keys, ascending=ascending)
+    expected = pd.DataFrame(data).sort_values(keys, ascending=ascending)
+    assert result.column.to_list() == expected.index.to_list()
+
+
+def _rows(df: Any) -> list[tuple[Any, ...]]:
+    native = df.dataframe
+    if isinstance(native, pl.LazyFrame):
+        native = native.collect()
+    if isinstance(native, pl.DataFrame):
+        native = native.to_pandas()
+    native = native.astype(object).where(native.notna(), None)
+    # In order, with missing values last.
+    return sorted(
+        native.itertuples(index=False, name=None),
+        key=lambda row: [(value is None, value or 0) for value in row],
+    )
+
+
+@pytest.mark.parametrize("backend", ["pandas-numpy", "pandas-nullable", "polars"])
+def test_join(backend: str) -> None:
+    left = _backend_dataframe(backend, {"k": [1, 2, 3, 4], "x": [1.0, 2.0, 3.0, 4.0]})
+    right = _backend_dataframe(backend, {"kk": [2, 1, 5, 2], "y": [10, 20, 40, 50]})
+    inner = [(1, 1.0, 20), (2, 2.0, 10), (2, 2.0, 50)]
+    result = left.join(right, ["k"], ["kk"])
+    assert result.get_column_names() == ["k", "x", "y"]
+    assert _rows(result) == inner
+    result = left.join(right, ["k"], ["kk"], how="left")
+    assert _rows(result) == [*inner, (3, 3.0, None), (4, 4.0, None)]
+    result = left.join(right.rename_columns({"kk": "k"}), ["k"], ["k"], how="outer")
+    assert result.get_column_names() == ["k", "x", "y"]
+    assert _rows(result) == [*inner, (3, 3.0, None), (4, 4.0, None), (5, None, 40)]
+    right = _backend_dataframe(backend, {"kk": [2, 1], "xx": [2.0, 3.0], "y": [1, 2]})
+    result = left.join(right, ["k", "x"], ["kk", "xx"])
+    assert _rows(result) == [(2, 2.0, 1)]
+
+
+@pytest.mark.parametrize("backend", ["pandas-numpy", "polars"])
+def test_join_sorted(backend: str) -> None:
+    left = _backend_dataframe(backend, {"k": [1, 2, 3], "x": [1.0, 2.0, 3.0]})
+    right = _backend_dataframe(backend, {"k": [3, 1], "y": [1, 2]})
+    left = left.set_sorted(["k"])
+    assert left.join(right, ["k"], ["k"], how="left")._sorted_by == ("k",)
+    assert left.join(right, ["k"], ["k"], how="outer")._sorted_by == ()
+
+
+@pytest.mark.parametrize("backend", ["pandas-numpy", "polars"])
+def test_join_inner_interleaved_keys(backend: str) -> None:
+    # The rows of an inner join can come out grouped by key, so no longer sorted.
+    left = _backend_dataframe(backend, {"t": [1, 2, 3, 4], "k": [2, 1, 2, 1]})
+    right = _backend_dataframe(backend, {"k": [1, 2], "y": [10, 20]})
+    result = left.set_sorted(["t"]).join(right, ["k"], ["k"])
+    assert result._sorted_by == ()
+    times = result.get_column_by_name("t")
+    sorted_times = times.get_rows(result.sorted_indices(["t"]))
+    assert [sorted_times.get_value(i) for i in range(4)] == [1, 2, 3, 4]
+
+
+@pytest.mark.parametrize("backend", ["pandas-numpy", "polars"])
+def test_join_invalid(backend: str) -> None:
+    left = _backend_dataframe(backend, {"k": [1, 2], "x": [1.0, 2.0]})
+    right = _backend_dataframe(backend, {"k": [1, 2], "x": [3.0, 4.0], "y": [1, 2]})
+    with pytest.raises(TypeError, match="Expected P.*DataFrame, got: "):
+        left.join(right.dataframe, ["k"], ["k"])
+    with pytest.raises(ValueError, match="Unsupported join type: cross"):
+        left.join(right, ["k"], ["k"], how="cross")
+    with pytest.raises(TypeError, match="Expected sequence of strings, got: str"):
+        left.join(right, "k", "k")
+    with pytest.raises(ValueError, match="got 2 and 1"):
+        left.join(right, ["k"], ["k", "y"])
+    with pytest.raises(ValueError, match="Expected at least one key to join on"):
+        left.join(right, [], [])
+    with pytest.raises(KeyError, match="key y not present in DataFrame's columns"):
+        left.join(right, ["y"], ["k"])
+    with pytest.raises(KeyError, match="key z not present in other DataFrame's columns"):
+        left.join(right, ["k"], ["z"])
+    with pytest.raises(ValueError, match="Key x has dtype .*, but k has dtype "):
+        left.join(right, ["k"], ["x"])
+    with pytest.raises(ValueError, match="got x in both DataFrames"):
+        left.join(right, ["k"], ["k"])
+
+
+def test_polars_join_lazy() -> None:
+    namespace = dataframe_api_compat.polars_standard
+    left = namespace.convert_to_standard_compliant_dataframe(
+        pl.DataFrame({"k": [1, 2], "x": [1, 2]})
+    )
+    right = namespace.convert_to_standard_compliant_dataframe(
+        pl.LazyFrame({"k": [2, 3], "y": [3, 4]})
+    )
+    result = left.join(right, ["k"], ["k"])
+    assert isinstance(result.dataframe, pl.LazyFrame)
+    assert _rows(result) == [(2, 2, 3)]
+
+
+@pytest.mark.parametrize("backend", ["pandas-numpy", "pandas-nullable", "polars"])
+def test_join_asof(backend: str) -> None:
+    left = _backend_dataframe(backend, {"t": [1, 5, 10], "x": [1, 2, 3], "g": [1, 2, 2]})
+    right = _backend_dataframe(
+        backend, {"tt": [2, 4, 9], "y": [10, 20, 30], "gg": [1, 1, 2]}
+    )
+    result = left.join_asof(right, "t", "tt")
+    assert result.get_column_names() == ["t", "x", "g", "y", "gg"]
+    assert _rows(result) == [(1, 1, 1, None, None), (5, 2, 2, 20, 1), (10, 3, 2, 30, 2)]
+    result = left.join_asof(right, "t", "tt", direction="forward")
+    assert _rows(result) == [(1, 1, 1, 10, 1), (5, 2, 2, 30, 2), (10, 3, 2, None, None)]
+    result = left.join_asof(right, "t", "tt", direction="nearest")
+    assert _rows(result) == [(1, 1, 1, 10, 1), (5, 2, 2, 20, 1), (10, 3, 2, 30, 2)]
+    result = left.join_asof(right, "t", "tt", left_by=["g"], right_by=["gg"])
+    assert result.get_column_names() == ["t", "x", "g", "y"]
+    assert _rows(result) == [(1, 1, 1, None), (5, 2, 2, None), (10, 3, 2, 30)]
+    assert result._sorted_by == ("t",)
+    if backend == "pandas-nullable":
+        assert result.dataframe["t"].dtype == "Int64"
+
+
+def test_pandas_join_asof_mixed_dtypes() -> None:
+    left = _backend_dataframe("pandas-numpy", {"t": [1, 5], "x": [1, 2]})
+    right = _backend_dataframe("pandas-nullable", {"t": [2, 4], "y": [10, 20]})
+    result = left.join_asof(right, "t", "t")
+    assert _rows(result) == [(1, 1, None), (5, 2, 20)]
+
+
+@pytest.mark.parametrize("backend", ["pandas-numpy", "polars"])
+def test_join_asof_invalid(backend: str) -> None:
+    left = _backend_dataframe(backend, {"t": [1, 5, 10], "g": [1, 2, 2]})
+    right = _backend_dataframe(backend, {"t": [2, 4, 9], "y": [1.0, 2.0, 3.0]})
+    unsorted = _backend_dataframe(backend, {"t": [9, 2, 4], "y": [1.0, 2.0, 3.0]})
+    with pytest.raises(TypeError, match="Expected P.*DataFrame, got: "):
+        left.join_asof(right.dataframe, "t", "t")
+    with pytest.raises(ValueError, match="Unsupported direction: sideways"):
+        left.join_asof(right, "t", "t", direction="sideways")
+    with pytest.raises(TypeError, match="Expected str, got: "):
+        left.join_asof(right, ["t"], "t")
+    with pytest.raises(TypeError, match="Expected sequence of strings, got: str"):
+        left.join_asof(right, "t", "t", left_by="g", right_by="y")
+    with pytest.raises(ValueError, match="got 0 and 1"):
+        left.join_asof(right, "t", "t", left_by=["g"])
+    with pytest.raises(ValueError, match="Key y has dtype .*, but g has dtype "):
+        left.join_asof(right, "t", "t", left_by=["g"], right_by=["y"])
+    with pytest.raises(ValueError, match="Expected DataFrame sorted by t"):
+        unsorted.join_asof(right.rename_columns({"y": "z"}), "t", "t")
+    with pytest.raises(ValueError, match="Expected other DataFrame sorted by t"):
+        left.join_asof(unsorted, "t", "t")
+
+
+def test_polars_join_asof_lazy() -> None:
+    namespace = dataframe_api_compat.polars_standard
+    left = namespace.convert_to_standard_compliant_dataframe(
+        pl.DataFrame({"t": [1, 5], "x": [1, 2]})
+    )
+    right = namespace.convert_to_standard_compliant_dataframe(
+        pl.LazyFrame({"t": [2, 4], "y": [3, 4]})
+    )
+    result = left.join_asof(right, "t", "t")
+    assert isinstance(result.dataframe, pl.LazyFrame)
+    assert _rows(result) == [(1, 1, None), (5, 2, 4)]
+    assert _rows(left.join_asof(right.set_sorted(["t"]), "t", "t")) == _rows(result)
+    unsorted = namespace.convert_to_standard_compliant_dataframe(
+        pl.LazyFrame({"t": [4, 2], "y": [3, 4]})
+    )
+    with pytest.raises(ValueError, match="Expected other DataFrame sorted by t"):
+        left.join_asof(unsorted, "t", "t")
+
+
+@pytest.mark.parametrize("backend", ["pandas-numpy", "polars"])
+def test_join_asof_datetime(backend: str) -> None:
+    ticks = pd.to_datetime(["2023-01-02 09:30", "2023-01-02 10:15"])
+    updates = pd.to_datetime(["2023-01-02 09:00", "2023-01-02 10:00"])
+    if backend == "polars":
+        ticks, updates = pl.Series(ticks), pl.Series(updates)
+    left = _backend_dataframe(backend, {"time": ticks, "price": [1.5, 2.5]})
+    right = _backend_dataframe(backend, {"time": updates, "rate": [0.1, 0.2]})
+    result = left.join_asof(right, "time", "time")
+    assert result.get_column_by_name("rate").get_value(1) == 0.2
+    with pytest.raises(ValueError, match="Key time has dtype .*, but price has dtype "):
+        left.join_asof(right, "price", "time")
+
+
+@pytest.mark.parametrize(
+    ("ascending", "nulls_position", "expected"),
+    [
+        ([False, True], "last", [4, 3, 1, 2, 0, 5]),
+        ([False, True], "first", [5, 2, 0, 4, 1, 3]),
+        ([True, True], "last", [3, 1, 4, 2, 0, 5]),
+        ([True, True], "first", [5, 2, 0, 1, 3, 4]),
+        ([True, False], "last", [3, 1, 4, 0, 2, 5]),
+        ([True, False], "first", [5, 0, 2, 1, 3, 4]),
+    ],
+)
+@pytest.mark.parametrize("backend", ["pandas-numpy", "polars"])
+def test_sorted_indices_nulls_in_several_keys(
+    backend: str, ascending: list[bool], nulls_position: str, expected: list[int]
+) -> None:
+    # Rows with a missing first key are still ordered by the second one, and NaN
+    # counts as missing.
+    data = {
+        "a": [None, 1.0, None, 1.0, 2.0, None],
+        "b": [2.0, None, 0.0, 3.0, None, float("nan")],
+    }
+    if backend == "polars":
+        df = convert_to_standard_compliant_dataframe(
+            pl.DataFrame(data, nan_to_null=False)
+        )
+    else:
+        df = _backend_dataframe(backend, data)
+    for _ in range(5):
+        result = df.sorted_indices(
+            ["a", "b"], ascending=ascending, nulls_position=nulls_position
+        )
+        assert result.column.to_list() == expected
+
+
+@pytest.mark.parametrize("backend", ["pandas-numpy", "polars"])
+def test_k_indices_nulls_in_several_keys(backend: str) -> None:
+    # Like the first `k` sorted indices, with missing values (null or NaN) last
+    # and ties in their original order.
+    data = {
+        "a": [None, 1.0, None, 1.0, 2.0, None, 1.0, float("nan")],
+        "b": [2.0, None, 0.0, 3.0, None, float("nan"), None, 1.0],
+    }
+    if backend == "polars":
+        df = convert_to_standard_compliant_dataframe(
+            pl.DataFrame(data, nan_to_null=False)
+        )
+    else:
+        df = _backend_dataframe(backend, data)
+    for k in range(9):
+        result = df.top_k_indices(["a", "b"], k).column.to_list()
+        expected = df.sorted_indices(["a", "b"], ascending=False).column.to_list()
+        assert result == expected[:k]
+        result = df.bottom_k_indices(["a", "b"], k).column.to_list()
+        assert result == df.sorted_indices(["a", "b"]).column.to_list()[:k]
+
+
+def test_polars_sort_by_native() -> None:
+    # Keys without missing values are sorted by natively, without extra keys.
+    module = dataframe_api_compat.polars_standard.polars_standard
+    df = pl.DataFrame({"a": [2, 1, 2, 1], "b": [None, 1, 0, None], "c": [1.0, 0.0] * 2})
+    assert module._sort_by(df, ["a"], [True], True)[1] == [True]
+    assert module._sort_by(df, ["c"], [False], True)[1] == [False]
+    assert module._sort_by(df, ["b"], [False], False)[1] == [False]
+    assert module._sort_by(df, ["b"], [False], True)[1] == [False, False, False]
+    assert module._sort_by(df, ["b"], [True], False)[1] == [True, True, False]
+    assert module._sort_by(df, ["a", "c"], [True, False], True)[1] == [
+        True,
+        False,
+        False,
+    ]
+    lazy = module._sort_by(df.lazy(), ["c"], [False], True)[1]
+    assert lazy == [False, False, False]
+    df = dataframe_api_compat.polars_standard.convert_to_standard_compliant_dataframe(df)
+    assert df.sorted_indices(["a"], ascending=False).column.to_list() == [0, 2, 1, 3]
+    result = df.sorted_indices(["b"], nulls_position="first")
+    assert result.column.to_list() == [0, 3, 2, 1]
+
+
+@pytest.mark.parametrize("ascending", [True, False])
+@pytest.mark.parametrize("nulls_position", ["first", "last"])
+def test_polars_column_sorted_indices_nan(ascending: bool, nulls_position: str) -> None:
+    # NaN counts as missing, like in `DataFrame.sorted_indices`.
+    df = dataframe_api_compat.polars_standard.convert_to_standard_compliant_dataframe(
+        pl.DataFrame({"a": [1.0, float("nan"), 3.0, None]}, nan_to_null=False)
+    )
+    result = df.get_column_by_name("a").sorted_indices(
+        ascending=ascending, nulls_position=nulls_position
+    )
+    expected = df.sorted_indices(
+        ["a"], ascending=ascending, nulls_position=nulls_position
+    )
+    assert result.column.to_list() == expected.column.to_list()
+    if not ascending and nulls_position == "first":
+        assert result.column.to_list() == [1, 3, 2, 0]